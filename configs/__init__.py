@@ -4,6 +4,6 @@ from configs.test_data import test_data, TestData
 __all__ = [
     'config',
     'TestConfig',
-    'test_data'
+    'test_data',
     'TestData'
 ]
\ No newline at end of file
@@ -5,9 +5,11 @@ environment variables and provides a centralized configuration object
 """
 
 import os
+import uuid
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
+from utils.workers import worker_index, worker_database_url
 
 load_dotenv('.env.test')
 
@@ -28,16 +30,97 @@ class TestConfig:
         self.viewport_width = int(os.getenv('VIEWPORT_WIDTH', '1920'))
         self.viewport_height = int(os.getenv('VIEWPORT_HEIGHT', '1080'))
         self.default_timeout = int(os.getenv('DEFAULT_TIMEOUT', '30000'))
-        self.screenshot_on_failure = os.getenv('SCREENSHOT_ON_FAILURE', 'true').lower == 'true'
+        self.page_load_state = os.getenv('PAGE_LOAD_STATE', 'load')
+        self.screenshot_on_failure = os.getenv('SCREENSHOT_ON_FAILURE', 'true').lower() == 'true'
+        self.trace_on_failure = os.getenv('TRACE_ON_FAILURE', 'false').lower() == 'true'
+        self.context_pool_size = int(os.getenv('CONTEXT_POOL_SIZE', '0'))
+        # Network/CPU throttling profile, e.g. 3g, slow-4g, cpu-4x or slow-4g+cpu-4x
+        self.throttle_profile = os.getenv('THROTTLE_PROFILE', '')
 
         # End Test Paths
         self.reports_dir = Path('reports')
         self.logs_dir = self.reports_dir / 'logs'
+        self.cache_dir = Path(os.getenv('CACHE_DIR', '.cache'))
+
+        # Test data generation. RUN_ID is shared with xdist workers so every
+        # process of one run generates identities in the same namespace
+        self.run_id = os.getenv('RUN_ID') or uuid.uuid4().hex[:8]
+        self.test_data_seed = int(os.getenv('TEST_DATA_SEED', '0'))
+
+        # Authentication state cache
+        self.auth_state_dir = self.cache_dir / 'auth'
+        self.auth_state_ttl = int(os.getenv('AUTH_STATE_TTL', '3600'))
+
+        # Instrumentation
+        self.action_timing_enabled = os.getenv('ACTION_TIMING', 'false').lower() == 'true'
+        self.wait_savings_probe = os.getenv('WAIT_SAVINGS_PROBE', 'false').lower() == 'true'
+        self.network_log_size = int(os.getenv('NETWORK_LOG_SIZE', '500'))
+        self.selector_slow_ms = float(os.getenv('SELECTOR_SLOW_MS', '20'))
+
+        # Browser-side performance metrics and their budgets (warn, fail or off)
+        self.perf_metrics = os.getenv('PERF_METRICS', 'false').lower() == 'true'
+        self.perf_budget_mode = os.getenv('PERF_BUDGET_MODE', 'warn').lower()
+        self.perf_budgets_file = Path(os.getenv('PERF_BUDGETS_FILE', 'configs/perf_budgets.json'))
+
+        # Memory leak detection over repeated flows, thresholds are growth per cycle
+        self.leak_cycles = int(os.getenv('LEAK_CYCLES', '20'))
+        self.leak_warmup_cycles = int(os.getenv('LEAK_WARMUP_CYCLES', '3'))
+        self.leak_heap_kb_per_cycle = float(os.getenv('LEAK_HEAP_KB_PER_CYCLE', '100'))
+        self.leak_nodes_per_cycle = float(os.getenv('LEAK_NODES_PER_CYCLE', '50'))
+        self.leak_listeners_per_cycle = float(os.getenv('LEAK_LISTENERS_PER_CYCLE', '5'))
+
+        # Test ordering from recorded durations and outcomes
+        self.test_history_path = self.cache_dir / 'test_history.json'
+        self.reorder_tests = os.getenv('REORDER_TESTS', 'true').lower() == 'true'
+        self.shard_module_overhead = float(os.getenv('SHARD_MODULE_OVERHEAD', '5'))
+
+        # Benchmarks
+        self.run_benchmarks = os.getenv('RUN_BENCHMARKS', 'false').lower() == 'true'
+        self.upload_bench_sizes = os.getenv('UPLOAD_BENCH_SIZES', '1MB,10MB,100MB')
+        self.upload_bench_count = int(os.getenv('UPLOAD_BENCH_COUNT', '3'))
+        self.upload_bench_sparse = os.getenv('UPLOAD_BENCH_SPARSE', 'false').lower() == 'true'
+        self.upload_timeout = int(os.getenv('UPLOAD_TIMEOUT', '600000'))
+        self.library_bench_files = os.getenv('LIBRARY_BENCH_FILES', '1000,10000')
+        self.library_bench_depth = int(os.getenv('LIBRARY_BENCH_DEPTH', '3'))
+        self.library_bench_breadth = int(os.getenv('LIBRARY_BENCH_BREADTH', '5'))
+        # Shares of the files kept at the root and in the deepest branch folder,
+        # so those views hold most of the library rather than a slice of it
+        self.library_bench_root_share = float(os.getenv('LIBRARY_BENCH_ROOT_SHARE', '0.5'))
+        self.library_bench_leaf_share = float(os.getenv('LIBRARY_BENCH_LEAF_SHARE', '0.4'))
+
+        # Request routing
+        self.asset_cache_enabled = os.getenv('ASSET_CACHE', 'false').lower() == 'true'
+        self.asset_cache_dir = self.cache_dir / 'assets'
+        self.app_version = os.getenv('APP_VERSION', '')
+        self.block_url_patterns = [p.strip() for p in os.getenv('BLOCK_URL_PATTERNS', '').split(',') if p.strip()]
+
+        # In-process fake myDrive for offline runs and harness benchmarks
+        self.fake_server = os.getenv('FAKE_SERVER', 'false').lower() == 'true'
+        self.fake_server_latency = float(os.getenv('FAKE_SERVER_LATENCY', '0'))
+
+        # API Configuration
+        self.api_url = os.getenv('API_URL', self.base_url)
+        self.seed_workers = int(os.getenv('SEED_WORKERS', '8'))
 
         # Database Configuration
         self.mongodb_url = os.getenv('MONGODB_URL', 'mongodb://localhost:27017/mydrive_test')
         self.db_type = os.getenv('DB_TYPE', 'fs')
 
+        # Snapshots of the baseline database state
+        self.db_snapshot = os.getenv('DB_SNAPSHOT', 'false').lower() == 'true'
+        self.db_snapshot_name = os.getenv('DB_SNAPSHOT_NAME', 'baseline')
+
+        # Parallel Configuration
+        # BASE_URLS spreads xdist workers round-robin over several app instances.
+        # DB_PER_WORKER points each worker at its own database, e.g. mydrive_test_gw0
+        base_urls = [url.strip() for url in os.getenv('BASE_URLS', '').split(',') if url.strip()]
+        if base_urls:
+            self.base_url = base_urls[worker_index() % len(base_urls)]
+            self.api_url = os.getenv('API_URL', self.base_url)
+        self.db_per_worker = os.getenv('DB_PER_WORKER', 'false').lower() == 'true'
+        if self.db_per_worker:
+            self.mongodb_url = worker_database_url(self.mongodb_url)
+
     def get_page_goto_options(self) -> Dict[str, Any]:
         """
         Get default page navigation options
@@ -45,7 +128,7 @@ class TestConfig:
         :returns: dictionary containing page navigation configuration
         """
         return {
-            'wait_until': 'networkidle',
+            'wait_until': self.page_load_state,
             'timeout': self.default_timeout
         }
 
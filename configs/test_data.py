@@ -4,10 +4,13 @@ Provides sample data for test scenarios including user data, file info, and
 test content
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime, timedelta
+import math
 import random
 import string
+from configs.settings import config
+from utils.workers import namespace_email, worker_id
 
 class TestData:
     """Container class for all test data constants"""
@@ -24,4 +27,156 @@ class TestData:
         }
     ]
 
+    # Generated identities live under a reserved domain and a per run/worker
+    # namespace, so they never collide with real or hand-written accounts
+    GENERATED_DOMAIN = 'generated.example.com'
+    FILE_EXTENSIONS = ['txt', 'pdf', 'png', 'jpg', 'docx', 'xlsx', 'zip', 'mp4']
+    PASSWORD_SYMBOLS = '!@#$%^&*'
+
+    def __init__(self, seed: Optional[int] = None, run_id: Optional[str] = None):
+        # Give each parallel worker its own copies of the shared accounts
+        self.VALID_USERS = [
+            {**user, 'email': namespace_email(user['email'])}
+            for user in TestData.VALID_USERS
+        ]
+
+        self.seed = config.test_data_seed if seed is None else seed
+        self.run_id = run_id or config.run_id
+        self.namespace = f"gen.{self.run_id}.{worker_id()}"
+
+    def _rng(self, kind: str, index: int) -> random.Random:
+        """
+        Get a generator seeded for one item, so any item can be produced
+        on its own without generating the ones before it. Only the seed,
+        kind and index count, so a seed reproduces the same data on every
+        run and worker; the run namespace is applied to emails alone
+
+        :param kind: Kind of item, e.g. user or file
+        :param index: Index of the item
+        :returns: Seeded random generator
+        """
+        return random.Random(f"{self.seed}:{kind}:{index}")
+
+    @property
+    def email_prefix(self) -> str:
+        """Email prefix shared by every user generated in this run and worker"""
+        return f"{self.namespace}."
+
+    def user(self, index: int) -> Dict[str, Any]:
+        """
+        Generate a single user
+
+        :param index: Index of the user
+        :returns: User dict containing email and password
+        """
+        rng = self._rng('user', index)
+        name = ''.join(rng.choices(string.ascii_lowercase, k=6))
+        password = (
+            ''.join(rng.choices(string.ascii_letters, k=8))
+            + ''.join(rng.choices(string.digits, k=3))
+            + rng.choice(self.PASSWORD_SYMBOLS)
+        )
+        return {
+            'email': f"{self.email_prefix}{name}{index}@{self.GENERATED_DOMAIN}",
+            'password': password
+        }
+
+    def users(self, count: int, start: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily generate users
+
+        :param count: Number of users to generate
+        :param start: Index of the first user
+        :returns: Iterator of user dicts
+        """
+        for index in range(start, start + count):
+            yield self.user(index)
+
+    def file_spec(self, index: int, min_size: int = 1024,
+                  max_size: int = 10 * 1024 ** 2) -> Dict[str, Any]:
+        """
+        Generate a single file description
+
+        :param index: Index of the file
+        :param min_size: Smallest file size in bytes
+        :param max_size: Largest file size in bytes
+        :returns: Dict with name, extension, size, content seed and modified time
+        """
+        rng = self._rng('file', index)
+        extension = rng.choice(self.FILE_EXTENSIONS)
+        # Log-uniform sizes give many small files and a few large ones
+        size = int(math.exp(rng.uniform(math.log(min_size), math.log(max_size))))
+        stem = ''.join(rng.choices(string.ascii_lowercase + string.digits, k=10))
+        return {
+            'name': f"{stem}_{index}.{extension}",
+            'extension': extension,
+            'size': size,
+            'seed': rng.getrandbits(32),
+            'modified': datetime(2024, 1, 1) + timedelta(seconds=rng.randrange(365 * 24 * 3600))
+        }
+
+    def file_specs(self, count: int, start: int = 0, **size_range: int) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily generate file descriptions
+
+        :param count: Number of files to generate
+        :param start: Index of the first file
+        :param size_range: Optional min_size and max_size in bytes
+        :returns: Iterator of file spec dicts
+        """
+        for index in range(start, start + count):
+            yield self.file_spec(index, **size_range)
+
+    def library_files(self, count: int, folders: List[str], leaf: Optional[str] = None,
+                      root_share: float = 0.0, leaf_share: float = 0.0) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """
+        Lazily generate the files of a library and the folder each goes in.
+        The first root_share of the files stay at the root and the next
+        leaf_share go to the leaf folder, so single views can be made to
+        hold thousands of files; the rest are spread round-robin over the
+        root and every folder
+
+        :param count: Number of files to generate
+        :param folders: Folder paths of the library
+        :param leaf: Folder path receiving leaf_share, the root if None
+        :param root_share: Share of the files kept at the root, 0 to 1
+        :param leaf_share: Share of the files put in the leaf folder, 0 to 1
+        :returns: Iterator of file spec and folder path, '' for the root
+        """
+        at_root = int(count * root_share)
+        in_leaf = at_root + int(count * leaf_share)
+        parents = [''] + folders
+        for index, spec in enumerate(self.file_specs(count)):
+            if index < at_root:
+                yield spec, ''
+            elif index < in_leaf:
+                yield spec, leaf or ''
+            else:
+                yield spec, parents[index % len(parents)]
+
+    def folder_tree(self, depth: int, breadth: int) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily walk a folder tree depth first. Only the current branch is
+        held in memory, so trees with millions of folders are fine
+
+        :param depth: Number of folder levels below the root
+        :param breadth: Number of sub folders per folder
+        :returns: Iterator of dicts with name, path, parent path and depth,
+        parents always come before their children
+        """
+        stack = [('', 0, iter(range(breadth)))] if depth > 0 else []
+        while stack:
+            parent_path, level, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                continue
+
+            name = f"folder_{level}_{child}"
+            path = f"{parent_path}/{name}" if parent_path else name
+            yield {'name': name, 'path': path, 'parent': parent_path or None, 'depth': level + 1}
+
+            if level + 1 < depth:
+                stack.append((path, level + 1, iter(range(breadth))))
+
 test_data = TestData()
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""
+This module contains the async twin of BasePage built on playwright.async_api.
+Lets a single process drive many pages concurrently with asyncio while
+sharing locators and wait strategies with the sync page objects.
+"""
+
+import logging
+import time
+from typing import Optional, Callable, Awaitable, Any, Dict, Union
+from playwright.async_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
+from configs.settings import config
+from pages.wait_strategies import WaitStrategy
+from pages.locators import Element
+from utils.timing import timed_action, timer
+
+logger = logging.getLogger(__name__)
+
+class AsyncBasePage:
+    """
+    Base class for all async page objects
+    Mirrors the BasePage API with coroutine methods
+    """
+
+    # Completion condition used by perform_and_wait when none is given
+    COMPLETION: WaitStrategy = WaitStrategy()
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.timeout = config.default_timeout
+        # Locators are lazy and reusable, so each is built once per page object
+        self._locators: Dict[Union[str, Element], Locator] = {}
+
+    @timed_action
+    async def navigate_to(self, url: Optional[str] = None) -> None:
+        """
+        Navigate to a specific URL or the base URL
+
+        :param url: Optional URL to navigate to. Uses base_url if not provided
+        """
+        target_url = url or config.base_url
+        logger.info(f"Navigating to: {target_url}")
+        goto_options = config.get_page_goto_options()
+        await self.page.goto(target_url, **goto_options)
+
+        if config.wait_savings_probe and goto_options['wait_until'] != 'networkidle':
+            await self._probe_network_idle(f"goto:{goto_options['wait_until']}")
+
+    @timed_action
+    async def perform_and_wait(self, action: Callable[[], Awaitable[Any]],
+                            strategy: Optional[WaitStrategy] = None,
+                            timeout: Optional[int] = None) -> None:
+        """
+        Perform an action and wait for its completion condition
+
+        :param action: Coroutine function that triggers the action, e.g. a click
+        :param strategy: Completion condition, defaults to the page's COMPLETION
+        :param timeout: Custom timeout in ms
+        """
+        strategy = strategy or self.COMPLETION
+        timeout = timeout or self.timeout
+        await strategy.arun(self.page, action, timeout)
+
+        if config.wait_savings_probe:
+            await self._probe_network_idle(strategy.name, timeout)
+
+    @timed_action
+    async def wait_for_element(self, selector: Union[str, Element], state: str = 'visible',
+                            timeout: Optional[int] = None) -> Locator:
+        """
+        Wait for an element to reach a specific state
+
+        :param selector: Element selector
+        :param state: State to wait for (visible, hidden, attached, detached)
+        :param timeout: Custom timeout in ms
+        :returns: Locator for the element
+        """
+        timeout = timeout or self.timeout
+        logger.debug(f"Waiting for element: {selector} to be {state}")
+
+        locator = self.locator(selector)
+        await locator.wait_for(state=state, timeout=timeout)
+        return locator
+
+    @timed_action
+    async def click_element(self, selector: Union[str, Element], force: bool = False,
+                            timeout: Optional[int] = None) -> None:
+        """
+        Click on an element with error handling
+
+        :param selector: Element selector
+        :param force: Force click even if element is not visible
+        :param timeout: Custom timeout in ms
+        """
+        try:
+            element = await self.wait_for_element(selector, timeout=timeout)
+            logger.debug(f"Clicking element: {selector}")
+            await element.click(force=force)
+        except PlaywrightTimeoutError:
+            logger.error(f"Failed to click element: {selector}")
+            raise
+
+    @timed_action
+    async def fill_input(self, selector: Union[str, Element], text: str,
+                        clear_first: bool = True) -> None:
+        """
+        Fill an input field with text
+
+        :param selector: Input field selector
+        :param text: Text to enter in the input field
+        :clear_first: Whether to clear the field before entering first
+        """
+        element = await self.wait_for_element(selector)
+        logger.debug(f"Filling input '{selector}' with text: {text[:20]}...")
+
+        if clear_first:
+            await element.clear()
+        await element.fill(text)
+
+    @timed_action
+    async def get_text(self, selector: Union[str, Element], timeout: Optional[int] = None) -> str:
+        """
+        Get text content from an element
+
+        :param selector: Element selector
+        :param timeout: Custom timeout in ms
+        :returns: Text content of the element
+        """
+        element = await self.wait_for_element(selector, timeout=timeout)
+        return await element.text_content() or ""
+
+    @timed_action
+    async def is_element_visible(self, selector: Union[str, Element], timeout: int = 1000) -> bool:
+        """
+        Check if an element is visible
+
+        :param selector: Element selector
+        :param timeout: Timeout for checking visibility
+        :returns: True if element is visible, false otherwise
+        """
+        try:
+            await self.wait_for_element(selector, state='visible', timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    @timed_action
+    async def wait_for_network_idle(self, timeout: Optional[int] = None) -> None:
+        """Wait for network to be idle"""
+        timeout = timeout or self.timeout
+        await self.page.wait_for_load_state('networkidle', timeout=timeout)
+
+    async def _probe_network_idle(self, strategy_name: str, timeout: Optional[int] = None) -> None:
+        """
+        Measure how much longer a networkidle wait would have taken after a
+        strategy completed, and record it as that strategy's saving
+
+        :param strategy_name: Name of the strategy that just completed
+        :param timeout: Custom timeout in ms
+        """
+        start = time.perf_counter()
+        try:
+            await self.page.wait_for_load_state('networkidle', timeout=timeout or self.timeout)
+        except PlaywrightTimeoutError:
+            logger.debug(f"networkidle never reached after {strategy_name} wait")
+        timer.record_wait_saving(f"{type(self).__name__}:{strategy_name}", time.perf_counter() - start)
+
+    def locator(self, target: Union[str, Element]) -> Locator:
+        """
+        Get the locator of a selector or registered element, building it only once
+
+        :param target: Selector string or Element from pages.locators
+        :returns: Locator for the element
+        """
+        if target not in self._locators:
+            self._locators[target] = (target.resolve(self.page) if isinstance(target, Element)
+                                    else self.page.locator(target))
+        return self._locators[target]
+
+    def get_current_url(self) -> str:
+        """ Get the url of the current page you're on"""
+        return self.page.url
@@ -0,0 +1,53 @@
+"""
+This module contains the async page object for the user home page.
+Handles file handling, folder management and logout
+"""
+
+from playwright.async_api import Page
+from pages.async_base_page import AsyncBasePage
+from pages.home_page import HomePage
+from utils.timing import timed_action
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncHomePage(AsyncBasePage):
+    """Async page object for the user home page"""
+
+    # Locators
+    ADD_NEW = HomePage.ADD_NEW
+    UPLOAD_FILES = HomePage.UPLOAD_FILES
+    ACCOUNT_MENU = HomePage.ACCOUNT_MENU
+    LOGOUT_BUTTON = HomePage.LOGOUT_BUTTON
+    CONFIRM_LOGOUT = HomePage.CONFIRM_LOGOUT
+
+    UPLOAD_RESPONSE = HomePage.UPLOAD_RESPONSE
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+
+    @timed_action
+    async def logout(self) -> None:
+        """Log out of the page"""
+        logger.info("Logging out of the home page")
+        await self.locator(self.ACCOUNT_MENU).click()
+        await self.locator(self.LOGOUT_BUTTON).click()
+        await self.locator(self.CONFIRM_LOGOUT).click()
+        logger.info("Logged out")
+
+    @timed_action
+    async def upload_file(self, file_path: str) -> None:
+        """
+        Navigate to the upload button and upload a file based
+        on the given file path
+
+        :param file_path: file path of the file that will be uploaded
+        """
+        logger.info(f"Attempting to upload file {file_path}")
+        await self.locator(self.ADD_NEW).click()
+
+        # The upload link opens a native file chooser, so answer it directly
+        async with self.page.expect_file_chooser() as chooser_info:
+            await self.locator(self.UPLOAD_FILES).click()
+        chooser = await chooser_info.value
+        await chooser.set_files(file_path)
@@ -0,0 +1,66 @@
+"""
+This module contains the async page object for the myDrive login page
+Shares its locators and completion condition with LoginPage
+"""
+
+from playwright.async_api import Page
+from pages.async_base_page import AsyncBasePage
+from pages.login_page import LoginPage
+from utils.timing import timed_action
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncLoginPage(AsyncBasePage):
+    """ Async page object for the myDrive login page"""
+
+    # Locators
+    EMAIL_INPUT = LoginPage.EMAIL_INPUT
+    PASSWORD_INPUT = LoginPage.PASSWORD_INPUT
+    LOGIN_BUTTON = LoginPage.LOGIN_BUTTON
+    ACCOUNT_MENU = LoginPage.ACCOUNT_MENU
+    LOGOUT_BUTTON = LoginPage.LOGOUT_BUTTON
+    CONFIRM_LOGOUT = LoginPage.CONFIRM_LOGOUT
+
+    COMPLETION = LoginPage.COMPLETION
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+
+    @timed_action
+    async def login(self, email: str, password: str) -> None:
+        """
+        Perform login with provided credientials
+
+        :param email: User email address
+        :param password: User password
+        """
+        logger.info(f"Attempting login with email: {email}")
+
+        # Fill in credentials
+        await self.fill_input(self.EMAIL_INPUT, email)
+        await self.fill_input(self.PASSWORD_INPUT, password)
+
+        # Click Login button and wait for the login call to answer
+        await self.perform_and_wait(lambda: self.click_element(self.LOGIN_BUTTON))
+
+    async def is_logged_in(self) -> bool:
+        """
+        Check if user is logged in by verifying URL change
+
+        :returns: true if logged in, false otherise
+        """
+        logger.info(f"Checking if user is logged in...")
+        await self.page.wait_for_url("**/home")
+        current_url = self.get_current_url()
+        logger.debug(f"URL is now - {current_url}")
+        return '/home' in current_url
+
+    @timed_action
+    async def logout(self) -> None:
+        """
+        Log out of the page
+        """
+        await self.locator(self.ACCOUNT_MENU).click()
+        await self.locator(self.LOGOUT_BUTTON).click()
+        await self.locator(self.CONFIRM_LOGOUT).click()
@@ -0,0 +1,65 @@
+"""
+This module contains the async page object for the user registration page.
+Shares its locators and completion conditions with RegisterPage
+"""
+
+from playwright.async_api import Page
+from pages.async_base_page import AsyncBasePage
+from pages.register_page import RegisterPage
+from utils.timing import timed_action
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncRegisterPage(AsyncBasePage):
+    """Async page object for the registration page"""
+
+    # Locators
+    CREATE_ACCOUNT_LINK = RegisterPage.CREATE_ACCOUNT_LINK
+    EMAIL_INPUT = RegisterPage.EMAIL_INPUT
+    PASSWORD_INPUT = RegisterPage.PASSWORD_INPUT
+    VERIFY_PASSWORD_INPUT = RegisterPage.VERIFY_PASSWORD_INPUT
+    CREATE_BUTTON = RegisterPage.CREATE_BUTTON
+    ACCOUNT_MENU = RegisterPage.ACCOUNT_MENU
+    LOGOUT_BUTTON = RegisterPage.LOGOUT_BUTTON
+    CONFIRM_LOGOUT = RegisterPage.CONFIRM_LOGOUT
+
+    COMPLETION = RegisterPage.COMPLETION
+    LOGOUT_COMPLETION = RegisterPage.LOGOUT_COMPLETION
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+
+    @timed_action
+    async def register(self, email: str, password: str, unmatching: str = "", click_button: bool = True) -> None:
+        """
+        Registers a new user account
+
+        :param email: User email
+        :param password: User password
+        :param unmatching: If not empty, we fill the confirm password input
+        box with an unmatching password
+        :param click_button: Toggle whether to click the register button
+        """
+        await self.locator(self.CREATE_ACCOUNT_LINK).click()
+
+        logger.info(f"Registering new user: {email}")
+
+        await self.fill_input(self.EMAIL_INPUT, email)
+        await self.locator(self.PASSWORD_INPUT).fill(password)
+        await self.locator(self.VERIFY_PASSWORD_INPUT).fill(unmatching or password)
+
+        if click_button:
+            await self.perform_and_wait(lambda: self.click_element(self.CREATE_BUTTON))
+
+    @timed_action
+    async def logout_after_register(self) -> None:
+        """
+        Log out of the page after registration
+        """
+        await self.locator(self.ACCOUNT_MENU).click()
+        await self.locator(self.LOGOUT_BUTTON).click()
+        await self.perform_and_wait(
+            lambda: self.locator(self.CONFIRM_LOGOUT).click(),
+            self.LOGOUT_COMPLETION
+        )
@@ -4,9 +4,15 @@ Provides common functionality for page interactions, element waiting, and error
 """
 
 import logging
-from typing import Optional, List, Dict, Any, Union
+import time
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Union, Callable, Iterator
 from playwright.sync_api import Page, Locator, expect, TimeoutError as PlaywrightTimeoutError
 from configs.settings import config
+from pages.wait_strategies import WaitStrategy
+from pages.locators import Element
+from utils.timing import timed_action, timer
+from utils.perf_metrics import PerfCollector, perf_recorder
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
@@ -17,10 +23,16 @@ class BasePage:
     Provides common methods for page interactions and element handling
     """
 
+    # Completion condition used by perform_and_wait when none is given
+    COMPLETION: WaitStrategy = WaitStrategy()
+
     def __init__(self, page: Page):
         self.page = page
         self.timeout = config.default_timeout
+        # Locators are lazy and reusable, so each is built once per page object
+        self._locators: Dict[Union[str, Element], Locator] = {}
 
+    @timed_action
     def navigate_to(self, url: Optional[str] = None) -> None:
         """
         Navigate to a specific URL or the base URL
@@ -29,9 +41,56 @@ class BasePage:
         """
         target_url = url or config.base_url
         logger.info(f"Navigating to: {target_url}")
-        self.page.goto(target_url, **config.get_page_goto_options())
+        goto_options = config.get_page_goto_options()
+        with self.measure_transition('navigate'):
+            self.page.goto(target_url, **goto_options)
+
+        if config.wait_savings_probe and goto_options['wait_until'] != 'networkidle':
+            self._probe_network_idle(f"goto:{goto_options['wait_until']}")
 
-    def wait_for_element(self, selector: str, state: str = 'visible',
+    @timed_action
+    def perform_and_wait(self, action: Callable[[], None], strategy: Optional[WaitStrategy] = None,
+                        timeout: Optional[int] = None) -> None:
+        """
+        Perform an action and wait for its completion condition
+
+        :param action: Callable that triggers the action, e.g. a click
+        :param strategy: Completion condition, defaults to the page's COMPLETION
+        :param timeout: Custom timeout in ms
+        """
+        strategy = strategy or self.COMPLETION
+        timeout = timeout or self.timeout
+        strategy.run(self.page, action, timeout)
+
+        if config.wait_savings_probe:
+            self._probe_network_idle(strategy.name, timeout)
+
+    @contextmanager
+    def measure_transition(self, action: str) -> Iterator[None]:
+        """
+        Collect browser performance metrics around a navigation or
+        transition and check them against the budgets, when PERF_METRICS is on
+
+        :param action: Name of the transition, recorded as '<PageObject>.<action>'
+        """
+        if not config.perf_metrics:
+            yield
+            return
+
+        collector = PerfCollector.for_page(self.page)
+        mark = collector.mark()
+        start = time.perf_counter()
+        yield
+        duration = time.perf_counter() - start
+
+        metrics = collector.collect(mark)
+        if metrics is None:
+            return
+        metrics['duration_ms'] = duration * 1000
+        perf_recorder.record(f"{type(self).__name__}.{action}", metrics)
+
+    @timed_action
+    def wait_for_element(self, selector: Union[str, Element], state: str = 'visible',
                         timeout: Optional[int] = None) -> Locator:
         """
         Wait for an element to reach a specific state
@@ -44,11 +103,12 @@ class BasePage:
         timeout = timeout or self.timeout
         logger.debug(f"Waiting for element: {selector} to be {state}")
 
-        locator = self.page.locator(selector)
+        locator = self.locator(selector)
         locator.wait_for(state=state, timeout=timeout)
         return locator
 
-    def click_element(self, selector: str, force: bool = False,
+    @timed_action
+    def click_element(self, selector: Union[str, Element], force: bool = False,
                         timeout: Optional[int] = None) -> None:
         """
         Click on an element with error handling
@@ -66,7 +126,8 @@ class BasePage:
             # TODO: Create screenshot method in this class
             raise
     
-    def fill_input(self, selector: str, text: str,
+    @timed_action
+    def fill_input(self, selector: Union[str, Element], text: str,
                     clear_first: bool = True) -> None:
         """
         Fill an input field with text
@@ -82,7 +143,8 @@ class BasePage:
             element.clear()
         element.fill(text)
     
-    def get_text(self, selector: str, timeout: Optional[int] = None) -> str:
+    @timed_action
+    def get_text(self, selector: Union[str, Element], timeout: Optional[int] = None) -> str:
         """
         Get text content from an element
 
@@ -93,7 +155,8 @@ class BasePage:
         element = self.wait_for_element(selector, timeout=timeout)
         return element.text_content() or ""
 
-    def is_element_visible(self, selector: str, timeout: int = 1000) -> bool:
+    @timed_action
+    def is_element_visible(self, selector: Union[str, Element], timeout: int = 1000) -> bool:
         """
         Check if an element is visible
 
@@ -107,11 +170,39 @@ class BasePage:
         except PlaywrightTimeoutError:
             return False
 
+    @timed_action
     def wait_for_network_idle(self, timeout: Optional[int] = None) -> None:
         """Wait for network to be idle"""
         timeout = timeout or self.timeout
         self.page.wait_for_load_state('networkidle', timeout=timeout)
 
+    def _probe_network_idle(self, strategy_name: str, timeout: Optional[int] = None) -> None:
+        """
+        Measure how much longer a networkidle wait would have taken after a
+        strategy completed, and record it as that strategy's saving
+
+        :param strategy_name: Name of the strategy that just completed
+        :param timeout: Custom timeout in ms
+        """
+        start = time.perf_counter()
+        try:
+            self.page.wait_for_load_state('networkidle', timeout=timeout or self.timeout)
+        except PlaywrightTimeoutError:
+            logger.debug(f"networkidle never reached after {strategy_name} wait")
+        timer.record_wait_saving(f"{type(self).__name__}:{strategy_name}", time.perf_counter() - start)
+
+    def locator(self, target: Union[str, Element]) -> Locator:
+        """
+        Get the locator of a selector or registered element, building it only once
+
+        :param target: Selector string or Element from pages.locators
+        :returns: Locator for the element
+        """
+        if target not in self._locators:
+            self._locators[target] = (target.resolve(self.page) if isinstance(target, Element)
+                                    else self.page.locator(target))
+        return self._locators[target]
+
     def get_current_url(self) -> str:
         """ Get the url of the current page you're on"""
         return self.page.url
@@ -3,26 +3,59 @@ This module contains the page object for the user home page.
 Handles file handling, folder management and logout 
 """
 
+import time
+from typing import Optional, Dict, Any
 from playwright.sync_api import Page
+from configs.settings import config
 from pages.base_page import BasePage
+from pages.locators import HOME, HEADER
+from utils.timing import timed_action
+from utils.hashing import file_digest
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Scroll offset and height of the scroll container under a point, read after
+# two animation frames so the last scroll has been applied and painted
+SCROLL_STATE_JS = """
+([x, y]) => new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(() => {
+    let el = document.elementFromPoint(x, y);
+    while (el && !(el.scrollHeight > el.clientHeight
+                   && /auto|scroll/.test(getComputedStyle(el).overflowY))) {
+        el = el.parentElement;
+    }
+    el = el || document.scrollingElement;
+    resolve({top: el.scrollTop, height: el.scrollHeight});
+})))
+"""
+
 class HomePage(BasePage):
     """Page object for the user home page"""
 
+    # Locators
+    QUICK_ACCESS = HOME.QUICK_ACCESS
+    ADD_NEW = HOME.ADD_NEW
+    UPLOAD_FILES = HOME.UPLOAD_FILES
+    DOWNLOAD = HOME.DOWNLOAD
+    ACCOUNT_MENU = HEADER.ACCOUNT_MENU
+    LOGOUT_BUTTON = HEADER.LOGOUT_BUTTON
+    CONFIRM_LOGOUT = HEADER.CONFIRM_LOGOUT
+
+    UPLOAD_RESPONSE = '**/file-service/upload*'
+
     def __init__(self, page: Page):
         super().__init__(page)
 
+    @timed_action
     def logout(self) -> None:
         """Log out of the page"""
         logger.info("Logging out of the home page")
-        self.page.locator("#header a").nth(1).click()
-        self.page.get_by_role("button", name="Logout", exact=True).click()
-        self.page.get_by_role("button", name="Yes, logout").click()
+        self.locator(self.ACCOUNT_MENU).click()
+        self.locator(self.LOGOUT_BUTTON).click()
+        self.locator(self.CONFIRM_LOGOUT).click()
         logger.info("Logged out")
 
+    @timed_action
     def upload_file(self, file_path: str) -> None:
         """
         Navigate to the upload button and upload a file based 
@@ -31,7 +64,96 @@ class HomePage(BasePage):
         :param file_path: file path of the file that will be uplaoded
         """
         logger.info(f"Attempting to upload file {file_path}")
-        self.page.locator("a").filter(has_text="ADD NEW").click()
-        self.page.locator("a").filter(has_text="Upload Files").click()
-        self.page.locator("body").set_input_files(file)
-    
\ No newline at end of file
+        self.locator(self.ADD_NEW).click()
+
+        # The upload link opens a native file chooser, so answer it directly
+        with self.page.expect_file_chooser() as chooser_info:
+            self.locator(self.UPLOAD_FILES).click()
+        chooser_info.value.set_files(file_path)
+
+    @timed_action
+    def open_folder(self, folder_id: str) -> None:
+        """
+        Navigate straight to a folder view
+
+        :param folder_id: Id of the folder
+        """
+        self.navigate_to(f"{config.base_url.rstrip('/')}/folder/{folder_id}")
+
+    @timed_action
+    def scroll_file_list(self, step: int = 2000, max_steps: int = 200) -> Dict[str, Any]:
+        """
+        Scroll the file list to the bottom, letting the page paint between
+        steps, until the scroll position stops moving. Lists that load more
+        items while scrolling keep growing until they are exhausted
+
+        :param step: Pixels scrolled per step
+        :param max_steps: Upper bound on the number of steps
+        :returns: Dict with steps, seconds and the final scroll height
+        """
+        viewport = self.page.viewport_size or {'width': config.viewport_width, 'height': config.viewport_height}
+        point = [viewport['width'] / 2, viewport['height'] / 2]
+        self.page.mouse.move(*point)
+
+        start = time.perf_counter()
+        steps = 0
+        state = self.page.evaluate(SCROLL_STATE_JS, point)
+        while steps < max_steps:
+            self.page.mouse.wheel(0, step)
+            moved_to = self.page.evaluate(SCROLL_STATE_JS, point)
+            steps += 1
+            if moved_to['top'] == state['top']:
+                break
+            state = moved_to
+
+        return {
+            'steps': steps,
+            'seconds': time.perf_counter() - start,
+            'scroll_height': state['height']
+        }
+
+    @timed_action
+    def wait_for_file_visible(self, file_name: str, timeout: Optional[int] = None) -> None:
+        """
+        Wait for a file to show up in the file list
+
+        :param file_name: Name of the file
+        :param timeout: Custom timeout in ms
+        """
+        self.page.get_by_text(file_name, exact=True).first.wait_for(
+            state='visible', timeout=timeout or self.timeout
+        )
+
+    @timed_action
+    def download_file(self, file_name: str, algorithm: str = 'sha256',
+                    timeout: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Download a file from the file list and hash it
+
+        :param file_name: Name of the file in the file list
+        :param algorithm: hashlib algorithm used for the digest
+        :param timeout: Custom timeout in ms for the download to finish
+        :returns: Dict with the download path, size, digest, seconds and MB/s
+        """
+        logger.info(f"Attempting to download file {file_name}")
+        start = time.perf_counter()
+
+        with self.page.expect_download(timeout=timeout or self.timeout) as download_info:
+            self.page.get_by_text(file_name, exact=True).first.click(button="right")
+            self.locator(self.DOWNLOAD).click()
+        download = download_info.value
+
+        # Playwright hands over the finished artifact, so hash it in place
+        # rather than copying it out with save_as first
+        path = download.path()
+        elapsed = time.perf_counter() - start
+        size = path.stat().st_size
+        digest = file_digest(path, algorithm)
+
+        return {
+            'path': path,
+            'size': size,
+            'digest': digest,
+            'seconds': elapsed,
+            'mb_per_s': size / (1024 ** 2) / elapsed if elapsed else 0.0
+        }
@@ -0,0 +1,184 @@
+"""
+This module is the central registry of page elements. Page objects declare
+their elements here once, so every selector in the suite can be looked up
+by name, built into a locator the same way everywhere, and profiled.
+"""
+
+from typing import Dict, List, Optional, Union
+from playwright.sync_api import Page, Locator
+from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
+
+class Element:
+    """
+    Declaration of a page element: a selector, an ARIA role with an
+    accessible name, or a text, optionally filtered and picked by position
+    """
+
+    def __init__(self, selector: Optional[str] = None, role: Optional[str] = None,
+                name: Optional[str] = None, text: Optional[str] = None,
+                exact: Optional[bool] = None, has_text: Optional[str] = None,
+                nth: Optional[int] = None):
+        if sum(x is not None for x in (selector, role, text)) != 1:
+            raise ValueError("An element needs exactly one of selector, role or text")
+        self.selector = selector
+        self.role = role
+        self.name = name
+        self.text = text
+        self.exact = exact
+        self.has_text = has_text
+        self.nth = nth
+        # Set when the element is declared in the registry, e.g. 'login.EMAIL_INPUT'
+        self.key: Optional[str] = None
+
+    def resolve(self, page: Union[Page, AsyncPage]) -> Union[Locator, AsyncLocator]:
+        """
+        Build the locator of the element. Locators are lazy, so this does not
+        touch the browser and works for sync and async pages alike
+
+        :param page: Page to locate the element in
+        :returns: Locator for the element
+        """
+        if self.role is not None:
+            locator = page.get_by_role(self.role, name=self.name, exact=self.exact)
+        elif self.text is not None:
+            locator = page.get_by_text(self.text, exact=self.exact)
+        else:
+            locator = page.locator(self.selector)
+
+        if self.has_text is not None:
+            locator = locator.filter(has_text=self.has_text)
+        if self.nth is not None:
+            locator = locator.nth(self.nth)
+        return locator
+
+    def branches(self) -> List['Element']:
+        """
+        Split a comma-union CSS selector into one element per branch
+
+        :returns: The branches, or an empty list if the selector is no union
+        """
+        if self.selector is None:
+            return []
+        parts = split_union(self.selector)
+        if len(parts) < 2:
+            return []
+        return [Element(part, has_text=self.has_text, nth=self.nth) for part in parts]
+
+    def __str__(self) -> str:
+        if self.role is not None:
+            description = f"role={self.role}[name={self.name!r}]"
+        elif self.text is not None:
+            description = f"text={self.text!r}"
+        else:
+            description = self.selector
+        if self.has_text is not None:
+            description += f" >> has_text={self.has_text!r}"
+        if self.nth is not None:
+            description += f" >> nth={self.nth}"
+        return description
+
+    def __repr__(self) -> str:
+        return f"Element({self.key or str(self)})"
+
+def split_union(selector: str) -> List[str]:
+    """
+    Split a CSS selector on its top-level commas, ignoring commas inside
+    quotes, brackets and parentheses
+
+    :param selector: CSS selector
+    :returns: The comma separated parts
+    """
+    parts, depth, quote, current = [], 0, None, ''
+    for char in selector:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in '\'"':
+            quote = char
+        elif char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+            continue
+        current += char
+    parts.append(current.strip())
+    return [part for part in parts if part]
+
+class PageElements:
+    """
+    The declared elements of one page, accessible as attributes
+    """
+
+    def __init__(self, page_name: str, elements: Dict[str, Element]):
+        self.page_name = page_name
+        self.elements = elements
+        for key, element in elements.items():
+            element.key = f"{page_name}.{key}"
+            setattr(self, key, element)
+
+class LocatorRegistry:
+    """
+    Registry of the elements of every page
+    """
+
+    def __init__(self):
+        self.pages: Dict[str, PageElements] = {}
+
+    def declare(self, page_name: str, **elements: Element) -> PageElements:
+        """
+        Declare the elements of a page
+
+        :param page_name: Name of the page, e.g. 'login'
+        :param elements: Elements keyed by their page object attribute name
+        :returns: The page's elements
+        """
+        if page_name in self.pages:
+            raise ValueError(f"Elements of page '{page_name}' are already declared")
+        self.pages[page_name] = PageElements(page_name, elements)
+        return self.pages[page_name]
+
+    def elements(self, page_name: Optional[str] = None) -> List[Element]:
+        """
+        Get the declared elements
+
+        :param page_name: Only return the elements of this page
+        :returns: List of elements
+        """
+        pages = [self.pages[page_name]] if page_name else self.pages.values()
+        return [element for page in pages for element in page.elements.values()]
+
+registry = LocatorRegistry()
+
+HEADER = registry.declare(
+    'header',
+    ACCOUNT_MENU=Element('#header a', nth=1),
+    LOGOUT_BUTTON=Element(role='button', name='Logout', exact=True),
+    CONFIRM_LOGOUT=Element(role='button', name='Yes, logout'),
+)
+
+LOGIN = registry.declare(
+    'login',
+    EMAIL_INPUT=Element('input[type="text"], input[name="Email address"]'),
+    PASSWORD_INPUT=Element('input[type="password"], input[name="Password"]'),
+    LOGIN_BUTTON=Element('input[type="submit"], input[value="Login"]'),
+    LOGIN_HEADING=Element(text='Login to your account'),
+)
+
+REGISTER = registry.declare(
+    'register',
+    CREATE_ACCOUNT_LINK=Element(text='Create Account'),
+    EMAIL_INPUT=Element('input[type="text"], input[placeholder="Email address"]'),
+    PASSWORD_INPUT=Element(role='textbox', name='Password', exact=True),
+    VERIFY_PASSWORD_INPUT=Element(role='textbox', name='Verify Password'),
+    CREATE_BUTTON=Element('input[type="submit"], input[value="Create"]'),
+)
+
+HOME = registry.declare(
+    'home',
+    QUICK_ACCESS=Element(role='heading', name='Quick Access'),
+    ADD_NEW=Element('a', has_text='ADD NEW'),
+    UPLOAD_FILES=Element('a', has_text='Upload Files'),
+    DOWNLOAD=Element(text='Download', exact=True),
+)
@@ -6,6 +6,9 @@ Handles all login-related interactions and validations
 from configs.settings import config 
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from pages.wait_strategies import ResponseWait
+from pages.locators import LOGIN, HEADER
+from utils.timing import timed_action
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,13 +17,20 @@ class LoginPage(BasePage):
     """ Page object for the myDrive login page"""
 
     # Locators
-    EMAIL_INPUT = 'input[type="text"], input[name="Email address"]'
-    PASSWORD_INPUT = 'input[type="password"], input[name="Password"]'
-    LOGIN_BUTTON = 'input[type="submit"], input[value="Login"]'
+    EMAIL_INPUT = LOGIN.EMAIL_INPUT
+    PASSWORD_INPUT = LOGIN.PASSWORD_INPUT
+    LOGIN_BUTTON = LOGIN.LOGIN_BUTTON
+    ACCOUNT_MENU = HEADER.ACCOUNT_MENU
+    LOGOUT_BUTTON = HEADER.LOGOUT_BUTTON
+    CONFIRM_LOGOUT = HEADER.CONFIRM_LOGOUT
+
+    # Login is finished once the login API call answers, successful or not
+    COMPLETION = ResponseWait('**/user-service/login')
 
     def __init__(self, page: Page):
         super().__init__(page)
 
+    @timed_action
     def login(self, email: str, password: str) -> None:
         """
         Perform login with provided credientials
@@ -35,11 +45,9 @@ class LoginPage(BasePage):
         self.fill_input(self.EMAIL_INPUT, email)
         self.fill_input(self.PASSWORD_INPUT, password)
 
-        # Click Login button
-        self.click_element(self.LOGIN_BUTTON)
-
-        # Wait for navigation or error
-        self.wait_for_network_idle()
+        # Click Login button and wait for the login call to answer
+        with self.measure_transition('login'):
+            self.perform_and_wait(lambda: self.click_element(self.LOGIN_BUTTON))
 
     def is_logged_in(self) -> bool:
         """
@@ -53,10 +61,11 @@ class LoginPage(BasePage):
         logger.debug(f"URL is now - {self.get_current_url()}")
         return '/home' in current_url
 
+    @timed_action
     def logout(self) -> None:
         """
         Log out of the page after registration
         """
-        self.page.locator("#header a").nth(1).click()
-        self.page.get_by_role("button", name="Logout", exact=True).click()
-        self.page.get_by_role("button", name="Yes, logout").click()
\ No newline at end of file
+        self.locator(self.ACCOUNT_MENU).click()
+        self.locator(self.LOGOUT_BUTTON).click()
+        self.locator(self.CONFIRM_LOGOUT).click()
\ No newline at end of file
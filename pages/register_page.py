@@ -5,6 +5,9 @@ Handles user registration and account creation
 
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from pages.wait_strategies import ResponseWait, ElementWait
+from pages.locators import REGISTER, LOGIN, HEADER
+from utils.timing import timed_action
 from configs.settings import config
 import logging
 
@@ -14,12 +17,23 @@ class RegisterPage(BasePage):
     """Page object for the registration page"""
 
     # Locators
-    EMAIL_INPUT = 'input[type="text"], input[placeholder="Email address"]'
-    CREATE_BUTTON = 'input[type="submit"], input[value="Create"]'
+    CREATE_ACCOUNT_LINK = REGISTER.CREATE_ACCOUNT_LINK
+    EMAIL_INPUT = REGISTER.EMAIL_INPUT
+    PASSWORD_INPUT = REGISTER.PASSWORD_INPUT
+    VERIFY_PASSWORD_INPUT = REGISTER.VERIFY_PASSWORD_INPUT
+    CREATE_BUTTON = REGISTER.CREATE_BUTTON
+    ACCOUNT_MENU = HEADER.ACCOUNT_MENU
+    LOGOUT_BUTTON = HEADER.LOGOUT_BUTTON
+    CONFIRM_LOGOUT = HEADER.CONFIRM_LOGOUT
+
+    # Registration is finished once the create account call answers
+    COMPLETION = ResponseWait('**/user-service/create')
+    LOGOUT_COMPLETION = ElementWait(LOGIN.LOGIN_HEADING)
 
     def __init__(self, page: Page):
         super().__init__(page)
 
+    @timed_action
     def register(self, email: str, password: str, unmatching: str = "", click_button: bool = True) -> None:
         """
         Registers a new user account
@@ -30,28 +44,30 @@ class RegisterPage(BasePage):
         box with an unmatching password
         :param click_button: Toggle whether to click the register button
         """
-        self.page.get_by_text("Create Account").click()
+        self.locator(self.CREATE_ACCOUNT_LINK).click()
 
         logger.info(f"Registering new user: {email}")
 
         self.fill_input(self.EMAIL_INPUT, email)
-        self.page.get_by_role("textbox", name="Password", exact=True).fill(password)
+        self.locator(self.PASSWORD_INPUT).fill(password)
         
         if unmatching:
-            self.page.get_by_role("textbox", name="Verify Password").fill(unmatching)
+            self.locator(self.VERIFY_PASSWORD_INPUT).fill(unmatching)
         else:
-            self.page.get_by_role("textbox", name="Verify Password").fill(password)
+            self.locator(self.VERIFY_PASSWORD_INPUT).fill(password)
 
         if click_button:
-            self.click_element(self.CREATE_BUTTON)
-            self.wait_for_network_idle()
+            with self.measure_transition('register'):
+                self.perform_and_wait(lambda: self.click_element(self.CREATE_BUTTON))
 
+    @timed_action
     def logout_after_register(self) -> None:
         """
         Log out of the page after registration
         """
-        self.page.locator("#header a").nth(1).click()
-        self.page.get_by_role("button", name="Logout", exact=True).click()
-        self.page.get_by_role("button", name="Yes, logout").click()
-        
-        self.wait_for_network_idle()
+        self.locator(self.ACCOUNT_MENU).click()
+        self.locator(self.LOGOUT_BUTTON).click()
+        self.perform_and_wait(
+            lambda: self.locator(self.CONFIRM_LOGOUT).click(),
+            self.LOGOUT_COMPLETION
+        )
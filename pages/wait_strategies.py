@@ -0,0 +1,118 @@
+"""
+This module contains the wait strategies page objects use to decide when an
+action has completed. Each strategy waits for a specific event (a URL, an
+API response or an element state) instead of a blanket networkidle wait.
+Every strategy has a sync run and an async arun so the sync and async page
+objects can share the same declarations.
+"""
+
+from typing import Callable, Awaitable, Any, Union
+from playwright.sync_api import Page
+from playwright.async_api import Page as AsyncPage
+from pages.locators import Element
+
+AsyncAction = Callable[[], Awaitable[Any]]
+
+class WaitStrategy:
+    """
+    Base class for action completion conditions
+    """
+
+    name = 'none'
+
+    def run(self, page: Page, action: Callable[[], None], timeout: int) -> None:
+        """
+        Perform an action and block until it has completed
+
+        :param page: Page the action runs on
+        :param action: Callable that triggers the action, e.g. a click
+        :param timeout: Timeout in ms
+        """
+        action()
+
+    async def arun(self, page: AsyncPage, action: AsyncAction, timeout: int) -> None:
+        """
+        Async version of run
+
+        :param page: Async page the action runs on
+        :param action: Coroutine function that triggers the action
+        :param timeout: Timeout in ms
+        """
+        await action()
+
+class NetworkIdleWait(WaitStrategy):
+    """Wait for at least 500 ms without network activity"""
+
+    name = 'networkidle'
+
+    def run(self, page: Page, action: Callable[[], None], timeout: int) -> None:
+        action()
+        page.wait_for_load_state('networkidle', timeout=timeout)
+
+    async def arun(self, page: AsyncPage, action: AsyncAction, timeout: int) -> None:
+        await action()
+        await page.wait_for_load_state('networkidle', timeout=timeout)
+
+class UrlWait(WaitStrategy):
+    """Wait for the page to reach a URL"""
+
+    name = 'url'
+
+    def __init__(self, url: str):
+        """
+        :param url: URL glob, regex or predicate accepted by page.wait_for_url
+        """
+        self.url = url
+
+    def run(self, page: Page, action: Callable[[], None], timeout: int) -> None:
+        action()
+        page.wait_for_url(self.url, timeout=timeout)
+
+    async def arun(self, page: AsyncPage, action: AsyncAction, timeout: int) -> None:
+        await action()
+        await page.wait_for_url(self.url, timeout=timeout)
+
+class ResponseWait(WaitStrategy):
+    """Wait for the response of a specific API call triggered by the action"""
+
+    name = 'response'
+
+    def __init__(self, url: str):
+        """
+        :param url: URL glob, regex or predicate of the expected response
+        """
+        self.url = url
+
+    def run(self, page: Page, action: Callable[[], None], timeout: int) -> None:
+        with page.expect_response(self.url, timeout=timeout):
+            action()
+
+    async def arun(self, page: AsyncPage, action: AsyncAction, timeout: int) -> None:
+        async with page.expect_response(self.url, timeout=timeout):
+            await action()
+
+class ElementWait(WaitStrategy):
+    """Wait for an element to reach a state"""
+
+    name = 'element'
+
+    def __init__(self, selector: Union[str, Element], state: str = 'visible'):
+        """
+        :param selector: Element selector or registered Element
+        :param state: State to wait for (visible, hidden, attached, detached)
+        """
+        self.selector = selector
+        self.state = state
+
+    def run(self, page: Page, action: Callable[[], None], timeout: int) -> None:
+        action()
+        self._locate(page).wait_for(state=self.state, timeout=timeout)
+
+    async def arun(self, page: AsyncPage, action: AsyncAction, timeout: int) -> None:
+        await action()
+        await self._locate(page).wait_for(state=self.state, timeout=timeout)
+
+    def _locate(self, page: Union[Page, AsyncPage]):
+        if isinstance(self.selector, Element):
+            return self.selector.resolve(page)
+        return page.locator(self.selector)
@@ -4,19 +4,76 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0,str(project_root))
 
+import asyncio
+import itertools
+import json
+import os
+import time
 import pytest
 import logging
 from datetime import datetime
-from typing import Generator, Dict, Any
+from typing import Generator, Callable, Awaitable, List, Dict, Any, Optional
 from configs.settings import config
 from playwright.sync_api import Playwright, Page, Browser, BrowserContext, sync_playwright
-from pages.register_page import RegisterPage
-from utils.logger import setup_logger
+from playwright.async_api import (async_playwright, Browser as AsyncBrowser,
+                                  BrowserContext as AsyncBrowserContext, Page as AsyncPage)
+from utils.logger import setup_logger, shutdown_logging
+from utils.network_log import NetworkRingBuffer
+from utils.artifacts import ArtifactRecorder
 from utils.db_helper import DatabaseHelper
+from utils.auth_cache import AuthStateCache
+from utils.seeder import UserSeeder
+from utils.api_client import MyDriveClient
+from utils.workers import is_parallel, worker_index
+from utils.context_pool import ContextPool
+from utils.async_loop import AsyncLoopThread
+from utils.timing import timer as action_timer
+from utils.perf_metrics import perf_recorder
+from utils.file_factory import FileFactory
+from utils.hashing import HashCache
+from utils.benchmark import BenchmarkRecorder
+from utils.test_history import TestHistory, prioritize, select_within_budget
+from utils.sharding import ShardPlanner, parse_shard, write_manifest, record_actuals, manifest_path
+from utils.fake_server import FakeMyDriveServer
+from utils.request_router import RequestRouter, AssetCache, resolve_app_version
+from utils.throttling import ThrottleProfile, Throttler, resolve_profile, set_active_profile, NO_THROTTLE
 from configs.test_data import test_data
 
 logger = setup_logger(__name__)
 
+CONTEXT_POOL_STATS = pytest.StashKey[Dict[str, int]]()
+REQUEST_ROUTER_STATS = pytest.StashKey[Dict[str, Any]]()
+SESSION_STARTED = pytest.StashKey[float]()
+FAKE_SERVER_STATS = pytest.StashKey[Dict[str, Any]]()
+
+# Generated users created by fixtures start at this index, clear of the
+# indexes tests use for test_data.users()
+FIXTURE_USER_INDEXES = itertools.count(10000)
+
+# Durations and outcomes of earlier runs, used to order and trim the tests
+test_history = TestHistory()
+
+@pytest.fixture(scope="session", autouse=True)
+def fake_server(request) -> Generator[Optional[FakeMyDriveServer], None, None]:
+    """
+    Serve the app from the in-process fake myDrive when FAKE_SERVER is enabled.
+    Runs before every other session fixture so they all see its url
+    """
+    if not config.fake_server:
+        yield None
+        return
+
+    server = FakeMyDriveServer(latency=config.fake_server_latency / 1000).start()
+    original_urls = config.base_url, config.api_url
+    config.base_url = config.api_url = server.url
+
+    yield server
+
+    request.config.stash[FAKE_SERVER_STATS] = server.stats()
+    config.base_url, config.api_url = original_urls
+    server.stop()
+
+
 @pytest.fixture(scope="session")
 def playwright_instance() -> Generator[Playwright, None, None]:
     """
@@ -39,10 +96,65 @@ def browser(playwright_instance: Playwright) -> Generator[Browser, None, None]:
     browser.close()
 
 
+@pytest.fixture(scope="session")
+def auth_cache(browser: Browser) -> AuthStateCache:
+    """
+    Create the storage state cache used by authenticated tests
+    """
+    return AuthStateCache(browser)
+
+
 @pytest.fixture(scope="function")
-def context(browser: Browser) -> Generator[BrowserContext, None, None]:
+def auth_user(request) -> Optional[Dict[str, Any]]:
     """
-    Create a browser context for each test function
+    Resolve the user requested by the authenticated marker, if any.
+    Usage: @pytest.mark.authenticated or @pytest.mark.authenticated(1)
+    where the argument indexes test_data.VALID_USERS
+    """
+    marker = request.node.get_closest_marker("authenticated")
+    if marker is None:
+        return None
+    index = marker.args[0] if marker.args else marker.kwargs.get("user", 0)
+    return test_data.VALID_USERS[index]
+
+
+@pytest.fixture(scope="function")
+def throttle_profile(request) -> Generator[ThrottleProfile, None, None]:
+    """
+    Resolve the throttling profile of a test, from the throttle marker or
+    else THROTTLE_PROFILE, and mark it active so results are tagged with it
+    Usage: @pytest.mark.throttle("3g") or @pytest.mark.throttle("slow-4g+cpu-4x")
+    """
+    marker = request.node.get_closest_marker("throttle")
+    spec = marker.args[0] if marker and marker.args else config.throttle_profile
+    profile = resolve_profile(spec)
+    set_active_profile(profile)
+
+    yield profile
+
+    set_active_profile(NO_THROTTLE)
+
+
+@pytest.fixture(scope="function")
+def throttler(throttle_profile: ThrottleProfile) -> Throttler:
+    """Create the throttler applying the test's profile to its pages"""
+    return Throttler(throttle_profile)
+
+
+def test_failed(node) -> bool:
+    """
+    Check whether a test failed during setup or its call phase
+
+    :param node: Test item, populated by pytest_runtest_makereport
+    :returns: True if the test failed
+    """
+    return any(getattr(getattr(node, f"rep_{when}", None), 'failed', False)
+               for when in ('setup', 'call'))
+
+
+def build_context_options() -> Dict[str, Any]:
+    """
+    Get the browser context options with permission names normalised
     """
     context_options = config.get_browser_context_options()
 
@@ -56,81 +168,577 @@ def context(browser: Browser) -> Generator[BrowserContext, None, None]:
                 valid_permissions.append(perm)
         context_options['permissions'] = valid_permissions
 
-    context = browser.new_context(**context_options)
+    return context_options
+
+
+@pytest.fixture(scope="session")
+def context_pool(request, browser: Browser) -> Generator[Optional[ContextPool], None, None]:
+    """
+    Create the pre-warmed context pool when CONTEXT_POOL_SIZE is set
+    """
+    if config.context_pool_size <= 0:
+        yield None
+        return
+
+    pool = ContextPool(browser, config.context_pool_size, build_context_options())
+    pool.warm()
+
+    yield pool
+
+    pool.close()
+    request.config.stash[CONTEXT_POOL_STATS] = pool.stats
+
 
-    # Setup request/response logging
-    context.on("request", lambda request: logger.debug(f"Request: {request.method} {request.url}"))
-    context.on("response", lambda response: logger.debug(f"Response: {response.status} {response.url}"))
+@pytest.fixture(scope="session")
+def request_router(request) -> Generator[Optional[RequestRouter], None, None]:
+    """
+    Create the routing layer when ASSET_CACHE or BLOCK_URL_PATTERNS is set
+    """
+    if not (config.asset_cache_enabled or config.block_url_patterns):
+        yield None
+        return
+
+    asset_cache = None
+    if config.asset_cache_enabled:
+        version = resolve_app_version()
+        asset_cache = AssetCache(version) if version else None
+
+    router = RequestRouter(asset_cache, config.block_url_patterns)
+
+    yield router
+
+    if asset_cache:
+        asset_cache.save()
+    logger.info(f"Request router stats: {router.stats}")
+    request.config.stash[REQUEST_ROUTER_STATS] = {**router.stats, 'hit_ratio': router.hit_ratio()}
+
+
+@pytest.fixture(scope="session")
+def artifacts() -> Generator[ArtifactRecorder, None, None]:
+    """
+    Create the recorder for failure traces, screenshots and DOM snapshots
+    """
+    recorder = ArtifactRecorder()
+    yield recorder
+    recorder.close()
+
+
+@pytest.fixture(scope="function")
+def context(request, browser: Browser, context_pool: Optional[ContextPool], auth_cache: AuthStateCache,
+            auth_user: Optional[Dict[str, Any]], request_router: Optional[RequestRouter],
+            artifacts: ArtifactRecorder) -> Generator[BrowserContext, None, None]:
+    """
+    Create a browser context for each test function
+    Tests marked as authenticated start from the user's cached storage state,
+    every other test borrows a context from the pool when one is configured
+    """
+    pooled = context_pool is not None and not auth_user
+
+    if pooled:
+        context = context_pool.acquire()
+    else:
+        context_options = build_context_options()
+        if auth_user:
+            context_options['storage_state'] = auth_cache.storage_state(auth_user)
+        context = browser.new_context(**context_options)
+
+    if request_router:
+        request_router.install(context)
+
+    # Capture request/response events, only formatted if the test fails
+    network_log = NetworkRingBuffer()
+    context.on("request", network_log.on_request)
+    context.on("response", network_log.on_response)
 
-    # context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    artifacts.start(context, request.node.nodeid)
 
     yield context
 
-    # context.tracing.stop()
-    context.close()
+    failed = test_failed(request.node)
+    artifacts.stop(context, request.node.nodeid, failed)
+    context.remove_listener("request", network_log.on_request)
+    context.remove_listener("response", network_log.on_response)
+
+    if failed:
+        path = network_log.flush(request.node.nodeid)
+        logger.info(f"Wrote network log for failed test to {path}")
+
+    if pooled:
+        context_pool.release(context)
+    else:
+        context.close()
 
 
 @pytest.fixture(scope="function")
-def page(context: BrowserContext) -> Generator[Page, None, None]:
+def page(request, context: BrowserContext, auth_cache: AuthStateCache,
+         auth_user: Optional[Dict[str, Any]], artifacts: ArtifactRecorder,
+         throttler: Throttler) -> Generator[Page, None, None]:
     """
     Create a page for each test function
+    Unauthenticated tests navigate themselves, so the page starts blank.
+    The test's throttling profile is applied before anything loads; tests
+    marked with throttle are skipped where it cannot be applied
     """
     page = context.new_page()
     page.set_default_timeout(config.default_timeout)
-    page.goto(config.base_url)
+
+    if not throttler.apply(page):
+        # Results of an unthrottled page must not be tagged with the profile
+        set_active_profile(NO_THROTTLE)
+        if request.node.get_closest_marker("throttle"):
+            page.close()
+            pytest.skip(f"Throttle profile '{throttler.profile}' needs CDP, which only Chromium provides")
+
+    if auth_user:
+        auth_cache.ensure_authenticated(page, auth_user)
 
     yield page
 
-    # TODO Take screenshot of page on failure
+    if test_failed(request.node):
+        artifacts.capture_page(page, request.node.nodeid)
 
     page.close()
 
 
+@pytest.fixture(scope="session")
+def async_loop() -> Generator[AsyncLoopThread, None, None]:
+    """
+    Create the event loop that runs the async browser and async tests.
+    It has a thread of its own because the sync browser claims this thread's loop
+    Usage: async_loop.run(coroutine)
+    """
+    loop = AsyncLoopThread('async-playwright').start()
+    yield loop
+    loop.stop()
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_loop: AsyncLoopThread) -> Generator[AsyncBrowser, None, None]:
+    """
+    Create an async browser instance for the test session, on the async loop
+    """
+    playwright = async_loop.run(async_playwright().start())
+    browser_type = getattr(playwright, config.browser)
+    browser = async_loop.run(browser_type.launch(**config.get_browser_launch_options()))
+
+    yield browser
+
+    async_loop.run(browser.close())
+    async_loop.run(playwright.stop())
+
+
+@pytest.fixture(scope="function")
+def async_context(async_loop: AsyncLoopThread,
+                  async_browser: AsyncBrowser) -> Generator[AsyncBrowserContext, None, None]:
+    """
+    Create an async browser context for each test function
+    """
+    context = async_loop.run(async_browser.new_context(**build_context_options()))
+
+    yield context
+
+    async_loop.run(context.close())
+
+
+@pytest.fixture(scope="function")
+def async_page(async_loop: AsyncLoopThread,
+               async_context: AsyncBrowserContext) -> Generator[AsyncPage, None, None]:
+    """
+    Create an async page for each test function
+    """
+    async def new_page() -> AsyncPage:
+        # Page calls must stay on the loop thread that owns the connection
+        page = await async_context.new_page()
+        page.set_default_timeout(config.default_timeout)
+        return page
+
+    page = async_loop.run(new_page())
+
+    yield page
+
+    async_loop.run(page.close())
+
+
+@pytest.fixture(scope="function")
+def async_pages(async_loop: AsyncLoopThread,
+                async_browser: AsyncBrowser) -> Generator[Callable[[int], Awaitable[List[AsyncPage]]], None, None]:
+    """
+    Factory that opens isolated pages, one context each, for multi-user tests
+    Usage, in a coroutine run on async_loop: pages = await async_pages(10)
+    """
+    contexts: List[AsyncBrowserContext] = []
+
+    async def open_pages(count: int) -> List[AsyncPage]:
+        new_contexts = await asyncio.gather(
+            *(async_browser.new_context(**build_context_options()) for _ in range(count))
+        )
+        contexts.extend(new_contexts)
+        pages = await asyncio.gather(*(context.new_page() for context in new_contexts))
+        for page in pages:
+            page.set_default_timeout(config.default_timeout)
+        return list(pages)
+
+    yield open_pages
+
+    async def close_contexts() -> None:
+        await asyncio.gather(*(context.close() for context in contexts))
+
+    async_loop.run(close_contexts())
+
+
 @pytest.fixture(scope="function", autouse=True)
 def test_setup_teardown(request):
     """Setup and teardown for each test"""
     test_name = request.node.name
     logger.info(f"Starting test: {test_name}")
+    action_timer.current_test = request.node.nodeid
+    perf_recorder.current_test = request.node.nodeid
 
     yield
 
+    # Attach browser performance samples to the test result, e.g. for junitxml
+    perf_samples = perf_recorder.test_samples(request.node.nodeid)
+    if perf_samples:
+        request.node.user_properties.append(("perf_metrics", json.dumps(perf_samples)))
+
     # Mark test failure for screenshot capture
-    if request.node.rep_call.failed:
-        pytest._test_failed = True
-    else:
-        pytest._test_failed = False
+    pytest._test_failed = test_failed(request.node)
 
     logger.info(f"Finished test: {test_name}")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def action_timing_report() -> Generator[None, None, None]:
+    """Write the page object action timing report at the end of the session"""
+    yield
+
+    if config.action_timing_enabled or config.wait_savings_probe:
+        action_timer.write_report()
+    if config.perf_metrics:
+        perf_recorder.write_report()
+
+
 @pytest.fixture(scope="session")
-def db_helper() -> DatabaseHelper:
-    """Create a database helper instance"""
+def db_helper(fake_server: Optional[FakeMyDriveServer]) -> DatabaseHelper:
+    """Create a database helper instance, or use the fake server's in-memory store"""
+    if fake_server:
+        return fake_server.store
     logger.info(f"Connecting to MongoDB with url: {config.mongodb_url}")
     return DatabaseHelper(config.mongodb_url)
 
 
-@pytest.fixture(scope="module", autouse=True)
-def setup_test_users(browser: Browser, db_helper: DatabaseHelper):
-    context = browser.new_context()
-    page = context.new_page()
+@pytest.fixture(scope="session")
+def api_client() -> Generator[MyDriveClient, None, None]:
+    """Create the pooled myDrive API client"""
+    client = MyDriveClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def user_seeder(db_helper: DatabaseHelper, api_client: MyDriveClient) -> Generator[UserSeeder, None, None]:
+    """Create a seeder that registers users over HTTP"""
+    seeder = UserSeeder(db_helper, client=api_client)
+    yield seeder
+    seeder.close()
+
+
+def seed_baseline_users(user_seeder: UserSeeder) -> None:
+    """Seed the users every module expects to exist"""
+    results = user_seeder.seed_users(test_data.VALID_USERS[:1])
+
+    failed = [email for email, status in results.items() if status == UserSeeder.FAILED]
+    if failed:
+        raise RuntimeError(f"Could not seed test users: {failed}")
+    logger.info("Seeding test users successful")
+
+
+@pytest.fixture(scope="session")
+def baseline_snapshot(db_helper: DatabaseHelper, user_seeder: UserSeeder) -> Generator[Optional[str], None, None]:
+    """
+    Capture the baseline database snapshot when DB_SNAPSHOT is enabled, or
+    reuse the one from an earlier run if the schema hash still matches.
+    Restoring swaps whole collections, so it needs a database of its own.
+    The baseline is restored once more at session end
+    """
+    name = _baseline_snapshot(db_helper, user_seeder)
+    yield name
+
+    if name:
+        db_helper.restore_snapshot(name)
 
-    register_page = RegisterPage(page)
-    register_page.navigate_to()
-    
-    test_user = test_data.VALID_USERS[0]
-    register_page.register(test_user['email'], test_user['password'])
-    register_page.logout_after_register()
 
-    logger.info("Register successful")
-    context.close()
+def _baseline_snapshot(db_helper: DatabaseHelper, user_seeder: UserSeeder) -> Optional[str]:
+    if not config.db_snapshot:
+        return None
+    if config.fake_server:
+        logger.warning("DB_SNAPSHOT is not supported with FAKE_SERVER, seeding instead")
+        return None
+    if is_parallel() and not config.db_per_worker:
+        logger.warning("DB_SNAPSHOT needs DB_PER_WORKER when running in parallel, seeding instead")
+        return None
+
+    name = config.db_snapshot_name
+    meta = db_helper.get_snapshot(name)
+    if meta and meta['schema_hash'] == db_helper.schema_hash(meta['collections'], config.app_version):
+        logger.info(f"Reusing database snapshot '{name}' from {meta['created']}")
+        return name
+
+    db_helper.cleanup_test_data()
+    for user in test_data.VALID_USERS:
+        db_helper.delete_test_user(user['email'])
+    seed_baseline_users(user_seeder)
+    db_helper.snapshot(name, version=config.app_version)
+    return name
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup_test_users(user_seeder: UserSeeder, db_helper: DatabaseHelper,
+                     baseline_snapshot: Optional[str]):
+    """
+    Seed the users every module expects to exist. Registration through the UI
+    is only exercised by the tests that check registration itself
+    With DB_SNAPSHOT the baseline is restored in bulk instead, before each
+    module only, as the next module restores it anyway
+    """
+    if baseline_snapshot:
+        db_helper.restore_snapshot(baseline_snapshot)
+    else:
+        seed_baseline_users(user_seeder)
 
     yield
 
+    if baseline_snapshot:
+        return
+
     # Delete test users after test
     logger.info("Deleting users for test teardown...")
-    try:
-        for user in test_data.VALID_USERS:
+    for user in test_data.VALID_USERS:
+        try:
+            db_helper.delete_test_user(user['email'])
+        except Exception as e:
+            logger.warning(f"Could not delete user {user['email']}: {e}")
+
+
+@pytest.fixture(scope="function", autouse=True)
+def restore_db(request) -> None:
+    """
+    Restore the baseline snapshot before tests marked with restore_db
+    """
+    if request.node.get_closest_marker("restore_db") is None:
+        return
+
+    snapshot = request.getfixturevalue("baseline_snapshot")
+    if snapshot:
+        request.getfixturevalue("db_helper").restore_snapshot(snapshot)
+    else:
+        logger.warning("restore_db requested but DB_SNAPSHOT is not enabled")
+
+
+@pytest.fixture(scope="session")
+def hash_cache() -> Generator[HashCache, None, None]:
+    """Create the on-disk cache of source file digests, written once at session end"""
+    cache = HashCache()
+    yield cache
+    cache.flush()
+
+
+@pytest.fixture(scope="session")
+def file_factory(hash_cache: HashCache) -> FileFactory:
+    """Create a factory for deterministic synthetic files"""
+    return FileFactory(hash_cache=hash_cache)
+
+
+@pytest.fixture(scope="function")
+def user_with_files(api_client: MyDriveClient, user_seeder: UserSeeder, db_helper: DatabaseHelper,
+                    file_factory: FileFactory) -> Generator[Callable[..., Dict[str, Any]], None, None]:
+    """
+    Factory creating a fresh user that owns a number of files, all set up
+    through the API. The users are deleted after the test
+    """
+    created = []
+
+    def create(count: int, size: int = 1024) -> Dict[str, Any]:
+        user = test_data.user(next(FIXTURE_USER_INDEXES))
+        user_seeder.seed_users([user])
+        created.append(user)
+
+        sources = [file_factory.create(size, seed=seed) for seed in range(count)]
+        files = api_client.upload_files(user, [source.path for source in sources])
+        logger.info(f"Created {user['email']} with {len(files)} files")
+        return {'user': user, 'files': files, 'sources': sources}
+
+    yield create
+
+    for user in created:
+        api_client.forget(user)
+        try:
+            db_helper.delete_test_user(user['email'])
+        except Exception as e:
+            logger.warning(f"Could not delete user {user['email']}: {e}")
+
+
+@pytest.fixture(scope="function")
+def large_library(user_seeder: UserSeeder,
+                  db_helper: DatabaseHelper) -> Generator[Callable[..., Dict[str, Any]], None, None]:
+    """
+    Factory creating a fresh user whose library of folders and files is
+    bulk inserted straight into the database. The users are deleted after the test
+    """
+    created = []
+
+    def create(files: int, depth: int = config.library_bench_depth,
+               breadth: int = config.library_bench_breadth,
+               root_share: float = config.library_bench_root_share,
+               leaf_share: float = config.library_bench_leaf_share) -> Dict[str, Any]:
+        user = test_data.user(next(FIXTURE_USER_INDEXES))
+        user_seeder.seed_users([user])
+        created.append(user)
+        return {'user': user, **db_helper.seed_library(user['email'], files, depth, breadth,
+                                                       root_share, leaf_share)}
+
+    yield create
+
+    for user in created:
+        try:
             db_helper.delete_test_user(user['email'])
-    except Exception as e:
-        logger.warning(f"Could not delete user {test_user['email']}: {e}")
+        except Exception as e:
+            logger.warning(f"Could not delete user {user['email']}: {e}")
+
+
+@pytest.fixture(scope="session")
+def upload_benchmark() -> Generator[BenchmarkRecorder, None, None]:
+    """Collect upload benchmark samples and write the report at session end"""
+    recorder = BenchmarkRecorder('upload')
+    yield recorder
+    recorder.write_report()
+
+
+@pytest.fixture(scope="session")
+def library_benchmark() -> Generator[BenchmarkRecorder, None, None]:
+    """Collect large-library render benchmark samples and write the report at session end"""
+    recorder = BenchmarkRecorder('library')
+    yield recorder
+    recorder.write_report()
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase's report on the test item as rep_setup/rep_call/rep_teardown"""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--time-budget", type=float, default=None, metavar="MINUTES",
+        help="run only the most valuable tests expected to finish within MINUTES"
+    )
+    parser.addoption(
+        "--shard", type=parse_shard, default=None, metavar="I/N",
+        help="run shard I of N, balanced by recorded test durations"
+    )
+
+
+def pytest_configure():
+    """Share this run's id with xdist workers, which inherit the environment"""
+    os.environ.setdefault('RUN_ID', config.run_id)
+
+
+def pytest_collection_modifyitems(session, items):
+    """Skip benchmarks unless enabled, then order and trim the tests using the run history"""
+    if not config.run_benchmarks:
+        skip_benchmark = pytest.mark.skip(reason="benchmarks run only with RUN_BENCHMARKS=true")
+        for item in items:
+            if item.get_closest_marker("benchmark"):
+                item.add_marker(skip_benchmark)
+
+    if config.reorder_tests:
+        items[:] = prioritize(items, test_history)
+
+    shard = session.config.getoption("shard")
+    if shard:
+        index, count = shard
+        planner = ShardPlanner(test_history)
+        shards = planner.plan(items, count)
+        selected = shards[index - 1]
+        session.config.hook.pytest_deselected(
+            items=[item for s in shards if s is not selected for item in s.items])
+        items[:] = selected.items
+        # xdist workers plan identically, so one of them writes the manifest
+        if worker_index() == 0:
+            write_manifest(selected, shards, planner)
+
+    budget = session.config.getoption("time_budget")
+    if budget:
+        selected, deselected = select_within_budget(items, test_history, budget * 60)
+        if deselected:
+            session.config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+
+def pytest_runtest_logreport(report):
+    """Record test durations and outcomes; under xdist only the controller records"""
+    if not is_parallel():
+        test_history.add_report(report)
+
+
+def pytest_sessionstart(session):
+    session.config.stash[SESSION_STARTED] = time.time()
+
+
+def pytest_sessionfinish(session):
+    """Save the run history and the measured timings of this shard"""
+    if is_parallel():
+        return
+    test_history.save()
+
+    shard = session.config.getoption("shard")
+    if shard:
+        record_actuals(manifest_path(*shard), test_history.session_durations,
+                       time.time() - session.config.stash[SESSION_STARTED])
+
+
+def pytest_unconfigure():
+    """Flush the queued log records before the process exits"""
+    shutdown_logging()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus):
+    """Report harness statistics gathered during the session"""
+    stash = terminalreporter.config.stash
+
+    pool_stats = stash.get(CONTEXT_POOL_STATS, None)
+    if pool_stats:
+        terminalreporter.write_sep("-", "browser context pool")
+        terminalreporter.write_line(
+            f"size={pool_stats['size']} hits={pool_stats['hits']} "
+            f"misses={pool_stats['misses']} reset_failures={pool_stats['reset_failures']}"
+        )
+
+    router_stats = stash.get(REQUEST_ROUTER_STATS, None)
+    if router_stats:
+        terminalreporter.write_sep("-", "request router")
+        terminalreporter.write_line(
+            f"asset hits={router_stats['hits']} misses={router_stats['misses']} "
+            f"hit_ratio={router_stats['hit_ratio']:.1%} "
+            f"bytes_saved={router_stats['bytes_saved']} blocked={router_stats['blocked']}"
+        )
+
+    server_stats = stash.get(FAKE_SERVER_STATS, None)
+    if server_stats:
+        terminalreporter.write_sep("-", "fake myDrive server")
+        terminalreporter.write_line(
+            f"requests={server_stats['requests']} "
+            f"handler_seconds={server_stats['handler_seconds']:.2f} "
+            f"injected_latency_seconds={server_stats['injected_seconds']:.2f}"
+        )
+
+    if config.wait_savings_probe and action_timer.wait_savings:
+        terminalreporter.write_sep("-", "wait strategy savings vs networkidle")
+        for strategy, saved in sorted(action_timer.wait_savings.items()):
+            terminalreporter.write_line(
+                f"{strategy}: {len(saved)} waits, {sum(saved):.2f}s saved "
+                f"({sum(saved) / len(saved) * 1000:.0f} ms avg)"
+            )
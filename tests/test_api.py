@@ -0,0 +1,100 @@
+"""
+This module contains fast tests of myDrive's REST endpoints through the
+pooled API client, without a browser.
+"""
+
+import pytest
+import logging
+from utils.api_client import MyDriveClient, APIError
+from utils.file_factory import FileFactory
+from configs.test_data import test_data
+
+logger = logging.getLogger(__name__)
+
+@pytest.mark.api
+class TestAPI:
+    """Test suite for the myDrive API"""
+
+    @pytest.mark.smoke
+    def test_login_returns_token(self, api_client: MyDriveClient) -> None:
+        """
+        Test that a seeded user can log in and reuse the token.
+
+        Steps:
+        1. Log in with valid credentials
+        2. Fetch the user's account with the cached token
+        """
+        user = test_data.VALID_USERS[0]
+        api_client.forget(user)
+
+        assert api_client.login(user['email'], user['password']), "Login should return a token"
+        assert api_client.current_user(user)['email'] == user['email']
+
+    @pytest.mark.smoke
+    def test_login_with_wrong_password(self, api_client: MyDriveClient) -> None:
+        """
+        Test that login is rejected with a wrong password.
+
+        Steps:
+        1. Log in with a valid email and a wrong password
+        2. Verify the API answers with an error status
+        """
+        user = test_data.VALID_USERS[0]
+
+        with pytest.raises(APIError) as error:
+            api_client.login(user['email'], user['password'] + 'wrong')
+        assert error.value.status_code in (400, 401, 403)
+
+    @pytest.mark.regression
+    def test_upload_download_roundtrip(self, api_client: MyDriveClient,
+                                      file_factory: FileFactory) -> None:
+        """
+        Test that a streamed upload downloads byte for byte.
+
+        Steps:
+        1. Upload a generated file
+        2. Download it, hashing it as it streams in
+        3. Verify size and digest match the source
+        4. Delete the file
+        """
+        user = test_data.VALID_USERS[0]
+        source = file_factory.create(2 * 1024 ** 2, seed=21)
+
+        uploaded = api_client.upload_file(user, source.path)
+        try:
+            download = api_client.download_file(user, uploaded['_id'])
+            assert download['size'] == source.size, "Downloaded size should match the upload"
+            assert download['digest'] == source.digest, "Downloaded content should match the upload"
+            logger.info(f"Round trip of {source.name} downloaded at {download['mb_per_s']:.1f} MB/s")
+        finally:
+            api_client.delete_file(user, uploaded['_id'])
+
+    @pytest.mark.regression
+    def test_list_files_of_user_with_files(self, api_client: MyDriveClient, user_with_files) -> None:
+        """
+        Test that the file list shows every file a user owns.
+
+        Steps:
+        1. Create a user owning 25 files through the API
+        2. Verify the file list contains all of them
+        """
+        owner = user_with_files(25)
+
+        listed = {file['_id'] for file in api_client.list_files(owner['user'])}
+        assert {file['_id'] for file in owner['files']} <= listed, "Every uploaded file should be listed"
+
+    @pytest.mark.regression
+    def test_create_folder(self, api_client: MyDriveClient, user_with_files) -> None:
+        """
+        Test that a created folder is listed.
+
+        Steps:
+        1. Create a user without files
+        2. Create a folder
+        3. Verify the folder list contains it
+        """
+        owner = user_with_files(0)
+
+        folder = api_client.create_folder(owner['user'], 'api-folder')
+        names = [f['name'] for f in api_client.list_folders(owner['user'])]
+        assert folder['name'] in names, "Created folder should be listed"
@@ -42,6 +42,31 @@ class TestAuthentication:
         # Make sure the user is logged out in preparation for the next test
         login_page.logout()
 
+    @pytest.mark.regression
+    @pytest.mark.parametrize("profile", [
+        pytest.param(profile, marks=pytest.mark.throttle(profile)) for profile in ("3g", "slow-4g+cpu-4x")
+    ])
+    def test_login_on_slow_connection(self, page: Page, profile: str) -> None:
+        """
+        Test that login and logout work for users on slow links and devices.
+
+        Steps:
+        1. Navigate to login page under the throttling profile
+        2. Log in with valid credentials
+        3. Verify redirect to home page
+        4. Log out
+        """
+        login_page = LoginPage(page)
+        login_page.navigate_to()
+
+        user = test_data.VALID_USERS[0]
+        login_page.login(user['email'], user['password'])
+
+        assert login_page.is_logged_in(), f"User should be logged in under {profile}"
+        logger.info(f"Verified login under throttle profile {profile}.")
+
+        login_page.logout()
+
     @pytest.mark.smoke
     def test_login_with_invalid_email(self, page: Page) -> None:
         """
@@ -0,0 +1,56 @@
+"""
+This module contains multi-user tests that drive several browser sessions
+concurrently from one process using the async page objects. The async
+flows run on the async_loop thread, apart from the sync browser's loop.
+"""
+
+import asyncio
+import pytest
+import logging
+from playwright.async_api import Page
+from pages.async_login_page import AsyncLoginPage
+from utils.db_helper import DatabaseHelper
+from utils.seeder import UserSeeder
+from utils.async_loop import AsyncLoopThread
+from configs.test_data import test_data
+
+logger = logging.getLogger(__name__)
+
+class TestConcurrentSessions:
+    """Test suite for concurrent multi-user sessions"""
+
+    USER_COUNT = 5
+
+    @pytest.mark.regression
+    def test_concurrent_logins(self, async_loop: AsyncLoopThread, async_pages,
+                               user_seeder: UserSeeder, db_helper: DatabaseHelper) -> None:
+        """
+        Test that several users can log in at the same time.
+
+        Steps:
+        1. Seed a handful of users through the API
+        2. Open one isolated page per user
+        3. Log every user in concurrently
+        4. Verify each page reached its user's home page
+        """
+        users = list(test_data.users(self.USER_COUNT))
+        user_seeder.seed_users(users)
+
+        async def login(page: Page, user) -> bool:
+            login_page = AsyncLoginPage(page)
+            await login_page.navigate_to()
+            await login_page.login(user['email'], user['password'])
+            return await login_page.is_logged_in()
+
+        async def login_all() -> list:
+            pages = await async_pages(len(users))
+            return await asyncio.gather(*(login(page, user) for page, user in zip(pages, users)))
+
+        try:
+            results = async_loop.run(login_all())
+
+            assert all(results), "Every concurrent user should be logged in"
+            logger.info(f"Verified {len(users)} concurrent logins were successful.")
+        finally:
+            for user in users:
+                db_helper.delete_test_user(user['email'])
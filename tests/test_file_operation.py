@@ -9,6 +9,8 @@ from playwright.sync_api import Page, expect, Browser
 from pages.register_page import RegisterPage 
 from pages.home_page import HomePage
 from utils.db_helper import DatabaseHelper
+from utils.file_factory import FileFactory
+from configs.settings import config
 from configs.test_data import test_data
 
 logger = logging.getLogger(__name__)
@@ -17,7 +19,8 @@ class TestFileOperation:
     """Test suite for file management features"""
 
     @pytest.mark.regression
-    def test_file_upload(self, page: Page) -> None:
+    @pytest.mark.authenticated
+    def test_file_upload(self, page: Page, file_factory: FileFactory) -> None:
         """
         Test successful file upload.
 
@@ -31,8 +34,68 @@ class TestFileOperation:
         4. Verify file is uploaded and visible on the home page
         """
         home_page = HomePage(page)
-        home_page.navigate_to()
 
         # Upload file
-        pass
+        upload = file_factory.create(16 * 1024, name="upload_test.bin")
+        home_page.upload_file(str(upload.path))
 
+        # Verify file is listed
+        home_page.wait_for_file_visible(upload.name)
+        logger.info("Verified uploaded file is visible on the home page")
+
+    @pytest.mark.regression
+    @pytest.mark.authenticated
+    @pytest.mark.parametrize("profile", [
+        pytest.param(profile, marks=pytest.mark.throttle(profile)) for profile in ("3g", "slow-4g+cpu-4x")
+    ])
+    def test_file_upload_on_slow_connection(self, page: Page, file_factory: FileFactory,
+                                            profile: str) -> None:
+        """
+        Test that uploads complete for users on slow links and devices.
+
+        Prerequisites:
+        - User is logged in
+
+        Steps:
+        1. Navigate to home page under the throttling profile
+        2. Upload a generated file
+        3. Verify the upload succeeds and the file is visible on the home page
+        """
+        home_page = HomePage(page)
+
+        upload = file_factory.create(256 * 1024, seed=24, name=f"upload_throttled_{profile}.bin")
+        with page.expect_response(HomePage.UPLOAD_RESPONSE, timeout=config.upload_timeout) as response_info:
+            home_page.upload_file(str(upload.path))
+        assert response_info.value.ok, f"Upload should succeed under {profile}"
+
+        home_page.wait_for_file_visible(upload.name, timeout=config.upload_timeout)
+        logger.info(f"Verified upload under throttle profile {profile}.")
+
+    @pytest.mark.regression
+    @pytest.mark.authenticated
+    def test_file_download_integrity(self, page: Page, file_factory: FileFactory,
+                                     record_property) -> None:
+        """
+        Test that a downloaded file matches the uploaded bytes.
+
+        Prerequisites:
+        - User is logged in
+
+        Step:
+        1. Upload a generated file with a known digest
+        2. Download it from the file list
+        3. Verify the SHA-256 of the download matches the source
+        """
+        home_page = HomePage(page)
+
+        source = file_factory.create(256 * 1024, seed=12, name="download_test.bin")
+        home_page.upload_file(str(source.path))
+        home_page.wait_for_file_visible(source.name)
+
+        result = home_page.download_file(source.name)
+        record_property("download_mb_per_s", round(result['mb_per_s'], 3))
+        logger.info(f"Downloaded {result['size']} bytes at {result['mb_per_s']:.2f} MB/s")
+
+        assert result['size'] == source.size, "Downloaded size should match the upload"
+        assert result['digest'] == source.digest, "Downloaded content should match the upload"
+        logger.info("Verified downloaded file matches the uploaded file")
@@ -0,0 +1,80 @@
+"""
+This module contains the large-library render benchmark. Users with
+thousands of files in nested folders are bulk seeded into the database,
+then the time to render and scroll the home page and each folder view
+along one branch of the tree is measured.
+"""
+
+import time
+import pytest
+import logging
+from playwright.sync_api import Page
+from pages.login_page import LoginPage
+from pages.home_page import HomePage
+from configs.settings import config
+from utils.benchmark import BenchmarkRecorder
+
+logger = logging.getLogger(__name__)
+
+LIBRARY_SIZES = [int(files) for files in config.library_bench_files.split(',') if files.strip()]
+
+@pytest.mark.benchmark
+class TestLibraryBenchmark:
+    """Benchmark suite for rendering large libraries"""
+
+    @pytest.mark.parametrize("files", LIBRARY_SIZES, ids=lambda files: f"{files}files")
+    def test_library_render(self, page: Page, files: int, large_library,
+                            library_benchmark: BenchmarkRecorder) -> None:
+        """
+        Benchmark the home page and folder views of a large library
+
+        Steps:
+        1. Bulk seed a user with the given number of files in nested folders,
+           most of them at the root and in the deepest folder of one branch
+        2. Log in and time until the home page lists its first file
+        3. Scroll the home page file list to the bottom
+        4. Open each folder along one branch, timing render and scroll
+        """
+        library = large_library(files)
+        bucket = f"{files} files"
+        library_benchmark.metadata.update(depth=config.library_bench_depth,
+                                          breadth=config.library_bench_breadth,
+                                          root_share=config.library_bench_root_share,
+                                          leaf_share=config.library_bench_leaf_share)
+
+        login_page = LoginPage(page)
+        login_page.navigate_to()
+        login_page.login(library['user']['email'], library['user']['password'])
+        assert login_page.is_logged_in(), "Seeded user should be logged in"
+
+        home_page = HomePage(page)
+        views = [('/', 0)] + [(folder_id, depth) for depth, folder_id in enumerate(library['branch'], 1)]
+        for folder_id, depth in views:
+            start = time.perf_counter()
+            if folder_id == '/':
+                home_page.navigate_to(f"{config.base_url.rstrip('/')}/home")
+            else:
+                home_page.open_folder(folder_id)
+            # The newest file is listed first; a view may be left empty by the layout
+            probe = library['sample_files'].get(folder_id)
+            if probe:
+                home_page.wait_for_file_visible(probe)
+            else:
+                page.wait_for_load_state()
+            render = time.perf_counter() - start
+
+            scroll = home_page.scroll_file_list()
+            library_benchmark.record(
+                bucket,
+                view='home' if folder_id == '/' else 'folder',
+                depth=depth,
+                view_files=library['view_files'][folder_id],
+                seed_s=library['elapsed'],
+                render_s=render,
+                scroll_s=scroll['seconds'],
+                scroll_steps=scroll['steps'],
+                scroll_height=scroll['scroll_height']
+            )
+            logger.info(f"{bucket}, depth {depth} ({library['view_files'][folder_id]} files): "
+                        f"rendered in {render:.2f}s, "
+                        f"scrolled {scroll['steps']} steps in {scroll['seconds']:.2f}s")
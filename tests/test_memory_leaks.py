@@ -0,0 +1,53 @@
+"""
+This module contains the soak-style memory leak check. The login, home and
+logout flow is repeated many times in one page while the JS heap, DOM node
+and event listener counts are sampled, as in a myDrive tab left open for days.
+"""
+
+import pytest
+import logging
+from playwright.sync_api import Page
+from pages.login_page import LoginPage
+from pages.home_page import HomePage
+from utils.leak_detector import LeakDetector
+from configs.test_data import test_data
+
+logger = logging.getLogger(__name__)
+
+@pytest.mark.benchmark
+class TestMemoryLeaks:
+    """Memory leak suite for long-lived pages"""
+
+    def test_login_logout_cycles(self, page: Page) -> None:
+        """
+        Check that repeated login and logout cycles do not grow memory
+
+        Steps:
+        1. Navigate to the login page
+        2. Repeat: log in, wait for the home page, log out, wait for the login form
+        3. After each cycle force GC and sample heap, DOM nodes and listeners
+        4. Verify no metric grows faster than its per-cycle threshold
+        """
+        detector = LeakDetector(page)
+        if not detector.supported:
+            pytest.skip("Leak detection needs CDP, which only Chromium provides")
+
+        user = test_data.VALID_USERS[0]
+        login_page = LoginPage(page)
+        home_page = HomePage(page)
+        login_page.navigate_to()
+
+        def cycle() -> None:
+            login_page.login(user['email'], user['password'])
+            assert login_page.is_logged_in(), "User should be logged in"
+            home_page.wait_for_element(HomePage.QUICK_ACCESS)
+            home_page.logout()
+            login_page.wait_for_element(LoginPage.EMAIL_INPUT)
+
+        detector.run(cycle)
+        path = detector.write_report('login_logout')
+        logger.info(f"Wrote leak report to {path}, growth per cycle: {detector.trend()}")
+
+        leaks = detector.leaks()
+        assert not leaks, (f"Memory grew past its threshold per cycle: {leaks}, "
+                           f"heap snapshot at {detector.snapshot_path}")
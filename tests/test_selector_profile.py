@@ -0,0 +1,68 @@
+"""
+This module profiles the registered page element selectors against the
+live app, writing resolution times, match counts and flags for every
+selector on the login, registration and home flows to reports/selectors.
+"""
+
+import pytest
+import logging
+from playwright.sync_api import Page
+from pages.login_page import LoginPage
+from pages.register_page import RegisterPage
+from pages.home_page import HomePage
+from utils.selector_profiler import SelectorProfiler
+
+logger = logging.getLogger(__name__)
+
+@pytest.mark.benchmark
+class TestSelectorProfile:
+    """Profiling suite for page element selectors"""
+
+    def test_profile_login_and_register(self, page: Page) -> None:
+        """
+        Profile the selectors of the signed-out pages
+
+        Steps:
+        1. Navigate to the login page and profile its elements
+        2. Open the registration form and profile its elements
+        3. Verify every profiled selector matched an element
+        """
+        login_page = LoginPage(page)
+        login_page.navigate_to()
+
+        profiler = SelectorProfiler(page)
+        profiler.profile_page('login')
+
+        RegisterPage(page).locator(RegisterPage.CREATE_ACCOUNT_LINK).click()
+        profiler.profile_page('register', keys=['EMAIL_INPUT', 'PASSWORD_INPUT',
+                                                'VERIFY_PASSWORD_INPUT', 'CREATE_BUTTON'])
+
+        path = profiler.write_report('signed_out')
+        logger.info(f"Wrote selector profile to {path}")
+
+        unmatched = [r['element'] for r in profiler.results if 'unmatched' in r['flags']]
+        assert not unmatched, f"Selectors matched nothing: {unmatched}"
+
+    @pytest.mark.authenticated
+    def test_profile_home(self, page: Page) -> None:
+        """
+        Profile the selectors of the signed-in pages
+
+        Steps:
+        1. Start from the home page of a signed-in user and profile its elements
+        2. Open the account menu and profile the header elements
+        3. Verify every profiled selector matched an element
+        """
+        home_page = HomePage(page)
+
+        profiler = SelectorProfiler(page)
+        profiler.profile_page('home', keys=['QUICK_ACCESS', 'ADD_NEW'])
+
+        home_page.locator(HomePage.ACCOUNT_MENU).click()
+        profiler.profile_page('header', keys=['ACCOUNT_MENU', 'LOGOUT_BUTTON'])
+
+        path = profiler.write_report('signed_in')
+        logger.info(f"Wrote selector profile to {path}")
+
+        unmatched = [r['element'] for r in profiler.results if 'unmatched' in r['flags']]
+        assert not unmatched, f"Selectors matched nothing: {unmatched}"
@@ -0,0 +1,59 @@
+"""
+This module contains the upload throughput benchmark. Synthetic files of
+configurable size and count are uploaded through the home page, measuring
+MB/s and the time until each file is visible in the file list.
+"""
+
+import time
+import pytest
+import logging
+from playwright.sync_api import Page
+from pages.home_page import HomePage
+from configs.settings import config
+from utils.benchmark import BenchmarkRecorder
+from utils.file_factory import FileFactory, parse_size, format_size
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_SIZES = [parse_size(size) for size in config.upload_bench_sizes.split(',') if size.strip()]
+
+@pytest.mark.benchmark
+class TestUploadBenchmark:
+    """Benchmark suite for the upload path"""
+
+    @pytest.mark.authenticated
+    @pytest.mark.parametrize("size", UPLOAD_SIZES, ids=format_size)
+    def test_upload_throughput(self, page: Page, size: int, file_factory: FileFactory,
+                               upload_benchmark: BenchmarkRecorder) -> None:
+        """
+        Benchmark uploading files of one size bucket
+
+        Steps:
+        1. Generate UPLOAD_BENCH_COUNT files of the given size
+        2. Upload each file through the home page
+        3. Record the upload time, MB/s and time until the file is listed
+        """
+        home_page = HomePage(page)
+        upload_benchmark.metadata['sparse'] = file_factory.sparse
+
+        for seed in range(config.upload_bench_count):
+            synthetic = file_factory.create(size, seed=seed)
+
+            start = time.perf_counter()
+            with page.expect_response(HomePage.UPLOAD_RESPONSE, timeout=config.upload_timeout):
+                home_page.upload_file(str(synthetic.path))
+            uploaded = time.perf_counter() - start
+
+            home_page.wait_for_file_visible(synthetic.name, timeout=config.upload_timeout)
+            visible = time.perf_counter() - start
+
+            mb_per_s = size / (1024 ** 2) / uploaded if uploaded else 0.0
+            upload_benchmark.record(
+                format_size(size),
+                file=synthetic.name,
+                bytes=size,
+                upload_s=uploaded,
+                time_to_visible_s=visible,
+                mb_per_s=mb_per_s
+            )
+            logger.info(f"Uploaded {synthetic.name} at {mb_per_s:.2f} MB/s, visible after {visible:.2f}s")
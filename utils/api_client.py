@@ -0,0 +1,306 @@
+"""
+Module with an HTTP client for myDrive's REST endpoints. One pooled,
+keep-alive requests session serves every user and thread; each user's
+access token is obtained once and reused. Uploads are streamed as
+multipart bodies and downloads are hashed while they arrive, so file
+size never affects memory use.
+"""
+
+import logging
+import mimetypes
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+import requests
+from requests.adapters import HTTPAdapter
+from configs.settings import config
+from utils.hashing import StreamingHasher, DEFAULT_ALGORITHM
+
+logger = logging.getLogger(__name__)
+
+class APIError(Exception):
+    """Raised when myDrive answers a request with an error status"""
+
+    def __init__(self, response: requests.Response):
+        self.response = response
+        self.status_code = response.status_code
+        super().__init__(f"{response.request.method} {response.url} failed: "
+                         f"{response.status_code} {response.text[:200]}")
+
+class MultipartFileStream:
+    """
+    multipart/form-data body for a single file, produced chunk by chunk.
+    The total length is known up front so the upload is sent with a
+    Content-Length rather than chunked transfer encoding
+    """
+
+    def __init__(self, path: Union[str, Path], field: str = 'file', filename: Optional[str] = None,
+                chunk_size: int = 1024 ** 2):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.boundary = secrets.token_hex(16)
+        filename = filename or self.path.name
+        content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._head) + os.path.getsize(self.path) + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        with open(self.path, 'rb') as f:
+            while chunk := f.read(self.chunk_size):
+                yield chunk
+        yield self._tail
+
+class MyDriveClient:
+    """
+    Client for myDrive's user, file and folder endpoints
+    """
+
+    LOGIN_PATH = '/user-service/login'
+    REGISTER_PATH = '/user-service/create'
+    USER_PATH = '/user-service/user'
+    UPLOAD_PATH = '/file-service/upload'
+    FILE_LIST_PATH = '/file-service/list'
+    DOWNLOAD_PATH = '/file-service/download/{file_id}'
+    REMOVE_FILE_PATH = '/file-service/remove/{file_id}'
+    FOLDER_CREATE_PATH = '/folder-service/create'
+    FOLDER_LIST_PATH = '/folder-service/list'
+
+    TOKEN_COOKIE = 'access-token'
+
+    def __init__(self, api_url: Optional[str] = None, pool_size: Optional[int] = None,
+                timeout: Optional[float] = None):
+        """
+        :param api_url: myDrive url, defaults to API_URL
+        :param pool_size: Connections kept alive, defaults to SEED_WORKERS
+        :param timeout: Request timeout in seconds, defaults to DEFAULT_TIMEOUT
+        """
+        self.api_url = (api_url or config.api_url).rstrip('/')
+        self.pool_size = pool_size or config.seed_workers
+        self.timeout = timeout or config.default_timeout / 1000
+        self._tokens: Dict[str, str] = {}
+        self._tokens_lock = threading.Lock()
+
+        # The session is shared by every user, so it must never keep cookies.
+        # Each request carries its user's token explicitly
+        self.session = requests.Session()
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def request(self, method: str, path: str, user: Optional[Dict[str, Any]] = None,
+                check: bool = True, **kwargs) -> requests.Response:
+        """
+        Send a request, authenticated as a user if one is given
+
+        :param method: HTTP method
+        :param path: Endpoint path
+        :param user: User dict containing email and password
+        :param check: Raise APIError on an error status
+        :returns: The response
+        """
+        if user is not None:
+            kwargs['cookies'] = {self.TOKEN_COOKIE: self.token(user)}
+        kwargs.setdefault('timeout', self.timeout)
+        response = self.session.request(method, self.api_url + path, **kwargs)
+
+        # A reused token may have expired; log in again once and retry
+        if user is not None and response.status_code == 401:
+            self.forget(user)
+            kwargs['cookies'] = {self.TOKEN_COOKIE: self.token(user)}
+            response = self.session.request(method, self.api_url + path, **kwargs)
+
+        if check and not response.ok:
+            raise APIError(response)
+        return response
+
+    # Users
+
+    def register(self, email: str, password: str, check: bool = True) -> requests.Response:
+        """
+        Create an account
+
+        :param email: User email
+        :param password: User password
+        :param check: Raise APIError if registration fails
+        :returns: The response
+        """
+        response = self.request('POST', self.REGISTER_PATH, check=check,
+                                json={'email': email, 'password': password})
+        token = self._token_from(response)
+        if response.ok and token:
+            with self._tokens_lock:
+                self._tokens[email] = token
+        return response
+
+    def login(self, email: str, password: str) -> str:
+        """
+        Log in and remember the user's token
+
+        :param email: User email
+        :param password: User password
+        :returns: Access token
+        """
+        response = self.request('POST', self.LOGIN_PATH, json={'email': email, 'password': password})
+        token = self._token_from(response)
+        if not token:
+            raise APIError(response)
+        with self._tokens_lock:
+            self._tokens[email] = token
+        return token
+
+    def token(self, user: Dict[str, Any]) -> str:
+        """
+        Get a user's access token, logging in only the first time
+
+        :param user: User dict containing email and password
+        :returns: Access token
+        """
+        token = self._tokens.get(user['email'])
+        return token if token else self.login(user['email'], user['password'])
+
+    def forget(self, user: Dict[str, Any]) -> None:
+        """Drop a user's cached token"""
+        with self._tokens_lock:
+            self._tokens.pop(user['email'], None)
+
+    def current_user(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the account details of a user"""
+        return self.request('GET', self.USER_PATH, user).json()
+
+    # Files
+
+    def upload_file(self, user: Dict[str, Any], path: Union[str, Path], parent: str = '/',
+                    filename: Optional[str] = None, chunk_size: int = 1024 ** 2) -> Dict[str, Any]:
+        """
+        Upload a file, streaming it from disk
+
+        :param user: Owning user
+        :param path: File to upload
+        :param parent: Id of the folder to upload into, '/' for the root
+        :param filename: Name to upload as, defaults to the file name
+        :param chunk_size: Bytes read per chunk
+        :returns: The created file's metadata
+        """
+        body = MultipartFileStream(path, filename=filename, chunk_size=chunk_size)
+        return self.request('POST', self.UPLOAD_PATH, user, data=body, params={'parent': parent},
+                            headers={'Content-Type': body.content_type}).json()
+
+    def upload_files(self, user: Dict[str, Any], paths: List[Union[str, Path]],
+                    parent: str = '/') -> List[Dict[str, Any]]:
+        """
+        Upload many files concurrently over the pooled connections
+
+        :param user: Owning user
+        :param paths: Files to upload
+        :param parent: Id of the folder to upload into
+        :returns: The created files' metadata, in the order of paths
+        """
+        self.token(user)
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            return list(executor.map(lambda path: self.upload_file(user, path, parent), paths))
+
+    def list_files(self, user: Dict[str, Any], parent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List a user's files
+
+        :param user: Owning user
+        :param parent: Only list the files in this folder
+        :returns: File metadata
+        """
+        params = {'parent': parent} if parent else None
+        return self.request('GET', self.FILE_LIST_PATH, user, params=params).json()
+
+    def download_file(self, user: Dict[str, Any], file_id: str, destination: Optional[Path] = None,
+                    algorithm: str = DEFAULT_ALGORITHM, chunk_size: int = 1024 ** 2) -> Dict[str, Any]:
+        """
+        Download a file, hashing it while it streams in
+
+        :param user: Owning user
+        :param file_id: Id of the file
+        :param destination: Where to write the file, or None to only hash it
+        :param algorithm: hashlib algorithm used for the digest
+        :param chunk_size: Bytes read per chunk
+        :returns: Dict with the destination path, size, digest, seconds and MB/s
+        """
+        start = time.perf_counter()
+        hasher = StreamingHasher(algorithm)
+        with self.request('GET', self.DOWNLOAD_PATH.format(file_id=file_id), user, stream=True) as response:
+            sink = open(destination, 'wb') if destination else None
+            try:
+                for chunk in response.iter_content(chunk_size):
+                    hasher.update(chunk)
+                    if sink:
+                        sink.write(chunk)
+            finally:
+                if sink:
+                    sink.close()
+        elapsed = time.perf_counter() - start
+
+        return {
+            'path': destination,
+            'size': hasher.bytes,
+            'digest': hasher.hexdigest(),
+            'seconds': elapsed,
+            'mb_per_s': hasher.bytes / (1024 ** 2) / elapsed if elapsed else 0.0
+        }
+
+    def delete_file(self, user: Dict[str, Any], file_id: str) -> None:
+        """Delete a file"""
+        self.request('DELETE', self.REMOVE_FILE_PATH.format(file_id=file_id), user)
+
+    # Folders
+
+    def create_folder(self, user: Dict[str, Any], name: str, parent: str = '/') -> Dict[str, Any]:
+        """
+        Create a folder
+
+        :param user: Owning user
+        :param name: Folder name
+        :param parent: Id of the parent folder, '/' for the root
+        :returns: The created folder's metadata
+        """
+        return self.request('POST', self.FOLDER_CREATE_PATH, user,
+                            json={'name': name, 'parent': parent}).json()
+
+    def list_folders(self, user: Dict[str, Any], parent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List a user's folders
+
+        :param user: Owning user
+        :param parent: Only list the folders in this folder
+        :returns: Folder metadata
+        """
+        params = {'parent': parent} if parent else None
+        return self.request('GET', self.FOLDER_LIST_PATH, user, params=params).json()
+
+    def close(self) -> None:
+        """Close the pooled HTTP session"""
+        self.session.close()
+
+    def _token_from(self, response: requests.Response) -> Optional[str]:
+        """Read the access token from a login or registration response"""
+        token = response.cookies.get(self.TOKEN_COOKIE)
+        if token:
+            return token
+        try:
+            return response.json().get('token')
+        except ValueError:
+            return None
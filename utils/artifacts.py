@@ -0,0 +1,104 @@
+"""
+Module for capturing failure artifacts with minimal cost for passing tests.
+Tracing runs in per-test chunks that are only saved when the test fails,
+and screenshots and DOM snapshots are taken on failure and written to
+disk from a background thread.
+"""
+
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Set
+from playwright.sync_api import BrowserContext, Page, Error as PlaywrightError
+from configs.settings import config
+
+logger = logging.getLogger(__name__)
+
+class ArtifactRecorder:
+    """
+    Records traces, screenshots and DOM snapshots for failed tests
+    """
+
+    def __init__(self, directory: Optional[Path] = None, tracing: Optional[bool] = None,
+                screenshots: Optional[bool] = None):
+        self.directory = Path(directory or config.reports_dir / 'artifacts')
+        self.tracing = config.trace_on_failure if tracing is None else tracing
+        self.screenshots = config.screenshot_on_failure if screenshots is None else screenshots
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='artifacts')
+        # Contexts with tracing started; pooled contexts keep tracing across tests
+        self._traced: Set[int] = set()
+
+    def test_dir(self, test_id: str) -> Path:
+        """
+        Get the artifact directory of a test
+
+        :param test_id: Test node id
+        :returns: Directory path, created if missing
+        """
+        path = self.directory / re.sub(r'[^A-Za-z0-9_.-]+', '_', test_id)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def start(self, context: BrowserContext, test_id: str) -> None:
+        """
+        Start a trace chunk for a test
+
+        :param context: Context the test runs in
+        :param test_id: Test node id, used as the chunk title
+        """
+        if not self.tracing:
+            return
+
+        key = id(context)
+        if key not in self._traced:
+            context.tracing.start(screenshots=True, snapshots=True)
+            self._traced.add(key)
+            context.on("close", lambda _: self._traced.discard(key))
+        context.tracing.start_chunk(title=test_id)
+
+    def stop(self, context: BrowserContext, test_id: str, failed: bool) -> None:
+        """
+        Finish a test's trace chunk, keeping it only if the test failed
+
+        :param context: Context the test ran in
+        :param test_id: Test node id
+        :param failed: Whether the test failed
+        """
+        if not self.tracing or id(context) not in self._traced:
+            return
+        try:
+            if failed:
+                path = self.test_dir(test_id) / 'trace.zip'
+                context.tracing.stop_chunk(path=path)
+                logger.info(f"Saved trace for failed test to {path}")
+            else:
+                context.tracing.stop_chunk()
+        except PlaywrightError as e:
+            logger.warning(f"Could not stop trace chunk for {test_id}: {e}")
+
+    def capture_page(self, page: Page, test_id: str) -> None:
+        """
+        Take a screenshot and DOM snapshot of a failed test's page.
+        Capturing happens here, writing to disk happens in the background
+
+        :param page: Page to capture
+        :param test_id: Test node id
+        """
+        if not self.screenshots or page.is_closed():
+            return
+        try:
+            screenshot = page.screenshot(full_page=True)
+            html = page.content()
+        except PlaywrightError as e:
+            logger.warning(f"Could not capture page for {test_id}: {e}")
+            return
+
+        directory = self.test_dir(test_id)
+        self._executor.submit((directory / 'screenshot.png').write_bytes, screenshot)
+        self._executor.submit((directory / 'dom.html').write_text, html, encoding='utf-8')
+        logger.info(f"Saving screenshot and DOM snapshot for failed test to {directory}")
+
+    def close(self) -> None:
+        """Wait for pending artifact writes"""
+        self._executor.shutdown(wait=True)
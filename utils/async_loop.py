@@ -0,0 +1,49 @@
+"""
+Module for running asyncio code next to Playwright's sync API. The sync
+API marks its own event loop as running on the thread that uses it, so no
+other loop can run there once a sync browser exists. The async browser
+and the coroutines that drive it run on a loop in a thread of their own.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+class AsyncLoopThread:
+    """
+    An asyncio event loop running on a dedicated thread
+    """
+
+    def __init__(self, name: str = 'asyncio-loop'):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> 'AsyncLoopThread':
+        """Start the loop thread"""
+        self._thread.start()
+        return self
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the loop and wait for its result
+
+        :param coro: Coroutine to run
+        :param timeout: Seconds to wait, or None to wait until it finishes
+        :returns: The coroutine's result, its exception is re-raised here
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def stop(self) -> None:
+        """Stop the loop and wait for its thread to finish"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
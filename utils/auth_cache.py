@@ -0,0 +1,167 @@
+"""
+Module that caches authenticated browser state for test users.
+Each user is logged in through the UI once, and the resulting Playwright
+storage state (cookies + localStorage) is saved to disk keyed by user and
+base URL so later tests can start from an already signed-in context.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+from playwright.sync_api import Browser, Page
+from configs.settings import config
+from pages.login_page import LoginPage
+from pages.locators import HOME, LOGIN
+
+logger = logging.getLogger(__name__)
+
+class AuthStateCache:
+    """
+    Disk-backed cache of Playwright storage states for logged in users
+    """
+
+    HOME_PATH = '/home'
+
+    def __init__(self, browser: Browser, state_dir: Optional[Path] = None,
+                base_url: Optional[str] = None, ttl: Optional[int] = None):
+        self.browser = browser
+        self.state_dir = Path(state_dir or config.auth_state_dir)
+        self.base_url = (base_url or config.base_url).rstrip('/')
+        self.ttl = config.auth_state_ttl if ttl is None else ttl
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    def state_path(self, email: str) -> Path:
+        """
+        Get the storage state file for a user on the current base url
+
+        :param email: User email
+        :returns: Path of the storage state file
+        """
+        key = hashlib.sha256(f"{self.base_url}|{email}".encode()).hexdigest()[:16]
+        safe_email = re.sub(r'[^A-Za-z0-9]+', '_', email)
+        return self.state_dir / f"{safe_email}-{key}.json"
+
+    def is_fresh(self, path: Path) -> bool:
+        """
+        Check whether a saved storage state can still be used
+
+        :param path: Storage state file
+        :returns: True if the file exists, is younger than the ttl and
+        none of its cookies have expired
+        """
+        if not path.exists():
+            return False
+        if time.time() - path.stat().st_mtime > self.ttl:
+            logger.debug(f"Storage state expired by ttl: {path}")
+            return False
+
+        try:
+            state = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read storage state {path}: {e}")
+            return False
+
+        now = time.time()
+        for cookie in state.get('cookies', []):
+            expires = cookie.get('expires', -1)
+            if 0 < expires < now:
+                logger.debug(f"Cookie {cookie.get('name')} expired in {path}")
+                return False
+        return bool(state.get('cookies'))
+
+    def storage_state(self, user: Dict[str, Any]) -> str:
+        """
+        Get a storage state file for a user, logging in if needed
+
+        :param user: User dict containing email and password
+        :returns: Path of the storage state file as a string
+        """
+        path = self.state_path(user['email'])
+        if not self.is_fresh(path):
+            self._login(user, path)
+        else:
+            logger.debug(f"Reusing cached storage state for {user['email']}")
+        return str(path)
+
+    def invalidate(self, user: Dict[str, Any]) -> None:
+        """
+        Remove the cached storage state for a user
+
+        :param user: User dict containing email
+        """
+        path = self.state_path(user['email'])
+        path.unlink(missing_ok=True)
+        logger.info(f"Invalidated cached storage state for {user['email']}")
+
+    def ensure_authenticated(self, page: Page, user: Dict[str, Any]) -> None:
+        """
+        Open the home page and make sure the cached session is accepted.
+        A stale session triggers a single re-login before giving up.
+
+        :param page: Page from a context created with the user's storage state
+        :param user: User dict containing email and password
+        """
+        if self._open_home(page):
+            return
+
+        logger.info(f"Cached session for {user['email']} is stale, logging in again")
+        self.invalidate(user)
+        state = json.loads(Path(self.storage_state(user)).read_text())
+        self._apply_state(page, state)
+
+        if not self._open_home(page):
+            raise RuntimeError(f"Could not restore an authenticated session for {user['email']}")
+
+    def _login(self, user: Dict[str, Any], path: Path) -> None:
+        """
+        Log a user in through the UI and save the storage state
+
+        :param user: User dict containing email and password
+        :param path: Storage state file to write
+        """
+        logger.info(f"Logging in {user['email']} to cache storage state")
+        context = self.browser.new_context(**config.get_browser_context_options())
+        try:
+            login_page = LoginPage(context.new_page())
+            login_page.navigate_to(self.base_url)
+            login_page.login(user['email'], user['password'])
+            if not login_page.is_logged_in():
+                raise RuntimeError(f"Login failed for {user['email']}")
+            context.storage_state(path=str(path))
+        finally:
+            context.close()
+
+    def _open_home(self, page: Page) -> bool:
+        """
+        Navigate to the home page and report whether we stayed there
+
+        :param page: Page to navigate
+        :returns: True if the home page rendered, false if we were sent to login
+        """
+        page.goto(self.base_url + self.HOME_PATH, **config.get_page_goto_options())
+        home = HOME.QUICK_ACCESS.resolve(page)
+        login = LOGIN.LOGIN_HEADING.resolve(page)
+        home.or_(login).first.wait_for(state='visible')
+        return home.is_visible()
+
+    def _apply_state(self, page: Page, state: Dict[str, Any]) -> None:
+        """
+        Load a storage state into the context of an existing page
+
+        :param page: Page whose context should receive the state
+        :param state: Storage state dict as saved by Playwright
+        """
+        page.context.clear_cookies()
+        page.context.add_cookies(state.get('cookies', []))
+
+        for origin in state.get('origins', []):
+            if not page.url.startswith(origin['origin']):
+                continue
+            page.evaluate(
+                "items => items.forEach(i => localStorage.setItem(i.name, i.value))",
+                origin.get('localStorage', [])
+            )
@@ -0,0 +1,86 @@
+"""
+Module for collecting benchmark measurements and writing them as JSON.
+Samples are grouped into buckets (e.g. by file size) and every numeric
+metric is summarized with percentiles per bucket.
+"""
+
+import json
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from configs.settings import config
+from utils.timing import percentile
+from utils.workers import worker_id
+from utils.throttling import active_profile
+
+logger = logging.getLogger(__name__)
+
+class BenchmarkRecorder:
+    """
+    Collects benchmark samples for one named benchmark
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.samples: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.metadata: Dict[str, Any] = {}
+
+    def record(self, bucket: str, **metrics: Any) -> None:
+        """
+        Record one sample. Samples taken under a throttling profile go to
+        a bucket of their own, e.g. '10MB [3g]'
+
+        :param bucket: Group the sample belongs to, e.g. '10MB'
+        :param metrics: Measured values, numeric ones are summarized
+        """
+        throttle = active_profile().name
+        if throttle != 'none':
+            bucket = f"{bucket} [{throttle}]"
+        self.samples[bucket].append({**metrics, 'throttle': throttle})
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Summarize every numeric metric per bucket
+
+        :returns: Dict of bucket -> metric -> count/min/p50/p95/max
+        """
+        result = {}
+        for bucket, samples in self.samples.items():
+            metrics = defaultdict(list)
+            for sample in samples:
+                for key, value in sample.items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        metrics[key].append(value)
+            result[bucket] = {
+                key: {
+                    'count': len(values),
+                    'min': round(min(values), 4),
+                    'p50': round(percentile(values, 50), 4),
+                    'p95': round(percentile(values, 95), 4),
+                    'max': round(max(values), 4)
+                }
+                for key, values in metrics.items()
+            }
+        return result
+
+    def write_report(self, path: Optional[Path] = None) -> Optional[Path]:
+        """
+        Write the samples and summary as JSON
+
+        :param path: Output file, defaults to reports/benchmarks/<name>_<worker>.json
+        :returns: Path of the written report, or None if nothing was recorded
+        """
+        if not self.samples:
+            return None
+        path = Path(path or config.reports_dir / 'benchmarks' / f"{self.name}_{worker_id()}.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            'benchmark': self.name,
+            'base_url': config.base_url,
+            **self.metadata,
+            'summary': self.summary(),
+            'samples': self.samples
+        }, indent=2))
+        logger.info(f"Wrote {self.name} benchmark report to {path}")
+        return path
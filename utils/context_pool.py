@@ -0,0 +1,130 @@
+"""
+Module that keeps a pool of pre-warmed browser contexts.
+Contexts are handed out per test and reset between uses instead of being
+closed and recreated, falling back to a fresh context when a reset fails.
+"""
+
+import logging
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
+from playwright.sync_api import Browser, BrowserContext, Error as PlaywrightError
+from configs.settings import config
+
+logger = logging.getLogger(__name__)
+
+# Clears every storage area a myDrive page can leave behind on its origin
+CLEAR_STORAGE_SCRIPT = """async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (indexedDB.databases) {
+        const databases = await indexedDB.databases();
+        databases.forEach(db => indexedDB.deleteDatabase(db.name));
+    }
+}"""
+
+class ContextPool:
+    """
+    Pool of reusable browser contexts
+    """
+
+    RESET_PATH = '/__context_pool_reset__'
+
+    def __init__(self, browser: Browser, size: int,
+                context_options: Optional[Dict[str, Any]] = None):
+        self.browser = browser
+        self.size = size
+        self.context_options = context_options or config.get_browser_context_options()
+        self._idle: List[BrowserContext] = []
+        self.stats = {'size': size, 'hits': 0, 'misses': 0, 'reset_failures': 0}
+
+        base = urlparse(config.base_url)
+        self._base_origin = f"{base.scheme}://{base.netloc}"
+
+    def warm(self) -> None:
+        """Create the pooled contexts up front"""
+        while len(self._idle) < self.size:
+            self._idle.append(self.browser.new_context(**self.context_options))
+        logger.info(f"Warmed browser context pool with {self.size} contexts")
+
+    def acquire(self) -> BrowserContext:
+        """
+        Get a clean context from the pool
+
+        :returns: A pooled context, or a new one if the pool is empty
+        """
+        if self._idle:
+            self.stats['hits'] += 1
+            return self._idle.pop()
+
+        self.stats['misses'] += 1
+        logger.debug("Context pool empty, creating a fresh context")
+        return self.browser.new_context(**self.context_options)
+
+    def release(self, context: BrowserContext) -> None:
+        """
+        Reset a context and return it to the pool. Contexts that fail to
+        reset, or that do not fit in the pool, are closed
+
+        :param context: Context previously returned by acquire
+        """
+        try:
+            self.reset(context)
+        except PlaywrightError as e:
+            self.stats['reset_failures'] += 1
+            logger.warning(f"Failed to reset pooled context, discarding it: {e}")
+            self._close_quietly(context)
+            return
+
+        if len(self._idle) < self.size:
+            self._idle.append(context)
+        else:
+            self._close_quietly(context)
+
+    def reset(self, context: BrowserContext) -> None:
+        """
+        Clear cookies, storage, permissions and routes from a context
+
+        :param context: Context to reset
+        """
+        for page in context.pages:
+            page.close()
+
+        context.unroute_all(behavior='ignoreErrors')
+        context.clear_permissions()
+
+        origins = {origin['origin'] for origin in context.storage_state()['origins']}
+        origins.add(self._base_origin)
+        context.clear_cookies()
+        self._clear_origin_storage(context, origins)
+
+    def close(self) -> None:
+        """Close every idle context in the pool"""
+        while self._idle:
+            self._close_quietly(self._idle.pop())
+        logger.info(f"Context pool stats: {self.stats}")
+
+    def _clear_origin_storage(self, context: BrowserContext, origins: set) -> None:
+        """
+        Clear web storage for each origin from a blank page served by a route,
+        so the app itself never has to load during a reset
+
+        :param context: Context whose storage should be cleared
+        :param origins: Origins that may hold storage
+        """
+        page = context.new_page()
+        try:
+            for origin in origins:
+                reset_url = origin + self.RESET_PATH
+                page.route(reset_url, lambda route: route.fulfill(body='', content_type='text/html'))
+                page.goto(reset_url)
+                page.evaluate(CLEAR_STORAGE_SCRIPT)
+                page.unroute(reset_url)
+        finally:
+            page.close()
+
+    @staticmethod
+    def _close_quietly(context: BrowserContext) -> None:
+        try:
+            context.close()
+        except PlaywrightError as e:
+            logger.debug(f"Error closing context: {e}")
@@ -3,17 +3,32 @@ Module that provides utilities for database operations during testing.
 Includes creating test users, cleaning up test data, and verifying data. 
 """
 
-from pymongo import MongoClient
+from pymongo import MongoClient, InsertOne
+from pymongo.errors import ConnectionFailure, ConfigurationError, BulkWriteError
+from bson import ObjectId
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable
 from urllib.parse import urlparse
+import hashlib
+import json
 import logging
+import re
+import time
+from configs.test_data import test_data
 
 logger = logging.getLogger(__name__)
 
 class DatabaseHelper:
     """ Helper class for database operations during testing"""
 
+    # Collections captured by snapshots, including the GridFS collections
+    # (fs.files / fs.chunks) myDrive uses for file metadata and blobs
+    SNAPSHOT_COLLECTIONS = ['users', 'files', 'folders', 'fs.files', 'fs.chunks']
+    SNAPSHOT_META = '_snapshot_meta'
+
+    # GridFS metadata collection myDrive lists a user's files from
+    LIBRARY_FILES = 'fs.files'
+
     def __init__(self, connection_string: str, db_name: Optional[str] = None):
         self.connection_string = connection_string
         self.client = None
@@ -52,6 +67,175 @@ class DatabaseHelper:
             logger.error(f"Unexpected error connecting to MongoDB: {e}")
             raise
 
+    def find_user(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a user document by email
+
+        :param email: User email
+        :returns: User document, or None if the user does not exist
+        """
+        return self.db.users.find_one({'email': email})
+
+    def mark_test_users(self, emails: List[str]) -> int:
+        """
+        Flag users as test users so cleanup_test_data can find them
+
+        :param emails: Emails of the users to flag
+        :returns: Number of users that were updated
+        """
+        if not emails:
+            return 0
+        result = self.db.users.update_many(
+            {'email': {'$in': list(emails)}},
+            {'$set': {'isTestUser': True}}
+        )
+        logger.debug(f"Marked {result.modified_count} users as test users")
+        return result.modified_count
+
+    def insert_user_content(self, email: str, folders: Optional[List[Dict[str, Any]]] = None,
+                            files: Optional[List[Dict[str, Any]]] = None) -> Dict[str, int]:
+        """
+        Bulk insert folders and files owned by a user
+
+        :param email: Email of the owning user
+        :param folders: Folder documents, userId is filled in automatically
+        :param files: File documents, userId is filled in automatically
+        :returns: Dict with the number of inserted folders and files
+        """
+        user = self.find_user(email)
+        if not user:
+            raise ValueError(f"Cannot seed content, user not found: {email}")
+
+        counts = {'folders': 0, 'files': 0}
+        now = datetime.now()
+        for collection, documents in (('folders', folders), ('files', files)):
+            if not documents:
+                continue
+            documents = [{'createdAt': now, **doc, 'userId': user['_id']} for doc in documents]
+            result = self.db[collection].insert_many(documents, ordered=False)
+            counts[collection] = len(result.inserted_ids)
+
+        logger.info(f"Seeded {counts['folders']} folders and {counts['files']} files for {email}")
+        return counts
+
+    def seed_library(self, email: str, files: int = 10000, depth: int = 3, breadth: int = 5,
+                    root_share: float = 0.0, leaf_share: float = 0.0,
+                    batch_size: int = 1000) -> Dict[str, Any]:
+        """
+        Generate a large folder hierarchy with files spread across every
+        folder, in myDrive's own document shape. Documents are generated
+        lazily and written in unordered bulk batches, so one slow or failing
+        document never holds up the rest
+
+        :param email: Email of the owning user
+        :param files: Number of files to create
+        :param depth: Folder levels below the root
+        :param breadth: Sub folders per folder
+        :param root_share: Share of the files kept at the root, 0 to 1
+        :param leaf_share: Share of the files put in the deepest folder of the first branch
+        :param batch_size: Documents per bulk write
+        :returns: Dict with folder and file counts, elapsed seconds, the ids
+        along the first root-to-leaf folder path, and per view on it ('/'
+        and each folder id) the file count and the newest file's name
+        """
+        user = self.find_user(email)
+        if not user:
+            raise ValueError(f"Cannot seed library, user not found: {email}")
+        start = time.perf_counter()
+        owner = str(user['_id'])
+        now = datetime.now()
+
+        # Folder ids by generated path; a parent always precedes its children
+        folder_ids: Dict[str, ObjectId] = {}
+        parent_lists: Dict[str, List[str]] = {'': ['/']}
+
+        def folder_documents():
+            for folder in test_data.folder_tree(depth, breadth):
+                folder_id = ObjectId()
+                parent_path = folder['parent'] or ''
+                parent = str(folder_ids[parent_path]) if parent_path else '/'
+                folder_ids[folder['path']] = folder_id
+                parent_lists[folder['path']] = parent_lists[parent_path] + [str(folder_id)]
+                yield {
+                    '_id': folder_id, 'name': folder['name'], 'owner': owner, 'userId': user['_id'],
+                    'parent': parent, 'parentList': parent_lists[parent_path],
+                    'createdAt': now, 'updatedAt': now
+                }
+
+        folder_count = self._bulk_insert('folders', folder_documents(), batch_size)
+
+        # The tree is walked depth first, so the first folders form the
+        # first root-to-leaf branch, for opening folder views at every depth
+        folders = list(folder_ids)
+        branch = folders[:depth] if breadth else []
+        view_files = {path: 0 for path in [''] + branch}
+        newest: Dict[str, Dict[str, Any]] = {}
+
+        def file_documents():
+            for spec, path in test_data.library_files(files, folders, branch[-1] if branch else None,
+                                                      root_share, leaf_share):
+                if path in view_files:
+                    view_files[path] += 1
+                    if path not in newest or spec['modified'] > newest[path]['modified']:
+                        newest[path] = spec
+                yield {
+                    'filename': spec['name'], 'length': spec['size'], 'chunkSize': 255 * 1024,
+                    'uploadDate': spec['modified'], 'userId': user['_id'],
+                    'metadata': {
+                        'owner': owner,
+                        'parent': str(folder_ids[path]) if path else '/',
+                        'parentList': ','.join(parent_lists[path]),
+                        'size': spec['size'], 'hasThumbnail': False, 'isVideo': False
+                    }
+                }
+
+        file_count = self._bulk_insert(self.LIBRARY_FILES, file_documents(), batch_size)
+
+        elapsed = time.perf_counter() - start
+        logger.info(f"Seeded library of {folder_count} folders and {file_count} files "
+                    f"for {email} in {elapsed:.2f}s")
+
+        def view_id(path: str) -> str:
+            return str(folder_ids[path]) if path else '/'
+
+        return {
+            'folders': folder_count,
+            'files': file_count,
+            'elapsed': elapsed,
+            'branch': [str(folder_ids[path]) for path in branch],
+            'view_files': {view_id(path): count for path, count in view_files.items()},
+            # myDrive lists the newest files first, so the newest one renders on the first page
+            'sample_files': {view_id(path): spec['name'] for path, spec in newest.items()}
+        }
+
+    def _bulk_insert(self, collection: str, documents: Iterable[Dict[str, Any]],
+                    batch_size: int) -> int:
+        """
+        Insert documents in unordered bulk_write batches
+
+        :param collection: Collection name
+        :param documents: Documents to insert, consumed lazily
+        :param batch_size: Documents per batch
+        :returns: Number of inserted documents
+        """
+        inserted = 0
+        batch = []
+        for document in documents:
+            batch.append(InsertOne(document))
+            if len(batch) >= batch_size:
+                inserted += self._write_batch(collection, batch)
+                batch = []
+        if batch:
+            inserted += self._write_batch(collection, batch)
+        return inserted
+
+    def _write_batch(self, collection: str, batch: List[InsertOne]) -> int:
+        try:
+            return self.db[collection].bulk_write(batch, ordered=False).inserted_count
+        except BulkWriteError as e:
+            logger.warning(f"{len(e.details['writeErrors'])} inserts into {collection} failed")
+            return e.details['nInserted']
+
     def delete_test_user(self, email: str) -> bool:
         """
         Delete a test user and associated data
@@ -73,6 +257,9 @@ class DatabaseHelper:
 
             folders_result = self.db.folders.delete_many({'userId': user_id})
             logger.debug(f"Deleted {folders_result.deleted_count} folders for user {email}")
+
+            library_result = self.db[self.LIBRARY_FILES].delete_many({'userId': user_id})
+            logger.debug(f"Deleted {library_result.deleted_count} library files for user {email}")
             
             result = self.db.users.delete_one({'_id': user_id})
             
@@ -86,10 +273,157 @@ class DatabaseHelper:
             logger.error(f"Error when deleting test user {email}: {e}")
             return False
 
-    def cleanup_test_data(self) -> None:
-        """Cleans up all test data from database"""
-        test_users = self.db.users.find({'isTestUser': True})
-        for user in test_users:
-            self.delete_test_user(user['email'])
+    def bulk_cleanup(self, email_prefix: Optional[str] = None,
+                    created_before: Optional[datetime] = None,
+                    created_after: Optional[datetime] = None,
+                    chunk_size: int = 1000) -> Dict[str, Any]:
+        """
+        Delete test users and all of their files and folders with set-based deletes
+
+        :param email_prefix: Only delete users whose email starts with this prefix.
+        When omitted, users flagged with isTestUser are deleted
+        :param created_before: Only delete users created before this time
+        :param created_after: Only delete users created after this time
+        :param chunk_size: Maximum number of user ids per $in filter
+        :returns: Dict with deleted counts per collection and elapsed seconds
+        """
+        start = time.perf_counter()
+
+        query: Dict[str, Any] = {}
+        if email_prefix:
+            query['email'] = {'$regex': f"^{re.escape(email_prefix)}"}
+        else:
+            query['isTestUser'] = True
+
+        # ObjectIds embed their creation time, so no schema field is needed
+        id_range = {}
+        if created_before:
+            id_range['$lt'] = ObjectId.from_datetime(created_before)
+        if created_after:
+            id_range['$gte'] = ObjectId.from_datetime(created_after)
+        if id_range:
+            query['_id'] = id_range
+
+        user_ids = [user['_id'] for user in self.db.users.find(query, {'_id': 1})]
+
+        counts = {'users': 0, 'files': 0, 'folders': 0}
+        for i in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[i:i + chunk_size]
+            counts['files'] += self.db.files.delete_many({'userId': {'$in': chunk}}).deleted_count
+            counts['files'] += self.db[self.LIBRARY_FILES].delete_many({'userId': {'$in': chunk}}).deleted_count
+            counts['folders'] += self.db.folders.delete_many({'userId': {'$in': chunk}}).deleted_count
+            counts['users'] += self.db.users.delete_many({'_id': {'$in': chunk}}).deleted_count
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Bulk cleanup removed {counts['users']} users, {counts['files']} files "
+            f"and {counts['folders']} folders in {elapsed:.3f}s"
+        )
+        return {**counts, 'elapsed': elapsed}
+
+    def cleanup_test_data(self) -> Dict[str, Any]:
+        """
+        Cleans up all test data from database
+
+        :returns: Dict with deleted counts per collection and elapsed seconds
+        """
+        result = self.bulk_cleanup()
+        logger.info("Cleaned up all test data")
+        return result
+
+    def snapshot_database_name(self, name: str) -> str:
+        """
+        Get the template database that holds a named snapshot
+
+        :param name: Snapshot name
+        :returns: Database name such as mydrive_test__snapshot_baseline
+        """
+        return f"{self.db.name}__snapshot_{name}"
+
+    def schema_hash(self, collections: Optional[List[str]] = None,
+                    version: str = '') -> str:
+        """
+        Hash the shape of the snapshot collections. myDrive creates its
+        indexes on startup, so they track the app's schema while being
+        unaffected by the data itself
+
+        :param collections: Collections to include, defaults to SNAPSHOT_COLLECTIONS
+        :param version: Optional app version mixed into the hash
+        :returns: Hex digest describing the schema
+        """
+        shape = {'version': version}
+        for collection in collections or self.SNAPSHOT_COLLECTIONS:
+            indexes = self.db[collection].index_information()
+            shape[collection] = sorted(
+                json.dumps({k: v for k, v in index.items() if k != 'v'}, sort_keys=True, default=str)
+                for index in indexes.values()
+            )
+        return hashlib.sha256(json.dumps(shape, sort_keys=True).encode()).hexdigest()[:16]
+
+    def get_snapshot(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the metadata of a named snapshot
+
+        :param name: Snapshot name
+        :returns: Metadata dict with schema_hash, counts and created time, or None
+        """
+        template = self.client[self.snapshot_database_name(name)]
+        return template[self.SNAPSHOT_META].find_one({'_id': name})
+
+    def snapshot(self, name: str, collections: Optional[List[str]] = None,
+                version: str = '') -> Dict[str, Any]:
+        """
+        Copy the snapshot collections into a template database server side
+
+        :param name: Snapshot name
+        :param collections: Collections to capture, defaults to SNAPSHOT_COLLECTIONS
+        :param version: Optional app version stored in the schema hash
+        :returns: Snapshot metadata
+        """
+        start = time.perf_counter()
+        collections = collections or self.SNAPSHOT_COLLECTIONS
+        template_name = self.snapshot_database_name(name)
+        self.client.drop_database(template_name)
+        template = self.client[template_name]
+
+        counts = {}
+        for collection in collections:
+            counts[collection] = self.db[collection].estimated_document_count()
+            if counts[collection]:
+                self.db[collection].aggregate([{'$out': {'db': template_name, 'coll': collection}}])
+
+        meta = {
+            '_id': name,
+            'schema_hash': self.schema_hash(collections, version),
+            'collections': collections,
+            'counts': counts,
+            'created': datetime.now()
+        }
+        template[self.SNAPSHOT_META].insert_one(meta)
+        logger.info(f"Captured snapshot '{name}' in {time.perf_counter() - start:.3f}s: {counts}")
+        return meta
+
+    def restore_snapshot(self, name: str) -> Dict[str, Any]:
+        """
+        Replace the snapshot collections with the contents of a snapshot.
+        $out swaps each collection in one server-side step and keeps the
+        target's indexes
+
+        :param name: Snapshot name
+        :returns: Dict with the restored counts and elapsed seconds
+        """
+        start = time.perf_counter()
+        meta = self.get_snapshot(name)
+        if not meta:
+            raise ValueError(f"Snapshot not found: {name}")
+
+        template = self.client[self.snapshot_database_name(name)]
+        for collection in meta['collections']:
+            if meta['counts'].get(collection):
+                template[collection].aggregate([{'$out': {'db': self.db.name, 'coll': collection}}])
+            else:
+                self.db[collection].delete_many({})
 
-        logger.info("Cleaned up all test data")
\ No newline at end of file
+        elapsed = time.perf_counter() - start
+        logger.info(f"Restored snapshot '{name}' in {elapsed:.3f}s")
+        return {**meta['counts'], 'elapsed': elapsed}
@@ -0,0 +1,659 @@
+"""
+Module with an in-process stand-in for myDrive. It serves minimal login,
+registration and home pages carrying the same roles, labels and texts the
+page objects target, plus the user and file endpoints, backed by an
+in-memory store. Latency can be injected per path prefix, so runs against
+it measure the harness itself, apart from the app.
+
+Run it on its own with: python -m utils.fake_server --port 3000
+"""
+
+import argparse
+import email.parser
+import email.policy
+import html
+import json
+import logging
+import re
+import secrets
+import threading
+import time
+from datetime import datetime
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+from configs.test_data import test_data
+
+logger = logging.getLogger(__name__)
+
+TOKEN_COOKIE = 'access-token'
+TOKEN_MAX_AGE = 3600
+MIN_PASSWORD_LENGTH = 6
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+def new_id() -> str:
+    """Generate an id shaped like a MongoDB ObjectId"""
+    return secrets.token_hex(12)
+
+class MemoryStore:
+    """
+    In-memory users, files and folders. Also offers the DatabaseHelper
+    methods the fixtures use, so it can stand in for the database
+    """
+
+    def __init__(self):
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.folders: Dict[str, Dict[str, Any]] = {}
+        self.tokens: Dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    def create_user(self, email: str, password: str) -> Optional[str]:
+        """
+        Register a user
+
+        :param email: User email
+        :param password: User password
+        :returns: Error message, or None if the user was created
+        """
+        if not EMAIL_PATTERN.match(email or ''):
+            return 'Email is invalid'
+        if len(password or '') < MIN_PASSWORD_LENGTH:
+            return f'Password must be at least {MIN_PASSWORD_LENGTH} characters'
+        with self.lock:
+            if email in self.users:
+                return 'Email already in use'
+            self.users[email] = {'_id': new_id(), 'email': email, 'password': password,
+                                 'created': datetime.now()}
+        return None
+
+    def login(self, email: str, password: str) -> Optional[str]:
+        """
+        Check a user's credentials and issue a token
+
+        :returns: Token, or None if the credentials are wrong
+        """
+        user = self.users.get(email)
+        if not user or user['password'] != password:
+            return None
+        token = secrets.token_hex(16)
+        self.tokens[token] = email
+        return token
+
+    def user_for_token(self, token: Optional[str]) -> Optional[str]:
+        """Get the email a token was issued to"""
+        email = self.tokens.get(token or '')
+        return email if email in self.users else None
+
+    def add_file(self, owner: str, filename: str, data: bytes, parent: str = '/',
+                 upload_date: Optional[datetime] = None) -> Dict[str, Any]:
+        """Store an uploaded file"""
+        file_id = new_id()
+        with self.lock:
+            self.files[file_id] = {'_id': file_id, 'filename': filename, 'owner': owner,
+                                   'parent': parent, 'length': len(data), 'data': data,
+                                   'uploadDate': upload_date or datetime.now()}
+        return self.file_info(self.files[file_id])
+
+    def list_files(self, owner: str, parent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List a user's files, optionally only those in one folder, newest first like myDrive"""
+        files = [f for f in list(self.files.values())
+                 if f['owner'] == owner and (parent is None or f['parent'] == parent)]
+        return [self.file_info(f) for f in sorted(files, key=lambda f: f['uploadDate'], reverse=True)]
+
+    def add_folder(self, owner: str, name: str, parent: str = '/') -> Dict[str, Any]:
+        """Create a folder"""
+        folder_id = new_id()
+        with self.lock:
+            self.folders[folder_id] = {'_id': folder_id, 'name': name, 'owner': owner,
+                                       'parent': parent, 'createdAt': datetime.now()}
+        return self.folder_info(self.folders[folder_id])
+
+    def list_folders(self, owner: str, parent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List a user's folders, optionally only those in one folder"""
+        return [self.folder_info(f) for f in list(self.folders.values())
+                if f['owner'] == owner and (parent is None or f['parent'] == parent)]
+
+    @staticmethod
+    def file_info(file: Dict[str, Any]) -> Dict[str, Any]:
+        return {'_id': file['_id'], 'filename': file['filename'], 'length': file['length'],
+                'parent': file['parent'], 'uploadDate': file['uploadDate'].isoformat()}
+
+    @staticmethod
+    def folder_info(folder: Dict[str, Any]) -> Dict[str, Any]:
+        return {'_id': folder['_id'], 'name': folder['name'], 'parent': folder['parent'],
+                'createdAt': folder['createdAt'].isoformat()}
+
+    # DatabaseHelper compatible methods
+
+    def find_user(self, email: str) -> Optional[Dict[str, Any]]:
+        return self.users.get(email)
+
+    def mark_test_users(self, emails: List[str]) -> int:
+        marked = 0
+        for email in emails:
+            if email in self.users:
+                self.users[email]['isTestUser'] = True
+                marked += 1
+        return marked
+
+    def insert_user_content(self, email: str, folders: Optional[List[Dict[str, Any]]] = None,
+                            files: Optional[List[Dict[str, Any]]] = None) -> Dict[str, int]:
+        for folder in folders or []:
+            self.add_folder(email, folder.get('name', 'folder'), folder.get('parent', '/'))
+        for file in files or []:
+            self.add_file(email, file.get('filename', 'file'), b'\0' * file.get('length', 0),
+                          file.get('parent', '/'))
+        return {'folders': len(folders or []), 'files': len(files or [])}
+
+    def delete_test_user(self, email: str) -> bool:
+        with self.lock:
+            user = self.users.pop(email, None)
+            self.files = {k: f for k, f in self.files.items() if f['owner'] != email}
+            self.folders = {k: f for k, f in self.folders.items() if f['owner'] != email}
+        return user is not None
+
+    def seed_library(self, email: str, files: int = 10000, depth: int = 3, breadth: int = 5,
+                    root_share: float = 0.0, leaf_share: float = 0.0,
+                    batch_size: int = 1000) -> Dict[str, Any]:
+        """
+        Generate a large folder hierarchy with files, laid out like
+        DatabaseHelper.seed_library. File contents are left empty
+
+        :param email: Email of the owning user
+        :param files: Number of files to create
+        :param depth: Folder levels below the root
+        :param breadth: Sub folders per folder
+        :param root_share: Share of the files kept at the root, 0 to 1
+        :param leaf_share: Share of the files put in the deepest folder of the first branch
+        :param batch_size: Unused, kept for DatabaseHelper compatibility
+        :returns: Dict with folder and file counts, elapsed seconds, the ids
+        along the first root-to-leaf folder path, and per view on it the
+        file count and the newest file's name
+        """
+        start = time.perf_counter()
+        folder_ids: Dict[str, str] = {}
+        for folder in test_data.folder_tree(depth, breadth):
+            parent = folder_ids[folder['parent']] if folder['parent'] else '/'
+            folder_ids[folder['path']] = self.add_folder(email, folder['name'], parent)['_id']
+
+        folders = list(folder_ids)
+        branch = folders[:depth] if breadth else []
+        view_files = {path: 0 for path in [''] + branch}
+        newest: Dict[str, Dict[str, Any]] = {}
+        for spec, path in test_data.library_files(files, folders, branch[-1] if branch else None,
+                                                  root_share, leaf_share):
+            if path in view_files:
+                view_files[path] += 1
+                if path not in newest or spec['modified'] > newest[path]['modified']:
+                    newest[path] = spec
+            self.add_file(email, spec['name'], b'', folder_ids[path] if path else '/', spec['modified'])
+
+        def view_id(path: str) -> str:
+            return folder_ids[path] if path else '/'
+
+        return {
+            'folders': len(folder_ids),
+            'files': files,
+            'elapsed': time.perf_counter() - start,
+            'branch': [folder_ids[path] for path in branch],
+            'view_files': {view_id(path): count for path, count in view_files.items()},
+            'sample_files': {view_id(path): spec['name'] for path, spec in newest.items()}
+        }
+
+    def cleanup_test_data(self) -> Dict[str, Any]:
+        test_users = [email for email, user in self.users.items() if user.get('isTestUser')]
+        for email in test_users:
+            self.delete_test_user(email)
+        return {'users': len(test_users)}
+
+LOGIN_VIEW = """
+<h1>Login to your account</h1>
+<form id="login-form">
+  <input type="text" name="Email address" placeholder="Email address" aria-label="Email address">
+  <input type="password" name="Password" placeholder="Password" aria-label="Password">
+  <input type="submit" value="Login">
+</form>
+<p class="error" id="error"></p>
+<a href="#" id="switch">Create Account</a>
+"""
+
+REGISTER_VIEW = """
+<h1>Sign up</h1>
+<form id="register-form">
+  <input type="text" placeholder="Email address" aria-label="Email address">
+  <p class="field-error"></p>
+  <input type="password" placeholder="Password" aria-label="Password">
+  <p class="field-error"></p>
+  <input type="password" placeholder="Verify Password" aria-label="Verify Password">
+  <p class="field-error"></p>
+  <input type="submit" value="Create">
+</form>
+<p class="error" id="error"></p>
+<a href="#" id="switch">Back to sign in</a>
+"""
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><title>myDrive</title></head>
+<body><div id="root"></div>
+<script>
+const views = {login: %(login)s, register: %(register)s};
+const emailPattern = new RegExp(%(email_pattern)s);
+const minPassword = %(min_password)d;
+// Like the real app, the register form validates as the user types
+function validate(inputs) {
+  const [email, password, verify] = inputs;
+  return [
+    email.value && !emailPattern.test(email.value) ? 'Email is invalid' : '',
+    password.value && password.value.length < minPassword
+      ? `Password must be at least ${minPassword} characters` : '',
+    verify.value && verify.value !== password.value ? 'Passwords do not match' : ''
+  ];
+}
+async function post(path, body) {
+  const response = await fetch(path, {method: 'POST', headers: {'Content-Type': 'application/json'},
+                                      body: JSON.stringify(body)});
+  return [response, await response.json()];
+}
+function show(name) {
+  const root = document.getElementById('root');
+  root.innerHTML = views[name];
+  document.getElementById('switch').onclick = (e) => {
+    e.preventDefault();
+    show(name === 'login' ? 'register' : 'login');
+  };
+  const inputs = root.querySelectorAll('form input:not([type=submit])');
+  const fieldErrors = root.querySelectorAll('.field-error');
+  const showFieldErrors = () => {
+    const messages = validate(inputs);
+    fieldErrors.forEach((error, i) => { error.textContent = messages[i]; });
+    return messages.some(message => message);
+  };
+  if (name === 'register') {
+    inputs.forEach(input => input.addEventListener('input', showFieldErrors));
+  }
+  root.querySelector('form').onsubmit = async (e) => {
+    e.preventDefault();
+    if (name === 'register' && showFieldErrors()) { return; }
+    const [response, body] = name === 'login'
+      ? await post('/user-service/login', {email: inputs[0].value, password: inputs[1].value})
+      : await post('/user-service/create', {email: inputs[0].value, password: inputs[1].value,
+                                            verifyPassword: inputs[2].value});
+    if (response.ok) { window.location = '/home'; }
+    else { document.getElementById('error').textContent = body.message; }
+  };
+}
+show('login');
+</script></body></html>
+"""
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><head><title>myDrive</title></head>
+<body>
+<div id="header"><a href="/home">myDrive</a><a href="#" id="account">%(email)s</a></div>
+<div id="account-menu"></div>
+<a href="#" id="add-new">ADD NEW</a>
+<div id="add-menu" hidden><a href="#" id="upload">Upload Files</a></div>
+<input type="file" id="file-input" multiple hidden>
+<h2>Quick Access</h2>
+<div id="folders">%(folders)s</div>
+<div id="files">%(files)s</div>
+<div id="context-menu"></div>
+<script>
+const menu = document.getElementById('account-menu');
+document.getElementById('account').onclick = (e) => {
+  e.preventDefault();
+  menu.innerHTML = '<button id="logout">Logout</button>';
+  document.getElementById('logout').onclick = () => {
+    menu.innerHTML = '<p>Are you sure?</p><button id="confirm">Yes, logout</button>';
+    document.getElementById('confirm').onclick = async () => {
+      await fetch('/user-service/logout', {method: 'POST'});
+      window.location = '/';
+    };
+  };
+};
+document.getElementById('add-new').onclick = (e) => {
+  e.preventDefault();
+  document.getElementById('add-menu').hidden = false;
+};
+const input = document.getElementById('file-input');
+document.getElementById('upload').onclick = (e) => { e.preventDefault(); input.click(); };
+input.onchange = async () => {
+  for (const file of input.files) {
+    const form = new FormData();
+    form.append('file', file);
+    const response = await fetch('/file-service/upload', {method: 'POST', body: form});
+    if (response.ok) { addFile(await response.json()); }
+  }
+  input.value = '';
+};
+function addFile(file) {
+  const item = document.createElement('div');
+  item.className = 'file';
+  item.dataset.id = file._id;
+  item.textContent = file.filename;
+  document.getElementById('files').appendChild(item);
+}
+document.getElementById('files').oncontextmenu = (e) => {
+  const item = e.target.closest('.file');
+  if (!item) return;
+  e.preventDefault();
+  document.getElementById('context-menu').innerHTML =
+    '<a href="/file-service/download/' + item.dataset.id + '" download>Download</a>';
+};
+</script></body></html>
+"""
+
+class FakeMyDriveHandler(BaseHTTPRequestHandler):
+    """Request handler of the fake server"""
+
+    protocol_version = 'HTTP/1.1'
+    server: 'FakeServerHTTP'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def do_GET(self) -> None:
+        self._dispatch('GET')
+
+    def do_POST(self) -> None:
+        self._dispatch('POST')
+
+    def do_DELETE(self) -> None:
+        self._dispatch('DELETE')
+
+    def _dispatch(self, method: str) -> None:
+        start = time.perf_counter()
+        path = urlparse(self.path).path
+        delay = self.server.owner.latency_for(path)
+        if delay:
+            time.sleep(delay)
+
+        for route_method, pattern, handler in ROUTES:
+            match = re.fullmatch(pattern, path)
+            if route_method == method and match:
+                handler(self, *match.groups())
+                break
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {'message': 'Not found'})
+        self.server.owner.record(time.perf_counter() - start - delay, delay)
+
+    # Request helpers
+
+    @property
+    def store(self) -> MemoryStore:
+        return self.server.owner.store
+
+    def _query(self) -> Dict[str, str]:
+        return {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+
+    def _read_body(self) -> bytes:
+        """Read the request body, with or without chunked transfer encoding"""
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b';')[0].strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b''.join(chunks)
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def _json_body(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self._read_body() or b'{}')
+        except ValueError:
+            return {}
+
+    def _current_user(self) -> Optional[str]:
+        auth = self.headers.get('Authorization', '')
+        if auth.startswith('Bearer '):
+            return self.store.user_for_token(auth[len('Bearer '):])
+        cookie = SimpleCookie(self.headers.get('Cookie', ''))
+        return self.store.user_for_token(cookie[TOKEN_COOKIE].value if TOKEN_COOKIE in cookie else None)
+
+    def _send(self, status: int, body: bytes, content_type: str,
+              headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send(status, json.dumps(payload).encode(), 'application/json', headers)
+
+    def _send_html(self, page: str) -> None:
+        self._send(HTTPStatus.OK, page.encode(), 'text/html; charset=utf-8')
+
+    def _redirect(self, location: str) -> None:
+        self._send(HTTPStatus.FOUND, b'', 'text/plain', {'Location': location})
+
+    def _token_headers(self, token: str, max_age: int = TOKEN_MAX_AGE) -> Dict[str, str]:
+        return {'Set-Cookie': f"{TOKEN_COOKIE}={token}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax"}
+
+    def _require_user(self) -> Optional[str]:
+        email = self._current_user()
+        if not email:
+            self._send_json(HTTPStatus.UNAUTHORIZED, {'message': 'Not authorized'})
+        return email
+
+    # Pages
+
+    def login_page(self) -> None:
+        if self._current_user():
+            return self._redirect('/home')
+        self._send_html(LOGIN_PAGE % {'login': json.dumps(LOGIN_VIEW), 'register': json.dumps(REGISTER_VIEW),
+                                      'email_pattern': json.dumps(EMAIL_PATTERN.pattern),
+                                      'min_password': MIN_PASSWORD_LENGTH})
+
+    def home_page(self, parent: str = '/') -> None:
+        email = self._current_user()
+        if not email:
+            return self._redirect('/')
+        folders = ''.join(f'<a class="folder" href="/folder/{f["_id"]}">{html.escape(f["name"])}</a>'
+                          for f in self.store.list_folders(email, parent))
+        files = ''.join(f'<div class="file" data-id="{f["_id"]}">{html.escape(f["filename"])}</div>'
+                        for f in self.store.list_files(email, parent))
+        self._send_html(HOME_PAGE % {'email': html.escape(email), 'folders': folders, 'files': files})
+
+    # User endpoints
+
+    def create_user(self) -> None:
+        body = self._json_body()
+        if 'verifyPassword' in body and body['verifyPassword'] != body.get('password'):
+            return self._send_json(HTTPStatus.BAD_REQUEST, {'message': 'Passwords do not match'})
+        error = self.store.create_user(body.get('email', ''), body.get('password', ''))
+        if error:
+            return self._send_json(HTTPStatus.BAD_REQUEST, {'message': error})
+        token = self.store.login(body['email'], body['password'])
+        self._send_json(HTTPStatus.CREATED, {'email': body['email'], 'token': token},
+                        self._token_headers(token))
+
+    def login(self) -> None:
+        body = self._json_body()
+        token = self.store.login(body.get('email', ''), body.get('password', ''))
+        if not token:
+            return self._send_json(HTTPStatus.UNAUTHORIZED, {'message': 'Incorrect email or password'})
+        self._send_json(HTTPStatus.OK, {'email': body['email'], 'token': token}, self._token_headers(token))
+
+    def logout(self) -> None:
+        self._read_body()
+        self._send_json(HTTPStatus.OK, {}, self._token_headers('', max_age=0))
+
+    def get_user(self) -> None:
+        email = self._require_user()
+        if email:
+            self._send_json(HTTPStatus.OK, {'email': email})
+
+    # File and folder endpoints
+
+    def upload(self) -> None:
+        owner = self._require_user()
+        body = self._read_body()
+        if not owner:
+            return
+        content_type = self.headers.get('Content-Type', '')
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        ) if content_type.startswith('multipart/') else None
+        parent = self._query().get('parent', '/')
+        uploaded = []
+        for part in message.iter_parts() if message else []:
+            if part.get_filename():
+                uploaded.append(self.store.add_file(owner, part.get_filename(),
+                                                    part.get_payload(decode=True) or b'', parent))
+        if not uploaded:
+            return self._send_json(HTTPStatus.BAD_REQUEST, {'message': 'No file uploaded'})
+        self._send_json(HTTPStatus.OK, uploaded[0] if len(uploaded) == 1 else uploaded)
+
+    def list_files(self) -> None:
+        email = self._require_user()
+        if email:
+            self._send_json(HTTPStatus.OK, self.store.list_files(email, self._query().get('parent')))
+
+    def download(self, file_id: str) -> None:
+        email = self._require_user()
+        if not email:
+            return
+        file = self.store.files.get(file_id)
+        if not file or file['owner'] != email:
+            return self._send_json(HTTPStatus.NOT_FOUND, {'message': 'File not found'})
+        self._send(HTTPStatus.OK, file['data'], 'application/octet-stream', {
+            'Content-Disposition': f'attachment; filename="{file["filename"]}"'
+        })
+
+    def delete_file(self, file_id: str) -> None:
+        email = self._require_user()
+        if not email:
+            return
+        file = self.store.files.get(file_id)
+        if not file or file['owner'] != email:
+            return self._send_json(HTTPStatus.NOT_FOUND, {'message': 'File not found'})
+        self.store.files.pop(file_id, None)
+        self._send_json(HTTPStatus.OK, {})
+
+    def create_folder(self) -> None:
+        email = self._require_user()
+        body = self._json_body()
+        if email:
+            self._send_json(HTTPStatus.CREATED,
+                            self.store.add_folder(email, body.get('name', 'folder'), body.get('parent', '/')))
+
+    def list_folders(self) -> None:
+        email = self._require_user()
+        if email:
+            self._send_json(HTTPStatus.OK, self.store.list_folders(email, self._query().get('parent')))
+
+ROUTES = [
+    ('GET', r'/(?:login)?', FakeMyDriveHandler.login_page),
+    ('GET', r'/home', FakeMyDriveHandler.home_page),
+    ('GET', r'/folder/([0-9a-f]+)', FakeMyDriveHandler.home_page),
+    ('POST', r'/user-service/create', FakeMyDriveHandler.create_user),
+    ('POST', r'/user-service/login', FakeMyDriveHandler.login),
+    ('POST', r'/user-service/logout', FakeMyDriveHandler.logout),
+    ('GET', r'/user-service/user', FakeMyDriveHandler.get_user),
+    ('POST', r'/file-service/upload', FakeMyDriveHandler.upload),
+    ('GET', r'/file-service/list', FakeMyDriveHandler.list_files),
+    ('GET', r'/file-service/download/([0-9a-f]+)', FakeMyDriveHandler.download),
+    ('DELETE', r'/file-service/remove/([0-9a-f]+)', FakeMyDriveHandler.delete_file),
+    ('POST', r'/folder-service/create', FakeMyDriveHandler.create_folder),
+    ('GET', r'/folder-service/list', FakeMyDriveHandler.list_folders),
+]
+
+class FakeServerHTTP(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], owner: 'FakeMyDriveServer'):
+        super().__init__(address, FakeMyDriveHandler)
+        self.owner = owner
+
+class FakeMyDriveServer:
+    """
+    Fake myDrive running on a background thread
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0,
+                store: Optional[MemoryStore] = None):
+        """
+        :param host: Interface to listen on
+        :param port: Port to listen on, 0 picks a free one
+        :param latency: Seconds added to every request
+        :param store: Store to serve from, a fresh one by default
+        """
+        self.store = store or MemoryStore()
+        self.latency = latency
+        self.path_latency: Dict[str, float] = {}
+        self.requests = 0
+        self.handler_seconds = 0.0
+        self.injected_seconds = 0.0
+        self._stats_lock = threading.Lock()
+        self.httpd = FakeServerHTTP((host, port), self)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def set_latency(self, path_prefix: str, seconds: float) -> None:
+        """
+        Inject latency for requests whose path starts with a prefix,
+        replacing the default latency for those requests
+
+        :param path_prefix: Path prefix, e.g. '/file-service/'
+        :param seconds: Seconds to add
+        """
+        self.path_latency[path_prefix] = seconds
+
+    def latency_for(self, path: str) -> float:
+        """Get the injected latency of a request path, the longest prefix winning"""
+        prefixes = [p for p in self.path_latency if path.startswith(p)]
+        return self.path_latency[max(prefixes, key=len)] if prefixes else self.latency
+
+    def record(self, handler_seconds: float, injected_seconds: float) -> None:
+        with self._stats_lock:
+            self.requests += 1
+            self.handler_seconds += handler_seconds
+            self.injected_seconds += injected_seconds
+
+    def stats(self) -> Dict[str, Any]:
+        """Get request counts and the server side time spent handling them"""
+        return {'requests': self.requests, 'handler_seconds': self.handler_seconds,
+                'injected_seconds': self.injected_seconds}
+
+    def start(self) -> 'FakeMyDriveServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='fake-mydrive', daemon=True)
+        self._thread.start()
+        logger.info(f"Fake myDrive server listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a fake myDrive for offline runs")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3000)
+    parser.add_argument('--latency', type=float, default=0.0, help="ms added to every request")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = FakeMyDriveServer(args.host, args.port, args.latency / 1000)
+    logger.info(f"Fake myDrive server listening on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Module for generating synthetic files for upload tests and benchmarks.
+Content is deterministic for a given seed and is streamed to disk in
+chunks, so multi-GB files never sit in memory. Files are hashed while
+they are written and the digest goes straight into the HashCache.
+"""
+
+import logging
+import random
+import re
+from pathlib import Path
+from typing import Optional
+from configs.settings import config
+from utils.hashing import HashCache, StreamingHasher
+
+logger = logging.getLogger(__name__)
+
+SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+def parse_size(value: str) -> int:
+    """
+    Parse a human readable size such as '512KB' or '2GB'
+
+    :param value: Size string, a bare number is taken as bytes
+    :returns: Size in bytes
+    """
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?B)?\s*', value.upper())
+    if not match:
+        raise ValueError(f"Invalid size: {value}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2) or 'B'])
+
+def format_size(size: int) -> str:
+    """
+    Format a size in bytes using the largest whole unit
+
+    :param size: Size in bytes
+    :returns: Size string such as '10MB'
+    """
+    for unit in ('GB', 'MB', 'KB'):
+        if size >= SIZE_UNITS[unit] and size % SIZE_UNITS[unit] == 0:
+            return f"{size // SIZE_UNITS[unit]}{unit}"
+    return f"{size}B"
+
+class SyntheticFile:
+    """
+    A generated file and the digest of its content
+    """
+
+    def __init__(self, path: Path, size: int, digest: str):
+        self.path = path
+        self.size = size
+        self.digest = digest
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+class FileFactory:
+    """
+    Writes deterministic files of any size to a directory
+    """
+
+    def __init__(self, directory: Optional[Path] = None, chunk_size: int = 1024 ** 2,
+                sparse: Optional[bool] = None, algorithm: str = 'sha256',
+                hash_cache: Optional[HashCache] = None):
+        self.directory = Path(directory or config.cache_dir / 'synthetic')
+        self.chunk_size = chunk_size
+        self.sparse = config.upload_bench_sparse if sparse is None else sparse
+        self.algorithm = algorithm
+        self.hash_cache = hash_cache or HashCache()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def create(self, size: int, seed: int = 0, name: Optional[str] = None) -> SyntheticFile:
+        """
+        Generate a file, reusing an existing one with the same size, seed
+        and kind. The seed and kind are kept with the cached digest, so a
+        named file written from other content is regenerated
+
+        :param size: File size in bytes
+        :param seed: Seed that determines the content
+        :param name: File name, defaults to synthetic_<size>_<kind>_<seed>.bin
+        :returns: The generated file
+        """
+        kind = 'sparse' if self.sparse else 'random'
+        path = self.directory / (name or f"synthetic_{format_size(size)}_{kind}_{seed}.bin")
+        # Sparse files are all zeros, so their content does not depend on the seed
+        source = kind if self.sparse else f"{kind}:{seed}"
+
+        if path.exists() and path.stat().st_size == size:
+            digest = self.hash_cache.lookup(path, self.algorithm, source)
+            if digest:
+                return SyntheticFile(path, size, digest)
+
+        logger.info(f"Generating {format_size(size)} synthetic file: {path}")
+        digest = self._write_sparse(path, size) if self.sparse else self._write_random(path, size, seed)
+        self.hash_cache.put(path, digest, self.algorithm, source)
+        return SyntheticFile(path, size, digest)
+
+    def _write_random(self, path: Path, size: int, seed: int) -> str:
+        """
+        Stream pseudo-random content to disk one chunk at a time. A single
+        seeded block is generated and each chunk is stamped with its index,
+        so chunks differ without paying for a fresh random block each time
+        """
+        hasher = StreamingHasher(self.algorithm)
+        block = bytearray(random.Random(seed).randbytes(self.chunk_size))
+
+        with open(path, 'wb') as f:
+            written = 0
+            index = 0
+            while written < size:
+                block[:8] = index.to_bytes(8, 'little')
+                chunk = memoryview(block)[:min(self.chunk_size, size - written)]
+                f.write(chunk)
+                hasher.update(chunk)
+                written += len(chunk)
+                index += 1
+        return hasher.hexdigest()
+
+    def _write_sparse(self, path: Path, size: int) -> str:
+        """
+        Create a zero-filled file without writing its blocks, where the
+        filesystem supports sparse files
+        """
+        with open(path, 'wb') as f:
+            f.truncate(size)
+
+        hasher = StreamingHasher(self.algorithm)
+        zeros = bytes(self.chunk_size)
+        remaining = size
+        while remaining > 0:
+            chunk = zeros[:min(self.chunk_size, remaining)]
+            hasher.update(chunk)
+            remaining -= len(chunk)
+        return hasher.hexdigest()
@@ -0,0 +1,141 @@
+"""
+Module for hashing files in chunks and caching their digests.
+Digests are cached per file path, size and modification time so a source
+file is only hashed once, however many runs verify against it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+from configs.settings import config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ALGORITHM = 'sha256'
+CHUNK_SIZE = 1024 ** 2
+
+class StreamingHasher:
+    """
+    Incremental digest that also counts the bytes it has seen
+    """
+
+    def __init__(self, algorithm: str = DEFAULT_ALGORITHM):
+        self.algorithm = algorithm
+        self._hasher = hashlib.new(algorithm)
+        self.bytes = 0
+
+    def update(self, chunk: Union[bytes, memoryview]) -> None:
+        self._hasher.update(chunk)
+        self.bytes += len(chunk)
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+def file_digest(path: Union[str, Path], algorithm: str = DEFAULT_ALGORITHM,
+                chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    Hash a file without reading it into memory
+
+    :param path: File to hash
+    :param algorithm: hashlib algorithm name, e.g. sha256 or blake2b
+    :param chunk_size: Bytes read per chunk
+    :returns: Hex digest of the file
+    """
+    hasher = StreamingHasher(algorithm)
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+class HashCache:
+    """
+    On-disk cache of file digests keyed by path, size and mtime
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = Path(cache_path or config.cache_dir / 'hashes.json')
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    def get(self, path: Union[str, Path], algorithm: str = DEFAULT_ALGORITHM) -> str:
+        """
+        Get the digest of a file, hashing it only if it changed
+
+        :param path: File to hash
+        :param algorithm: hashlib algorithm name
+        :returns: Hex digest of the file
+        """
+        digest = self.lookup(path, algorithm)
+        if digest is None:
+            digest = file_digest(path, algorithm)
+            self.put(path, digest, algorithm)
+        return digest
+
+    def lookup(self, path: Union[str, Path], algorithm: str = DEFAULT_ALGORITHM,
+               source: Optional[str] = None) -> Optional[str]:
+        """
+        Get a cached digest without hashing
+
+        :param path: File to look up
+        :param algorithm: hashlib algorithm name
+        :param source: What the file was generated from, if it must match
+        :returns: Cached hex digest, or None if the file is unknown or changed
+        """
+        entry = self.entries.get(self._key(path, algorithm))
+        if not entry or entry['stamp'] != self._stamp(path):
+            return None
+        if source is not None and entry.get('source') != source:
+            return None
+        return entry['digest']
+
+    def put(self, path: Union[str, Path], digest: str, algorithm: str = DEFAULT_ALGORITHM,
+            source: Optional[str] = None) -> None:
+        """
+        Store a digest computed elsewhere, e.g. while a file was written.
+        Entries are kept in memory until flush() is called
+
+        :param path: File the digest belongs to
+        :param digest: Hex digest of the file
+        :param algorithm: hashlib algorithm name
+        :param source: What the file was generated from, e.g. its seed
+        """
+        entry = {'stamp': self._stamp(path), 'digest': digest}
+        if source is not None:
+            entry['source'] = source
+        self.entries[self._key(path, algorithm)] = entry
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write the cache to disk if any digest was stored since the last flush"""
+        if self._dirty:
+            self._save()
+            self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.cache_path.exists():
+            return {}
+        try:
+            return json.loads(self.cache_path.read_text())
+        except ValueError:
+            logger.warning(f"Ignoring corrupt hash cache: {self.cache_path}")
+            return {}
+
+    def _save(self) -> None:
+        """Merge with entries written by other processes and replace atomically"""
+        entries = {**self._load(), **self.entries}
+        tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entries))
+        os.replace(tmp_path, self.cache_path)
+
+    @staticmethod
+    def _key(path: Union[str, Path], algorithm: str) -> str:
+        return f"{algorithm}:{Path(path).resolve()}"
+
+    @staticmethod
+    def _stamp(path: Union[str, Path]) -> list:
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns]
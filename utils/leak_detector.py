@@ -0,0 +1,174 @@
+"""
+Module for detecting memory leaks in long-lived pages. A flow is repeated
+many times in one page, garbage is collected after every cycle and the JS
+heap, DOM node and event listener counts are sampled over CDP. A linear
+trend is fitted to each and compared with a per-cycle threshold; a heap
+snapshot is saved only when a leak is found.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from playwright.sync_api import Page, Error as PlaywrightError
+from configs.settings import config
+from utils.perf_metrics import PerfCollector
+from utils.workers import worker_id
+
+logger = logging.getLogger(__name__)
+
+# Performance.getMetrics gauges sampled after every cycle
+LEAK_METRICS = {'JSHeapUsedSize': 'heap_kb', 'Nodes': 'nodes',
+                'JSEventListeners': 'listeners', 'Documents': 'documents'}
+
+def linear_slope(values: List[float]) -> float:
+    """
+    Least squares slope of values sampled at equal steps
+
+    :param values: Samples in order
+    :returns: Growth per step, 0.0 for fewer than two samples
+    """
+    count = len(values)
+    if count < 2:
+        return 0.0
+    mean_x = (count - 1) / 2
+    mean_y = sum(values) / count
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    variance = sum((x - mean_x) ** 2 for x in range(count))
+    return covariance / variance
+
+class LeakDetector:
+    """
+    Repeats a flow in one page and checks its memory for steady growth
+    """
+
+    def __init__(self, page: Page, cycles: Optional[int] = None, warmup: Optional[int] = None,
+                 thresholds: Optional[Dict[str, float]] = None):
+        """
+        :param page: Page the flow runs in
+        :param cycles: Measured cycles, defaults to LEAK_CYCLES
+        :param warmup: Unmeasured cycles run first so caches and lazily
+            loaded code settle, defaults to LEAK_WARMUP_CYCLES
+        :param thresholds: Allowed growth per cycle of heap_kb, nodes and
+            listeners, defaults to the LEAK_*_PER_CYCLE settings
+        """
+        self.page = page
+        self.cycles = config.leak_cycles if cycles is None else cycles
+        self.warmup = config.leak_warmup_cycles if warmup is None else warmup
+        self.thresholds = thresholds or {
+            'heap_kb': config.leak_heap_kb_per_cycle,
+            'nodes': config.leak_nodes_per_cycle,
+            'listeners': config.leak_listeners_per_cycle
+        }
+        self.collector = PerfCollector.for_page(page)
+        self.samples: List[Dict[str, float]] = []
+        self.snapshot_path: Optional[Path] = None
+
+    @property
+    def supported(self) -> bool:
+        """Whether the browser exposes the CDP domains the detector needs"""
+        return self.collector.cdp is not None
+
+    def collect_garbage(self) -> None:
+        """Force a full garbage collection. The second pass frees what finalizers released"""
+        for _ in range(2):
+            self.collector.cdp.send('HeapProfiler.collectGarbage')
+
+    def sample(self) -> Dict[str, float]:
+        """
+        Collect garbage and sample the page's memory gauges
+
+        :returns: Dict of heap_kb, nodes, listeners and documents
+        """
+        self.collect_garbage()
+        metrics = self.collector.cdp_metrics()
+        sample = {key: metrics[name] for name, key in LEAK_METRICS.items() if name in metrics}
+        if 'heap_kb' in sample:
+            sample['heap_kb'] /= 1024
+        self.samples.append(sample)
+        return sample
+
+    def run(self, cycle: Callable[[], None]) -> List[Dict[str, float]]:
+        """
+        Run the warmup cycles, then sample after every measured cycle
+
+        :param cycle: One pass of the flow, ending in the state it started from
+        :returns: The samples, the first taken before the measured cycles
+        """
+        for _ in range(self.warmup):
+            cycle()
+
+        self.samples = []
+        self.sample()
+        for index in range(1, self.cycles + 1):
+            cycle()
+            sample = self.sample()
+            logger.debug(f"Cycle {index}/{self.cycles}: {sample}")
+        return self.samples
+
+    def trend(self) -> Dict[str, float]:
+        """Get the fitted growth per cycle of every sampled metric"""
+        keys = self.samples[0].keys() if self.samples else []
+        return {key: linear_slope([sample[key] for sample in self.samples]) for key in keys}
+
+    def leaks(self) -> Dict[str, float]:
+        """
+        Get the metrics growing faster than their threshold
+
+        :returns: Dict of metric name to growth per cycle
+        """
+        return {key: slope for key, slope in self.trend().items()
+                if key in self.thresholds and slope > self.thresholds[key]}
+
+    def take_heap_snapshot(self, path: Path) -> Path:
+        """
+        Save a heap snapshot, streaming its chunks to disk
+
+        :param path: Output .heapsnapshot file, loadable in DevTools
+        :returns: Path of the snapshot
+        """
+        cdp = self.collector.cdp
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            def write_chunk(event: Dict[str, Any]) -> None:
+                f.write(event['chunk'])
+
+            cdp.on('HeapProfiler.addHeapSnapshotChunk', write_chunk)
+            try:
+                cdp.send('HeapProfiler.takeHeapSnapshot', {'reportProgress': False})
+            finally:
+                cdp.remove_listener('HeapProfiler.addHeapSnapshotChunk', write_chunk)
+        return path
+
+    def write_report(self, name: str, directory: Optional[Path] = None) -> Path:
+        """
+        Write the samples, trend and leaks as JSON, with a heap snapshot
+        next to it only if a leak was found
+
+        :param name: Report name, e.g. the flow that was repeated
+        :param directory: Output directory, defaults to reports/leaks
+        :returns: Path of the written report
+        """
+        directory = Path(directory or config.reports_dir / 'leaks')
+        directory.mkdir(parents=True, exist_ok=True)
+        leaks = self.leaks()
+
+        if leaks:
+            try:
+                self.snapshot_path = self.take_heap_snapshot(
+                    directory / f"{name}_{worker_id()}.heapsnapshot")
+                logger.info(f"Saved heap snapshot to {self.snapshot_path}")
+            except PlaywrightError as e:
+                logger.warning(f"Could not take a heap snapshot: {e}")
+
+        path = directory / f"{name}_{worker_id()}.json"
+        path.write_text(json.dumps({
+            'cycles': self.cycles,
+            'warmup': self.warmup,
+            'thresholds': self.thresholds,
+            'trend': {key: round(slope, 3) for key, slope in self.trend().items()},
+            'leaks': leaks,
+            'heap_snapshot': str(self.snapshot_path) if self.snapshot_path else None,
+            'samples': self.samples
+        }, indent=2))
+        return path
@@ -0,0 +1,513 @@
+"""
+Module for generating browser load against a myDrive instance.
+Runs N virtual users concurrently through the existing page objects
+(register, login, upload, logout) with ramp-up, a target duration and
+think time, and reports per-step latency and error rates.
+
+By default the VUs of a process run as asyncio tasks on one shared
+browser. The threads mode gives every VU its own driver and browser, so
+it is capped at a few VUs per process.
+
+Usage:
+    python -m utils.load_runner --vus 200 --processes 4 --duration 300 --ramp-up 60
+    python -m utils.load_runner --vus 8 --processes 2 --mode threads
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
+from playwright.async_api import (async_playwright, Browser as AsyncBrowser,
+                                  BrowserContext as AsyncBrowserContext, Page as AsyncPage)
+from configs.settings import config
+from pages.login_page import LoginPage
+from pages.register_page import RegisterPage
+from pages.home_page import HomePage
+from pages.async_login_page import AsyncLoginPage
+from pages.async_register_page import AsyncRegisterPage
+from pages.async_home_page import AsyncHomePage
+from utils.db_helper import DatabaseHelper
+from utils.timing import summarize
+
+logger = logging.getLogger(__name__)
+
+LOAD_EMAIL_PREFIX = 'load.'
+
+# Browsers per process in threads mode, where every VU launches its own
+MAX_THREAD_BROWSERS = 8
+
+class StepFailed(Exception):
+    """Raised when a step completes but the app answers with an error status"""
+
+def describe_error(error: Exception) -> str:
+    """Describe an error by its type and first line, as grouped in the report"""
+    return f"{type(error).__name__}: {str(error).splitlines()[0] if str(error) else ''}"
+
+class LoadOptions:
+    """
+    Options describing a load run
+    """
+
+    def __init__(self, vus: int = 1, processes: int = 1, duration: float = 60,
+                ramp_up: float = 0, think_min: float = 1.0, think_max: float = 3.0,
+                upload_size: int = 64 * 1024, run_id: Optional[str] = None,
+                mode: str = 'async'):
+        self.vus = vus
+        self.mode = mode
+        self.processes = max(1, min(processes, vus))
+        if mode == 'threads' and math.ceil(vus / self.processes) > MAX_THREAD_BROWSERS:
+            raise ValueError(f"threads mode runs one browser per VU, at most {MAX_THREAD_BROWSERS} "
+                             f"per process; use more --processes or --mode async")
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.think_min = think_min
+        self.think_max = think_max
+        self.upload_size = upload_size
+        self.run_id = run_id or uuid.uuid4().hex[:8]
+
+    @property
+    def email_prefix(self) -> str:
+        """Email prefix shared by every user created in this run"""
+        return f"{LOAD_EMAIL_PREFIX}{self.run_id}."
+
+class VirtualUser:
+    """
+    A single simulated user repeatedly walking the myDrive flows
+    """
+
+    PASSWORD = 'LoadTest123!'
+
+    def __init__(self, index: int, browser: Browser, options: LoadOptions, upload_path: str):
+        self.index = index
+        self.browser = browser
+        self.options = options
+        self.upload_path = upload_path
+        self.samples: List[Dict[str, Any]] = []
+
+    def run(self, start_at: float, deadline: float) -> List[Dict[str, Any]]:
+        """
+        Run iterations until the deadline
+
+        :param start_at: Time at which this user should start (ramp-up)
+        :param deadline: Time after which no new iteration is started
+        :returns: Recorded step samples, including those of a user that stopped early
+        """
+        time.sleep(max(0.0, start_at - time.time()))
+
+        iteration = 0
+        try:
+            while time.time() < deadline:
+                self.iterate(iteration)
+                iteration += 1
+        except Exception as e:
+            self.record('iteration', 0.0, describe_error(e))
+            logger.warning(f"VU {self.index} stopped after {iteration} iterations: {e}")
+        return self.samples
+
+    def iterate(self, iteration: int) -> None:
+        """
+        Run one register -> logout -> login -> upload -> logout pass
+        in a fresh browser context
+
+        :param iteration: Iteration number, used to make a unique email
+        """
+        email = f"{self.options.email_prefix}{self.index}.{iteration}@example.com"
+        # A browser under load can fail to open a context; that is a step error too
+        opened = []
+        if not self.step('context', lambda: opened.extend(self.open_context())):
+            self.think()
+            return
+        context, page = opened
+
+        register_page = RegisterPage(page)
+        login_page = LoginPage(page)
+        home_page = HomePage(page)
+
+        steps = [
+            ('register', lambda: (register_page.navigate_to(),
+                                register_page.register(email, self.PASSWORD))),
+            ('logout_after_register', register_page.logout_after_register),
+            ('login', lambda: (login_page.login(email, self.PASSWORD),
+                            login_page.is_logged_in())),
+            ('upload_file', lambda: self.upload(page, home_page)),
+            ('logout', home_page.logout)
+        ]
+
+        try:
+            for name, step in steps:
+                if not self.step(name, step):
+                    break
+                self.think()
+        finally:
+            try:
+                context.close()
+            except Exception as e:
+                logger.debug(f"VU {self.index} could not close its context: {e}")
+
+    def open_context(self) -> Tuple[BrowserContext, Page]:
+        """
+        Open a fresh context and page for one iteration
+
+        :returns: The context and its page
+        """
+        context = self.browser.new_context(**config.get_browser_context_options())
+        try:
+            page = context.new_page()
+        except Exception:
+            context.close()
+            raise
+        page.set_default_timeout(config.default_timeout)
+        return context, page
+
+    def upload(self, page: Page, home_page: HomePage) -> None:
+        """
+        Upload the file and wait for the upload call to answer, so the step
+        times the whole upload and the next step cannot cut it off
+
+        :param page: The virtual user's page
+        :param home_page: Home page object on that page
+        """
+        with page.expect_response(HomePage.UPLOAD_RESPONSE, timeout=config.upload_timeout) as response_info:
+            home_page.upload_file(self.upload_path)
+        response = response_info.value
+        if not response.ok:
+            raise StepFailed(f"upload answered HTTP {response.status}")
+
+    def step(self, name: str, action: Callable[[], Any]) -> bool:
+        """
+        Time a single step
+
+        :param name: Step name used in the report
+        :param action: Callable performing the step
+        :returns: True if the step succeeded
+        """
+        start = time.perf_counter()
+        error = None
+        try:
+            action()
+        except Exception as e:
+            error = describe_error(e)
+            logger.debug(f"VU {self.index} step {name} failed: {error}")
+
+        self.record(name, time.perf_counter() - start, error)
+        return error is None
+
+    def record(self, name: str, elapsed: float, error: Optional[str] = None) -> None:
+        """
+        Record a step sample
+
+        :param name: Step name used in the report
+        :param elapsed: Wall time in seconds
+        :param error: Error description, None if the step succeeded
+        """
+        self.samples.append({
+            'step': name,
+            'vu': self.index,
+            'elapsed': elapsed,
+            'error': error
+        })
+
+    def think(self) -> None:
+        """Pause like a real user between steps"""
+        time.sleep(random.uniform(self.options.think_min, self.options.think_max))
+
+class AsyncVirtualUser(VirtualUser):
+    """
+    Virtual user driven through the async page objects, so one browser
+    per process can host many concurrent users as asyncio tasks
+    """
+
+    def __init__(self, index: int, browser: AsyncBrowser, options: LoadOptions, upload_path: str):
+        super().__init__(index, browser, options, upload_path)
+
+    async def run(self, start_at: float, deadline: float) -> List[Dict[str, Any]]:
+        await asyncio.sleep(max(0.0, start_at - time.time()))
+
+        iteration = 0
+        try:
+            while time.time() < deadline:
+                await self.iterate(iteration)
+                iteration += 1
+        except Exception as e:
+            self.record('iteration', 0.0, describe_error(e))
+            logger.warning(f"VU {self.index} stopped after {iteration} iterations: {e}")
+        return self.samples
+
+    async def iterate(self, iteration: int) -> None:
+        email = f"{self.options.email_prefix}{self.index}.{iteration}@example.com"
+        opened = []
+
+        async def open_context():
+            opened.extend(await self.open_context())
+
+        if not await self.step('context', open_context):
+            await self.think()
+            return
+        context, page = opened
+
+        register_page = AsyncRegisterPage(page)
+        login_page = AsyncLoginPage(page)
+        home_page = AsyncHomePage(page)
+
+        async def register():
+            await register_page.navigate_to()
+            await register_page.register(email, self.PASSWORD)
+
+        async def login():
+            await login_page.login(email, self.PASSWORD)
+            await login_page.is_logged_in()
+
+        steps = [
+            ('register', register),
+            ('logout_after_register', register_page.logout_after_register),
+            ('login', login),
+            ('upload_file', lambda: self.upload(page, home_page)),
+            ('logout', home_page.logout)
+        ]
+
+        try:
+            for name, step in steps:
+                if not await self.step(name, step):
+                    break
+                await self.think()
+        finally:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"VU {self.index} could not close its context: {e}")
+
+    async def open_context(self) -> Tuple[AsyncBrowserContext, AsyncPage]:
+        context = await self.browser.new_context(**config.get_browser_context_options())
+        try:
+            page = await context.new_page()
+        except Exception:
+            await context.close()
+            raise
+        page.set_default_timeout(config.default_timeout)
+        return context, page
+
+    async def upload(self, page: AsyncPage, home_page: AsyncHomePage) -> None:
+        async with page.expect_response(AsyncHomePage.UPLOAD_RESPONSE,
+                                        timeout=config.upload_timeout) as response_info:
+            await home_page.upload_file(self.upload_path)
+        response = await response_info.value
+        if not response.ok:
+            raise StepFailed(f"upload answered HTTP {response.status}")
+
+    async def step(self, name: str, action: Callable[[], Any]) -> bool:
+        start = time.perf_counter()
+        error = None
+        try:
+            await action()
+        except Exception as e:
+            error = describe_error(e)
+            logger.debug(f"VU {self.index} step {name} failed: {error}")
+
+        self.record(name, time.perf_counter() - start, error)
+        return error is None
+
+    async def think(self) -> None:
+        await asyncio.sleep(random.uniform(self.options.think_min, self.options.think_max))
+
+def _vu_thread(index: int, options: LoadOptions, upload_path: str,
+               start_at: float, deadline: float, results: List[Dict[str, Any]]) -> None:
+    """
+    Thread body for one virtual user. Playwright's sync API is bound to the
+    thread that started it, so each thread owns its own browser. The VU's
+    samples are kept even if its browser fails
+    """
+    samples: List[Dict[str, Any]] = []
+    try:
+        with sync_playwright() as playwright:
+            browser = getattr(playwright, config.browser).launch(**config.get_browser_launch_options())
+            try:
+                vu = VirtualUser(index, browser, options, upload_path)
+                samples = vu.samples
+                vu.run(start_at, deadline)
+            finally:
+                browser.close()
+    except Exception as e:
+        logger.warning(f"VU {index} lost its browser: {e}")
+        samples.append({'step': 'browser', 'vu': index, 'elapsed': 0.0, 'error': describe_error(e)})
+    finally:
+        results.extend(samples)
+
+async def _run_async_vus(indexes: List[int], options: LoadOptions, upload_path: str,
+                        run_start: float, deadline: float) -> List[Dict[str, Any]]:
+    """
+    Run a slice of virtual users as asyncio tasks sharing one browser.
+    A failing VU never discards the samples of the others
+    """
+    vus: List[AsyncVirtualUser] = []
+    try:
+        async with async_playwright() as playwright:
+            browser = await getattr(playwright, config.browser).launch(**config.get_browser_launch_options())
+            try:
+                vus = [AsyncVirtualUser(index, browser, options, upload_path) for index in indexes]
+                await asyncio.gather(*(
+                    vu.run(run_start + options.ramp_up * vu.index / options.vus, deadline) for vu in vus
+                ), return_exceptions=True)
+            finally:
+                await browser.close()
+    except Exception as e:
+        logger.warning(f"Browser of VUs {indexes[0]}..{indexes[-1]} failed: {e}")
+        return [sample for vu in vus for sample in vu.samples] + [
+            {'step': 'browser', 'vu': index, 'elapsed': 0.0, 'error': describe_error(e)}
+            for index in indexes
+        ]
+    return [sample for vu in vus for sample in vu.samples]
+
+def _run_process(args) -> List[Dict[str, Any]]:
+    """
+    Run a slice of the virtual users in one process
+
+    :param args: Tuple of (vu indexes, options, run start time)
+    :returns: Samples recorded by every virtual user in this process
+    """
+    indexes, options, run_start = args
+    deadline = run_start + options.duration
+
+    with tempfile.NamedTemporaryFile(prefix='load-upload-', suffix='.bin', delete=False) as upload:
+        upload.write(random.Random(options.run_id).randbytes(options.upload_size))
+    upload_path = upload.name
+
+    if options.mode == 'async':
+        try:
+            return asyncio.run(_run_async_vus(indexes, options, upload_path, run_start, deadline))
+        finally:
+            Path(upload_path).unlink(missing_ok=True)
+
+    results: List[Dict[str, Any]] = []
+    threads = []
+    for index in indexes:
+        start_at = run_start + options.ramp_up * index / options.vus
+        thread = threading.Thread(
+            target=_vu_thread,
+            args=(index, options, upload_path, start_at, deadline, results),
+            name=f"vu-{index}"
+        )
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+    Path(upload_path).unlink(missing_ok=True)
+    return results
+
+def run_load(options: LoadOptions) -> Dict[str, Any]:
+    """
+    Run a load test and aggregate the results
+
+    :param options: Load run options
+    :returns: Report dict with per-step latency percentiles and error rates
+    """
+    logger.info(f"Starting load run {options.run_id}: {options.vus} VUs across "
+                f"{options.processes} processes for {options.duration}s")
+    run_start = time.time()
+    slices = [list(range(options.vus))[i::options.processes] for i in range(options.processes)]
+
+    with get_context('spawn').Pool(options.processes) as pool:
+        samples = [s for chunk in pool.map(_run_process, [(sl, options, run_start) for sl in slices])
+                   for s in chunk]
+
+    return build_report(samples, options, time.time() - run_start)
+
+def build_report(samples: List[Dict[str, Any]], options: LoadOptions, wall_time: float) -> Dict[str, Any]:
+    """
+    Aggregate step samples into a report
+
+    :param samples: Samples recorded by the virtual users
+    :param options: Load run options
+    :param wall_time: Total run time in seconds
+    :returns: Report dict
+    """
+    by_step = defaultdict(list)
+    errors = defaultdict(lambda: defaultdict(int))
+    for sample in samples:
+        by_step[sample['step']].append(sample['elapsed'])
+        if sample['error']:
+            errors[sample['step']][sample['error']] += 1
+
+    steps = {}
+    for step, values in by_step.items():
+        error_count = sum(errors[step].values())
+        steps[step] = {
+            **summarize(values),
+            'errors': error_count,
+            'error_rate': round(error_count / len(values), 4),
+            'error_types': dict(errors[step])
+        }
+
+    return {
+        'run_id': options.run_id,
+        'base_url': config.base_url,
+        'vus': options.vus,
+        'processes': options.processes,
+        'mode': options.mode,
+        'duration': options.duration,
+        'ramp_up': options.ramp_up,
+        'wall_time': round(wall_time, 3),
+        'steps': steps
+    }
+
+def write_report(report: Dict[str, Any], path: Optional[Path] = None) -> Path:
+    """
+    Write a load report as JSON
+
+    :param report: Report returned by run_load
+    :param path: Output file, defaults to reports/load/load_<timestamp>.json
+    :returns: Path of the written report
+    """
+    path = Path(path or config.reports_dir / 'load' /
+                f"load_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{report['run_id']}.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2))
+    return path
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Drive browser load against myDrive")
+    parser.add_argument('--vus', type=int, default=1, help="Number of concurrent virtual users")
+    parser.add_argument('--processes', type=int, default=1, help="Worker processes to spread VUs over")
+    parser.add_argument('--duration', type=float, default=60, help="Target duration in seconds")
+    parser.add_argument('--ramp-up', type=float, default=0, help="Seconds over which VUs are started")
+    parser.add_argument('--think-min', type=float, default=1.0, help="Minimum think time in seconds")
+    parser.add_argument('--think-max', type=float, default=3.0, help="Maximum think time in seconds")
+    parser.add_argument('--upload-size', type=int, default=64 * 1024, help="Size of the uploaded file in bytes")
+    parser.add_argument('--mode', choices=['async', 'threads'], default='async',
+                        help="async: one browser per process hosting many VUs, threads: one browser "
+                             f"per VU, at most {MAX_THREAD_BROWSERS} per process")
+    parser.add_argument('--cleanup', action='store_true', help="Delete the users created by this run")
+    parser.add_argument('--output', type=Path, help="Report path")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)8s] %(message)s')
+    try:
+        options = LoadOptions(args.vus, args.processes, args.duration, args.ramp_up,
+                            args.think_min, args.think_max, args.upload_size, mode=args.mode)
+    except ValueError as e:
+        parser.error(str(e))
+    report = run_load(options)
+    path = write_report(report, args.output)
+
+    for step, stats in report['steps'].items():
+        logger.info(f"{step}: n={stats['count']} p50={stats['p50_ms']}ms "
+                    f"p95={stats['p95_ms']}ms errors={stats['error_rate']:.1%}")
+    logger.info(f"Wrote load report to {path}")
+
+    if args.cleanup:
+        DatabaseHelper(config.mongodb_url).bulk_cleanup(email_prefix=options.email_prefix)
+
+if __name__ == '__main__':
+    main()
@@ -1,57 +1,88 @@
 """
 Module for centralized logging configuration and utils for
 the test suite. Handles log formatting, file output, and log
-levels
+levels. Records are handed to a background queue listener so
+console and file I/O never block the test thread.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Dict, Tuple
 from configs.settings import config
+from utils.workers import worker_id
 
-def setup_logger(name: str, level: int = logging.INFO, 
+# One queue and listener per log file, shared by every logger writing to it
+_listeners: Dict[Path, Tuple[queue.SimpleQueue, QueueListener]] = {}
+
+# Default log file of this process, created on first use
+_session_log_path: Optional[Path] = None
+
+def _default_log_path() -> Path:
+    global _session_log_path
+    if _session_log_path is None:
+        _session_log_path = config.logs_dir / f"test_{worker_id()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    return _session_log_path
+
+def _get_queue(log_path: Path) -> queue.SimpleQueue:
+    """
+    Get the queue feeding a log file, starting its listener if needed
+
+    :param log_path: Log file the listener writes to
+    :returns: Queue to attach a QueueHandler to
+    """
+    if log_path not in _listeners:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        file_handler = logging.FileHandler(log_path)
+        file_handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, console_handler, file_handler)
+        listener.start()
+        _listeners[log_path] = (log_queue, listener)
+
+    return _listeners[log_path][0]
+
+def setup_logger(name: str, level: int = logging.INFO,
                 log_file: Optional[str] = None) -> logging.Logger:
     """
     Set up a logger with specified configuration.
-    
+
     :param name: Logger name (usually __name__)
     :param level: Logging level
-    :param log_file: Optional log file name
+    :param log_file: Optional log file name, defaults to one file per session
     :returns: Configured logger instance
-    """        
+    """
 
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
+
     # Remove existing handlers
     logger.handlers = []
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
-    if log_file:
-        log_path = config.logs_dir / log_file
-    else:
-        log_path = config.logs_dir / f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-    
-    file_handler = logging.FileHandler(log_path)
-    file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    
+
+    log_path = config.logs_dir / log_file if log_file else _default_log_path()
+    logger.addHandler(QueueHandler(_get_queue(log_path)))
+
     return logger
 
+def shutdown_logging() -> None:
+    """Flush and stop every queue listener"""
+    while _listeners:
+        _, (_, listener) = _listeners.popitem()
+        listener.stop()
+
+atexit.register(shutdown_logging)
+
 def get_logger(name: str) -> logging.Logger:
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)
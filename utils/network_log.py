@@ -0,0 +1,60 @@
+"""
+Module for capturing browser network events cheaply.
+Events are kept as raw Playwright objects in a bounded ring buffer and are
+only formatted and written to disk when a test fails.
+"""
+
+import re
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from playwright.sync_api import Request, Response
+from configs.settings import config
+
+class NetworkRingBuffer:
+    """
+    Bounded buffer of the most recent requests and responses of a test
+    """
+
+    def __init__(self, maxlen: Optional[int] = None):
+        self.events = deque(maxlen=maxlen or config.network_log_size)
+
+    def on_request(self, request: Request) -> None:
+        self.events.append((time.time(), request))
+
+    def on_response(self, response: Response) -> None:
+        self.events.append((time.time(), response))
+
+    def format(self) -> List[str]:
+        """
+        Format the buffered events
+
+        :returns: One log line per event, oldest first
+        """
+        lines = []
+        for timestamp, event in self.events:
+            when = datetime.fromtimestamp(timestamp).strftime('%H:%M:%S.%f')[:-3]
+            if isinstance(event, Response):
+                lines.append(f"{when} Response: {event.status} {event.url}")
+            else:
+                lines.append(f"{when} Request: {event.method} {event.url}")
+        return lines
+
+    def flush(self, test_id: str, directory: Optional[Path] = None) -> Path:
+        """
+        Write the buffered events of a failed test to disk
+
+        :param test_id: Test node id, used for the file name
+        :param directory: Output directory, defaults to reports/logs/network
+        :returns: Path of the written log
+        """
+        directory = Path(directory or config.logs_dir / 'network')
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', test_id)}.log"
+        path.write_text('\n'.join(self.format()) + '\n')
+        return path
+
+    def clear(self) -> None:
+        self.events.clear()
@@ -0,0 +1,244 @@
+"""
+Module for collecting browser-side performance metrics around page
+navigations and transitions. Navigation and paint timing, LCP, CLS,
+resource summaries and JS heap size come from the page itself, and
+Chromium's runtime counters from a CDP session. Samples are checked
+against per-page budgets and attached to the test results.
+"""
+
+import json
+import logging
+import time
+import warnings
+import weakref
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from playwright.sync_api import Page, CDPSession, Error as PlaywrightError
+from configs.settings import config
+from utils.workers import worker_id
+from utils.throttling import active_profile
+
+logger = logging.getLogger(__name__)
+
+# Collects metrics of the current document. With `since` from an earlier
+# mark in the same document, only what happened after the mark is reported
+COLLECT_JS = """
+async (since) => {
+    const observe = (type) => new Promise(resolve => {
+        const entries = [];
+        try {
+            const observer = new PerformanceObserver(list => entries.push(...list.getEntries()));
+            observer.observe({type, buffered: true});
+            setTimeout(() => { observer.disconnect(); resolve(entries); }, 50);
+        } catch (e) {
+            resolve(entries);
+        }
+    });
+    const soft = since !== null && since.time_origin === performance.timeOrigin;
+    const after = soft ? since.now : 0;
+    const [lcp, shifts] = await Promise.all([observe('largest-contentful-paint'), observe('layout-shift')]);
+    const [nav] = performance.getEntriesByType('navigation');
+    const paints = Object.fromEntries(performance.getEntriesByType('paint').map(e => [e.name, e.startTime]));
+    const resources = performance.getEntriesByType('resource').filter(e => e.startTime >= after);
+    const largest = lcp.filter(e => e.startTime >= after).pop();
+    const slowest = [...resources].sort((a, b) => b.duration - a.duration).slice(0, 5);
+    return {
+        navigation: !soft,
+        ttfb_ms: !soft && nav ? nav.responseStart - nav.requestStart : null,
+        dom_content_loaded_ms: !soft && nav ? nav.domContentLoadedEventEnd || null : null,
+        load_ms: !soft && nav ? nav.loadEventEnd || null : null,
+        fp_ms: soft ? null : paints['first-paint'] ?? null,
+        fcp_ms: soft ? null : paints['first-contentful-paint'] ?? null,
+        lcp_ms: largest ? largest.startTime - after : null,
+        cls: shifts.filter(e => !e.hadRecentInput && e.startTime >= after).reduce((sum, e) => sum + e.value, 0),
+        resource_count: resources.length,
+        transfer_kb: resources.reduce((sum, e) => sum + (e.transferSize || 0), 0) / 1024,
+        resource_types: resources.reduce((types, e) => {
+            types[e.initiatorType] = (types[e.initiatorType] || 0) + 1;
+            return types;
+        }, {}),
+        slowest_resources: slowest.map(e => ({name: e.name, duration_ms: e.duration})),
+        js_heap_mb: performance.memory ? performance.memory.usedJSHeapSize / 1048576 : null
+    };
+}
+"""
+
+MARK_JS = "() => ({time_origin: performance.timeOrigin, now: performance.now()})"
+
+# Cumulative CDP counters, reported as the change over a transition
+CDP_DURATIONS = {'TaskDuration': 'cdp_task_ms', 'ScriptDuration': 'cdp_script_ms',
+                 'LayoutDuration': 'cdp_layout_ms', 'RecalcStyleDuration': 'cdp_style_ms'}
+CDP_COUNTS = {'LayoutCount': 'cdp_layouts', 'RecalcStyleCount': 'cdp_style_recalcs'}
+# Point-in-time CDP gauges
+CDP_GAUGES = {'JSHeapUsedSize': 'cdp_heap_mb', 'Nodes': 'cdp_nodes',
+              'JSEventListeners': 'cdp_listeners', 'Documents': 'cdp_documents'}
+
+class PerfBudgetExceeded(AssertionError):
+    """Raised in fail mode when a navigation or transition exceeds its budget"""
+
+class PerfBudgetWarning(UserWarning):
+    """Emitted in warn mode when a navigation or transition exceeds its budget"""
+
+class PerfCollector:
+    """
+    Collects performance metrics of one page
+    """
+
+    _collectors: 'weakref.WeakKeyDictionary[Page, PerfCollector]' = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page):
+        self.page = page
+        self._cdp: Optional[CDPSession] = None
+        self._cdp_failed = False
+
+    @classmethod
+    def for_page(cls, page: Page) -> 'PerfCollector':
+        """Get the collector of a page, shared by every page object using it"""
+        if page not in cls._collectors:
+            cls._collectors[page] = cls(page)
+        return cls._collectors[page]
+
+    @property
+    def cdp(self) -> Optional[CDPSession]:
+        """CDP session with the Performance domain enabled, Chromium only"""
+        if self._cdp is None and not self._cdp_failed:
+            try:
+                self._cdp = self.page.context.new_cdp_session(self.page)
+                self._cdp.send('Performance.enable')
+            except PlaywrightError:
+                logger.debug("CDP is not available, collecting page metrics only")
+                self._cdp_failed = True
+        return self._cdp
+
+    def cdp_metrics(self) -> Dict[str, float]:
+        """
+        Get Chromium's runtime performance counters
+
+        :returns: Dict of metric name to value, empty without CDP
+        """
+        if self.cdp is None:
+            return {}
+        try:
+            return {m['name']: m['value'] for m in self.cdp.send('Performance.getMetrics')['metrics']}
+        except PlaywrightError as e:
+            logger.debug(f"Performance.getMetrics failed: {e}")
+            return {}
+
+    def mark(self) -> Dict[str, Any]:
+        """
+        Remember the state before a transition
+
+        :returns: Mark to pass to collect
+        """
+        try:
+            page_mark = self.page.evaluate(MARK_JS)
+        except PlaywrightError:
+            # Nothing loaded yet, or the document is going away
+            page_mark = None
+        return {'page': page_mark, 'cdp': self.cdp_metrics()}
+
+    def collect(self, mark: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Collect the metrics of the current document, or of what happened
+        after a mark when the document did not change since
+
+        :param mark: Result of mark() taken before the transition
+        :returns: Dict of metrics, or None if the page could not be read
+        """
+        try:
+            metrics = self.page.evaluate(COLLECT_JS, mark['page'] if mark else None)
+        except PlaywrightError as e:
+            # The page closed or navigated again while being read
+            logger.debug(f"Skipping performance sample, collecting failed: {e}")
+            return None
+
+        cdp_before = mark['cdp'] if mark else {}
+        cdp_after = self.cdp_metrics()
+        for name, key in CDP_DURATIONS.items():
+            if name in cdp_after:
+                metrics[key] = (cdp_after[name] - cdp_before.get(name, 0.0)) * 1000
+        for name, key in CDP_COUNTS.items():
+            if name in cdp_after:
+                metrics[key] = cdp_after[name] - cdp_before.get(name, 0.0)
+        for name, key in CDP_GAUGES.items():
+            if name in cdp_after:
+                metrics[key] = cdp_after[name] / 1048576 if name == 'JSHeapUsedSize' else cdp_after[name]
+        return metrics
+
+class PerfRecorder:
+    """
+    Collects performance samples per test and checks them against budgets
+    """
+
+    def __init__(self, budgets_path: Optional[Path] = None, mode: Optional[str] = None):
+        self.budgets_path = Path(budgets_path or config.perf_budgets_file)
+        self.mode = mode or config.perf_budget_mode
+        self.budgets: Dict[str, Dict[str, float]] = self._load_budgets()
+        self.current_test: Optional[str] = None
+        self.samples: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+    def budget_for(self, label: str) -> Dict[str, float]:
+        """
+        Get the budget of a navigation or transition. The default budget is
+        overridden by the page's budget, e.g. 'HomePage', and that by the
+        action's, e.g. 'LoginPage.login'
+
+        :param label: Page object and action, e.g. 'LoginPage.navigate'
+        :returns: Dict of metric name to limit
+        """
+        budget = dict(self.budgets.get('default', {}))
+        budget.update(self.budgets.get(label.split('.')[0], {}))
+        budget.update(self.budgets.get(label, {}))
+        return budget
+
+    def record(self, label: str, metrics: Dict[str, Any]) -> List[str]:
+        """
+        Record a sample and check it against its budget
+
+        :param label: Page object and action, e.g. 'LoginPage.navigate'
+        :param metrics: Collected metrics
+        :returns: Descriptions of the exceeded limits
+        """
+        violations = [
+            f"{metric}={metrics[metric]:.2f} > {limit}"
+            for metric, limit in self.budget_for(label).items()
+            if isinstance(metrics.get(metric), (int, float)) and metrics[metric] > limit
+        ]
+        sample = {'label': label, 'timestamp': time.time(), 'throttle': active_profile().name,
+                  'violations': violations, **metrics}
+        self.samples[self.current_test or 'unknown'].append(sample)
+
+        if violations and self.mode != 'off':
+            message = f"{label} exceeded its performance budget: {', '.join(violations)}"
+            if self.mode == 'fail':
+                raise PerfBudgetExceeded(message)
+            warnings.warn(message, PerfBudgetWarning)
+        return violations
+
+    def test_samples(self, test_id: str) -> List[Dict[str, Any]]:
+        """Get the samples recorded by a test"""
+        return self.samples.get(test_id, [])
+
+    def write_report(self, path: Optional[Path] = None) -> Optional[Path]:
+        """
+        Write every sample as JSON
+
+        :param path: Output file, defaults to reports/perf/perf_<worker>.json
+        :returns: Path of the written report, or None if nothing was recorded
+        """
+        if not self.samples:
+            return None
+        path = Path(path or config.reports_dir / 'perf' / f"perf_{worker_id()}.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'mode': self.mode, 'budgets': self.budgets, 'tests': self.samples},
+                                   indent=2))
+        logger.info(f"Wrote performance metrics to {path}")
+        return path
+
+    def _load_budgets(self) -> Dict[str, Dict[str, float]]:
+        if not self.budgets_path.exists():
+            return {}
+        return json.loads(self.budgets_path.read_text())
+
+perf_recorder = PerfRecorder()
@@ -0,0 +1,171 @@
+"""
+Module for the opt-in routing layer installed on browser contexts.
+Serves immutable static assets from an on-disk content-addressed cache and
+blocks requests matching configured URL patterns.
+"""
+
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import requests
+from playwright.sync_api import BrowserContext, Route
+from configs.settings import config
+
+logger = logging.getLogger(__name__)
+
+def resolve_app_version() -> str:
+    """
+    Get the version of the app under test. Uses APP_VERSION when set,
+    otherwise hashes the index page, which references the hashed bundles
+
+    :returns: Version string used to key the asset index
+    """
+    if config.app_version:
+        return config.app_version
+    try:
+        response = requests.get(config.base_url, timeout=config.default_timeout / 1000)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.warning(f"Could not determine app version, asset cache disabled for this run: {e}")
+        return ''
+    return hashlib.sha256(response.content).hexdigest()[:16]
+
+class AssetCache:
+    """
+    Content-addressed cache of static asset responses
+    """
+
+    CACHEABLE_TYPES = {'script', 'stylesheet', 'font', 'image'}
+    # Bodies are stored decoded, so length and encoding headers no longer apply
+    DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+    def __init__(self, version: str, cache_dir: Optional[Path] = None):
+        self.version = version
+        self.cache_dir = Path(cache_dir or config.asset_cache_dir)
+        self.objects_dir = self.cache_dir / 'objects'
+        self.index_path = self.cache_dir / f"index-{version}.json"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+        self.index: Dict[str, Dict[str, Any]] = {}
+        if self.index_path.exists():
+            try:
+                self.index = json.loads(self.index_path.read_text())
+            except ValueError:
+                logger.warning(f"Ignoring corrupt asset index: {self.index_path}")
+        self._dirty = False
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached response for a url
+
+        :param url: Request url
+        :returns: Index entry with status, headers and body path, or None
+        """
+        entry = self.index.get(url)
+        if entry and (self.objects_dir / entry['digest']).exists():
+            return entry
+        return None
+
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        """
+        Add a response to the cache
+
+        :param url: Request url
+        :param status: Response status code
+        :param headers: Response headers
+        :param body: Decoded response body
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self.objects_dir / digest
+        if not object_path.exists():
+            tmp_path = object_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, object_path)
+
+        self.index[url] = {
+            'digest': digest,
+            'status': status,
+            'size': len(body),
+            'headers': {k: v for k, v in headers.items() if k.lower() not in self.DROPPED_HEADERS}
+        }
+        self._dirty = True
+
+    def body_path(self, entry: Dict[str, Any]) -> Path:
+        return self.objects_dir / entry['digest']
+
+    def save(self) -> None:
+        """Merge this run's entries into the on-disk index"""
+        if not self._dirty:
+            return
+        index = {}
+        if self.index_path.exists():
+            try:
+                index = json.loads(self.index_path.read_text())
+            except ValueError:
+                pass
+        index.update(self.index)
+
+        tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(index))
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    @staticmethod
+    def is_cacheable(headers: Dict[str, str]) -> bool:
+        cache_control = headers.get('cache-control', '').lower()
+        return 'no-store' not in cache_control and 'no-cache' not in cache_control
+
+class RequestRouter:
+    """
+    Routes every request of a context through the asset cache and block list
+    """
+
+    def __init__(self, asset_cache: Optional[AssetCache] = None,
+                block_patterns: Optional[List[str]] = None):
+        self.asset_cache = asset_cache
+        self.block_patterns = block_patterns or []
+        self.stats = {'hits': 0, 'misses': 0, 'blocked': 0, 'bytes_saved': 0}
+
+    def install(self, context: BrowserContext) -> None:
+        """
+        Install the router on a context
+
+        :param context: Context whose requests should be routed
+        """
+        context.route("**/*", self._handle)
+
+    def hit_ratio(self) -> float:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+    def _handle(self, route: Route) -> None:
+        request = route.request
+
+        if any(fnmatch.fnmatch(request.url, pattern) for pattern in self.block_patterns):
+            self.stats['blocked'] += 1
+            logger.debug(f"Blocked request: {request.url}")
+            route.abort('blockedbyclient')
+            return
+
+        if (self.asset_cache is None or request.method != 'GET'
+                or request.resource_type not in AssetCache.CACHEABLE_TYPES):
+            route.fallback()
+            return
+
+        entry = self.asset_cache.lookup(request.url)
+        if entry:
+            self.stats['hits'] += 1
+            self.stats['bytes_saved'] += entry['size']
+            route.fulfill(status=entry['status'], headers=entry['headers'],
+                        path=self.asset_cache.body_path(entry))
+            return
+
+        self.stats['misses'] += 1
+        response = route.fetch()
+        if response.status == 200 and AssetCache.is_cacheable(response.headers):
+            self.asset_cache.store(request.url, response.status, response.headers, response.body())
+        route.fulfill(response=response)
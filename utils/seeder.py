@@ -0,0 +1,95 @@
+"""
+Module for seeding test users and their content without the browser.
+Users are created through myDrive's registration endpoint with the pooled
+MyDriveClient, and files and folders are bulk inserted through the
+DatabaseHelper.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List
+import requests
+from configs.settings import config
+from utils.api_client import MyDriveClient
+from utils.db_helper import DatabaseHelper
+
+logger = logging.getLogger(__name__)
+
+class UserSeeder:
+    """
+    Creates test users in bulk over HTTP
+    """
+
+    CREATED = 'created'
+    EXISTS = 'exists'
+    FAILED = 'failed'
+
+    def __init__(self, db_helper: Optional[DatabaseHelper] = None,
+                api_url: Optional[str] = None, max_workers: Optional[int] = None,
+                client: Optional[MyDriveClient] = None):
+        self.db_helper = db_helper
+        self.max_workers = max_workers or config.seed_workers
+        # One pooled client for every worker thread
+        self.client = client or MyDriveClient(api_url, pool_size=self.max_workers)
+        self._owns_client = client is None
+
+    def register_user(self, user: Dict[str, Any]) -> str:
+        """
+        Register a single user through the API
+
+        :param user: User dict containing email and password
+        :returns: One of CREATED, EXISTS or FAILED
+        """
+        try:
+            response = self.client.register(user['email'], user['password'], check=False)
+        except requests.RequestException as e:
+            logger.error(f"Error when registering user {user['email']}: {e}")
+            return self.FAILED
+
+        if response.ok:
+            logger.debug(f"Registered user: {user['email']}")
+            return self.CREATED
+        if self.db_helper and self.db_helper.find_user(user['email']):
+            logger.debug(f"User already exists: {user['email']}")
+            return self.EXISTS
+
+        logger.error(f"Failed to register {user['email']}: {response.status_code} {response.text[:200]}")
+        return self.FAILED
+
+    def seed_users(self, users: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Register many users concurrently in one call
+
+        :param users: List of user dicts containing email and password
+        :returns: Dict mapping each email to its seeding status
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            statuses = list(executor.map(self.register_user, users))
+        results = {user['email']: status for user, status in zip(users, statuses)}
+
+        seeded = [email for email, status in results.items() if status != self.FAILED]
+        if self.db_helper:
+            self.db_helper.mark_test_users(seeded)
+
+        failed = len(users) - len(seeded)
+        logger.info(f"Seeded {len(seeded)} users ({failed} failed)")
+        return results
+
+    def seed_content(self, email: str, folders: Optional[List[Dict[str, Any]]] = None,
+                    files: Optional[List[Dict[str, Any]]] = None) -> Dict[str, int]:
+        """
+        Bulk insert folders and files for an already seeded user
+
+        :param email: Email of the owning user
+        :param folders: Folder documents to insert
+        :param files: File documents to insert
+        :returns: Dict with the number of inserted folders and files
+        """
+        if not self.db_helper:
+            raise RuntimeError("A DatabaseHelper is required to seed files and folders")
+        return self.db_helper.insert_user_content(email, folders=folders, files=files)
+
+    def close(self) -> None:
+        """Close the pooled HTTP client, unless it was handed in"""
+        if self._owns_client:
+            self.client.close()
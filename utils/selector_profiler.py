@@ -0,0 +1,146 @@
+"""
+Module for profiling the registered page element selectors against the
+live app. Measures how long each selector takes to resolve and how many
+elements it matches, and flags slow, ambiguous, positional and union
+selectors together with the union branch that actually matched.
+"""
+
+import copy
+import json
+import logging
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from playwright.sync_api import Page, Locator, Error as PlaywrightError
+from configs.settings import config
+from pages.locators import Element, registry
+from utils.workers import worker_id
+
+logger = logging.getLogger(__name__)
+
+class SelectorProfiler:
+    """
+    Profiles element selectors on a page
+    """
+
+    def __init__(self, page: Page, samples: int = 5, slow_ms: Optional[float] = None):
+        self.page = page
+        self.samples = samples
+        self.slow_ms = config.selector_slow_ms if slow_ms is None else slow_ms
+        self.results: List[Dict[str, Any]] = []
+        self._baseline: Optional[float] = None
+
+    def _measure(self, locator: Locator) -> Tuple[float, int]:
+        """
+        Resolve a locator several times
+
+        :param locator: Locator to resolve
+        :returns: Median resolution time in ms and the match count
+        """
+        times = []
+        count = 0
+        for _ in range(self.samples):
+            start = time.perf_counter()
+            count = locator.count()
+            times.append((time.perf_counter() - start) * 1000)
+        return statistics.median(times), count
+
+    def baseline(self) -> float:
+        """
+        Get the round-trip cost of resolving a trivial selector, which is
+        subtracted so results show the cost of the selector itself
+
+        :returns: Median time in ms
+        """
+        if self._baseline is None:
+            self._baseline, _ = self._measure(self.page.locator(':root'))
+        return self._baseline
+
+    def profile(self, element: Element) -> Dict[str, Any]:
+        """
+        Profile a single element on the current page
+
+        :param element: Registered element
+        :returns: Dict with timings, match counts, branches and flags
+        """
+        median_ms, matches = self._measure(element.resolve(self.page))
+        result: Dict[str, Any] = {
+            'element': element.key,
+            'selector': str(element),
+            'median_ms': round(median_ms, 2),
+            'net_ms': round(max(median_ms - self.baseline(), 0.0), 2),
+            'matches': matches,
+            'flags': [],
+        }
+
+        # Positional picks hide how many candidates the selector really has
+        if element.nth is not None:
+            base = copy.copy(element)
+            base.nth = None
+            _, result['candidates'] = self._measure(base.resolve(self.page))
+            result['flags'].append('positional')
+
+        branches = element.branches()
+        if branches:
+            result['flags'].append('union')
+            result['branches'] = []
+            for branch in branches:
+                branch_ms, branch_matches = self._measure(branch.resolve(self.page))
+                result['branches'].append({'selector': str(branch), 'median_ms': round(branch_ms, 2),
+                                           'matches': branch_matches})
+            result['matched_branch'] = self._matched_branch(element, branches) if matches else None
+
+        if matches == 0:
+            result['flags'].append('unmatched')
+        elif max(matches, result.get('candidates', 0)) > 1:
+            result['flags'].append('ambiguous')
+        if result['net_ms'] > self.slow_ms:
+            result['flags'].append('slow')
+
+        self.results.append(result)
+        if result['flags']:
+            logger.info(f"{element.key}: {', '.join(result['flags'])} "
+                        f"({result['matches']} matches, {result['net_ms']} ms)")
+        return result
+
+    def profile_page(self, page_name: str, keys: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Profile the registered elements of a page
+
+        :param page_name: Page name in the registry, e.g. 'login'
+        :param keys: Only profile these element names, e.g. the ones visible
+        in the current state of the page
+        :returns: One result per element
+        """
+        elements = registry.pages[page_name].elements
+        return [self.profile(element) for key, element in elements.items() if keys is None or key in keys]
+
+    def _matched_branch(self, element: Element, branches: List[Element]) -> Optional[str]:
+        """Find the union branch that matches the element an action would use"""
+        try:
+            matched = element.resolve(self.page).first.evaluate(
+                "(el, selectors) => selectors.map(s => el.matches(s))",
+                [branch.selector for branch in branches]
+            )
+        except PlaywrightError:
+            return None
+        return next((str(branch) for branch, hit in zip(branches, matched) if hit), None)
+
+    def write_report(self, name: str, directory: Optional[Path] = None) -> Path:
+        """
+        Write the profiled results to a JSON report
+
+        :param name: Report name, e.g. the page or flow that was profiled
+        :param directory: Output directory, defaults to reports/selectors
+        :returns: Path of the written report
+        """
+        directory = Path(directory or config.reports_dir / 'selectors')
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{name}_{worker_id()}.json"
+        path.write_text(json.dumps({
+            'baseline_ms': round(self.baseline(), 2),
+            'slow_ms': self.slow_ms,
+            'selectors': self.results,
+        }, indent=2))
+        return path
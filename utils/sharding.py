@@ -0,0 +1,174 @@
+"""
+Module for splitting the suite into shards of roughly equal wall time for
+separate CI machines. Tests are bin-packed by their recorded durations,
+keeping each module on one shard unless splitting it balances better than
+paying for its module-scoped setup again on another shard.
+"""
+
+import heapq
+import json
+import logging
+import math
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from configs.settings import config
+from utils.test_history import TestHistory, is_skipped
+
+logger = logging.getLogger(__name__)
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse a shard selector such as '2/4'
+
+    :param value: Shard index and count, the index starting at 1
+    :returns: Tuple of index and count
+    """
+    match = re.fullmatch(r'\s*(\d+)\s*/\s*(\d+)\s*', value)
+    if not match:
+        raise ValueError(f"Invalid shard: {value}, expected i/N")
+    index, count = int(match.group(1)), int(match.group(2))
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard: {value}, index must be between 1 and {count}")
+    return index, count
+
+class Shard:
+    """
+    The tests assigned to one shard and their expected run time
+    """
+
+    def __init__(self, index: int):
+        self.index = index
+        self.items: List = []
+        self.units: List[str] = []
+        self.expected = 0.0
+
+    def add(self, unit: str, items: List, cost: float) -> None:
+        self.units.append(unit)
+        self.items.extend(items)
+        self.expected += cost
+
+class ShardPlanner:
+    """
+    Bin-packs tests into shards with the longest-processing-time-first rule
+    """
+
+    def __init__(self, history: TestHistory, module_overhead: Optional[float] = None):
+        self.history = history
+        self.module_overhead = config.shard_module_overhead if module_overhead is None else module_overhead
+        self.default = history.default_duration()
+
+    def cost(self, item) -> float:
+        """Get the expected duration of a test"""
+        if is_skipped(item):
+            return 0.0
+        duration = self.history.duration(item.nodeid)
+        return self.default if duration is None else duration
+
+    def units(self, items: List, count: int) -> List[Tuple[str, List, float]]:
+        """
+        Group tests into the units that are packed into shards. A module is
+        one unit unless it alone exceeds a shard's fair share, in which case
+        it is split into just enough parts, each paying the module setup again
+
+        :param items: Collected pytest items
+        :param count: Number of shards
+        :returns: List of unit name, items and expected cost
+        """
+        modules: Dict[str, List] = {}
+        for item in items:
+            modules.setdefault(item.nodeid.split('::')[0], []).append(item)
+
+        total = sum(map(self.cost, items)) + self.module_overhead * len(modules)
+        target = total / count
+
+        units = []
+        for module, module_items in modules.items():
+            cost = sum(map(self.cost, module_items)) + self.module_overhead
+            parts = min(math.ceil(cost / target) if target else 1, len(module_items))
+            if parts <= 1:
+                units.append((module, module_items, cost))
+                continue
+
+            # Split the module with the same rule used for shards
+            bins = [(0.0, i, []) for i in range(parts)]
+            for item in sorted(module_items, key=self.cost, reverse=True):
+                load, i, bin_items = heapq.heappop(bins)
+                bin_items.append(item)
+                heapq.heappush(bins, (load + self.cost(item), i, bin_items))
+            for load, i, bin_items in sorted(bins, key=lambda b: b[1]):
+                units.append((f"{module}[{i + 1}/{parts}]", bin_items, load + self.module_overhead))
+        return units
+
+    def plan(self, items: List, count: int) -> List[Shard]:
+        """
+        Assign every test to a shard
+
+        :param items: Collected pytest items
+        :param count: Number of shards
+        :returns: Shards, each keeping its tests in collection order
+        """
+        shards = [Shard(i + 1) for i in range(count)]
+        heap = [(0.0, i) for i in range(count)]
+        for name, unit_items, cost in sorted(self.units(items, count), key=lambda u: (-u[2], u[0])):
+            _, i = heapq.heappop(heap)
+            shards[i].add(name, unit_items, cost)
+            heapq.heappush(heap, (shards[i].expected, i))
+
+        order = {item.nodeid: position for position, item in enumerate(items)}
+        for shard in shards:
+            shard.items.sort(key=lambda item: order[item.nodeid])
+        return shards
+
+def manifest_path(index: int, count: int, directory: Optional[Path] = None) -> Path:
+    """Get the timing manifest path of a shard"""
+    directory = Path(directory or config.reports_dir / 'shards')
+    return directory / f"shard_{index}_of_{count}.json"
+
+def write_manifest(shard: Shard, shards: List[Shard], planner: ShardPlanner,
+                  directory: Optional[Path] = None) -> Path:
+    """
+    Write the planned timings of a shard next to those of the other shards
+
+    :param shard: Shard run by this machine
+    :param shards: All shards of the plan
+    :param planner: Planner that made the plan
+    :param directory: Output directory, defaults to reports/shards
+    :returns: Path of the written manifest
+    """
+    path = manifest_path(shard.index, len(shards), directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    expected = [s.expected for s in shards]
+    manifest: Dict[str, Any] = {
+        'shard': shard.index,
+        'shards': len(shards),
+        'expected_seconds': round(shard.expected, 2),
+        'all_expected_seconds': [round(e, 2) for e in expected],
+        'imbalance': round(max(expected) / (sum(expected) / len(expected)), 3) if sum(expected) else 1.0,
+        'module_overhead': planner.module_overhead,
+        'units': shard.units,
+        'tests': [{'nodeid': item.nodeid, 'expected_seconds': round(planner.cost(item), 2)}
+                  for item in shard.items],
+    }
+    path.write_text(json.dumps(manifest, indent=2))
+    logger.info(f"Shard {shard.index}/{len(shards)}: {len(shard.items)} tests, "
+                f"expected {shard.expected:.0f}s (all shards: {', '.join(f'{e:.0f}s' for e in expected)})")
+    return path
+
+def record_actuals(path: Path, durations: Dict[str, float], wall_seconds: float) -> None:
+    """
+    Add the measured durations of this run to a shard manifest
+
+    :param path: Manifest written when the shard was planned
+    :param durations: Measured seconds per test node id
+    :param wall_seconds: Wall time of the whole session
+    """
+    if not path.exists():
+        return
+    manifest = json.loads(path.read_text())
+    for test in manifest['tests']:
+        if test['nodeid'] in durations:
+            test['actual_seconds'] = round(durations[test['nodeid']], 2)
+    manifest['actual_seconds'] = round(sum(durations.get(t['nodeid'], 0.0) for t in manifest['tests']), 2)
+    manifest['wall_seconds'] = round(wall_seconds, 2)
+    path.write_text(json.dumps(manifest, indent=2))
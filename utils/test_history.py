@@ -0,0 +1,200 @@
+"""
+Module for the local history of test durations and outcomes. The history
+is used to run recently failed, flaky and cheap smoke tests first and to
+pick the most valuable subset of tests that fits a time budget.
+"""
+
+import json
+import logging
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from configs.settings import config
+
+logger = logging.getLogger(__name__)
+
+# Duration assumed for tests that have never run and no history to go by
+DEFAULT_DURATION = 10.0
+
+# Run order of marker tiers; tests without a tier marker sit between
+MARKER_TIERS = {'smoke': 0, 'regression': 2, 'benchmark': 3}
+DEFAULT_TIER = 1
+
+class TestHistory:
+    """
+    Recent durations and outcomes of every test, stored as JSON
+    """
+
+    __test__ = False
+
+    def __init__(self, path: Optional[Path] = None, window: int = 10):
+        self.path = Path(path or config.test_history_path)
+        self.window = window
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+        # Durations and outcomes of the test phases seen so far this run
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # Durations measured in this run
+        self.session_durations: Dict[str, float] = {}
+
+    def record(self, nodeid: str, duration: float, outcome: str) -> None:
+        """
+        Add a test run to the history
+
+        :param nodeid: Test node id
+        :param duration: Seconds spent in setup, call and teardown
+        :param outcome: 'passed' or 'failed'
+        """
+        entry = self.entries.setdefault(nodeid, {'durations': [], 'outcomes': []})
+        entry['durations'] = (entry['durations'] + [round(duration, 3)])[-self.window:]
+        entry['outcomes'] = (entry['outcomes'] + [outcome])[-self.window:]
+        entry['last_run'] = time.time()
+        self.session_durations[nodeid] = duration
+
+    def add_report(self, report) -> None:
+        """
+        Accumulate the report of one test phase, recording the test after teardown.
+        Skipped tests are not recorded so they do not dilute the history
+
+        :param report: pytest TestReport
+        """
+        pending = self._pending.setdefault(report.nodeid, {'duration': 0.0, 'outcome': 'passed'})
+        pending['duration'] += report.duration
+        if report.failed:
+            pending['outcome'] = 'failed'
+        elif report.skipped:
+            pending['outcome'] = 'skipped'
+
+        if report.when == 'teardown':
+            self._pending.pop(report.nodeid)
+            if pending['outcome'] != 'skipped':
+                self.record(report.nodeid, pending['duration'], pending['outcome'])
+
+    def duration(self, nodeid: str) -> Optional[float]:
+        """
+        Get the expected duration of a test
+
+        :param nodeid: Test node id
+        :returns: Median of the recent durations, or None if the test never ran
+        """
+        entry = self.entries.get(nodeid)
+        if not entry or not entry['durations']:
+            return None
+        return statistics.median(entry['durations'])
+
+    def default_duration(self) -> float:
+        """Get the duration assumed for tests without history"""
+        durations = [d for d in map(self.duration, self.entries) if d is not None]
+        return statistics.median(durations) if durations else DEFAULT_DURATION
+
+    def priority(self, nodeid: str) -> float:
+        """
+        Score how likely a test is to fail. A failure on the last run weighs
+        most, then flakiness (how often the outcome flipped), then the
+        overall failure rate. Tests that never ran get a moderate score
+
+        :param nodeid: Test node id
+        :returns: Score, higher runs first
+        """
+        entry = self.entries.get(nodeid)
+        if not entry or not entry['outcomes']:
+            return 1.0
+
+        outcomes = entry['outcomes']
+        failure_rate = outcomes.count('failed') / len(outcomes)
+        flips = sum(a != b for a, b in zip(outcomes, outcomes[1:]))
+        flakiness = flips / (len(outcomes) - 1) if len(outcomes) > 1 else 0.0
+        last_failed = 1.0 if outcomes[-1] == 'failed' else 0.0
+        return 3 * last_failed + 2 * flakiness + failure_rate
+
+    def save(self) -> None:
+        """Write the history, replacing the file atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.entries, indent=1))
+        os.replace(tmp_path, self.path)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text())
+        except ValueError:
+            logger.warning(f"Ignoring corrupt test history: {self.path}")
+            return {}
+
+def marker_tier(item) -> int:
+    """
+    Get the run tier of a test from its markers, smoke tests first
+
+    :param item: pytest Item
+    :returns: Tier, lower runs first
+    """
+    tiers = [tier for name, tier in MARKER_TIERS.items() if item.get_closest_marker(name)]
+    return min(tiers) if tiers else DEFAULT_TIER
+
+def is_skipped(item) -> bool:
+    """Check whether a test is marked to be skipped and costs nothing to run"""
+    return item.get_closest_marker('skip') is not None
+
+def prioritize(items: List, history: TestHistory) -> List:
+    """
+    Order tests so the likeliest failures run first. Tests stay grouped by
+    module so module-scoped fixtures such as setup_test_users still run once
+
+    :param items: Collected pytest items
+    :param history: Test history
+    :returns: Reordered items
+    """
+    default = history.default_duration()
+
+    def item_key(item) -> Tuple:
+        duration = history.duration(item.nodeid)
+        return (is_skipped(item), -history.priority(item.nodeid), marker_tier(item),
+                default if duration is None else duration)
+
+    modules: Dict[str, List] = {}
+    for item in items:
+        modules.setdefault(item.nodeid.split('::')[0], []).append(item)
+
+    groups = [sorted(group, key=item_key) for group in modules.values()]
+    groups.sort(key=lambda group: item_key(group[0])[:3] + (
+        sum(item_key(item)[3] for item in group if not is_skipped(item)),))
+    return [item for group in groups for item in group]
+
+def select_within_budget(items: List, history: TestHistory, budget: float) -> Tuple[List, List]:
+    """
+    Pick the most valuable tests that fit a time budget. Value is the
+    failure priority plus a bonus for smoke tests, and tests are taken
+    greedily by value per second of expected duration
+
+    :param items: Collected pytest items, already ordered
+    :param history: Test history
+    :param budget: Time budget in seconds
+    :returns: Selected items in their original order, and deselected items
+    """
+    default = history.default_duration()
+
+    def cost(item) -> float:
+        if is_skipped(item):
+            return 0.0
+        duration = history.duration(item.nodeid)
+        return default if duration is None else max(duration, 0.01)
+
+    def value(item) -> float:
+        return 1.0 + history.priority(item.nodeid) + (1.0 if marker_tier(item) == 0 else 0.0)
+
+    chosen = set()
+    spent = 0.0
+    for item in sorted(items, key=lambda item: value(item) / cost(item) if cost(item) else float('inf'),
+                        reverse=True):
+        if spent + cost(item) <= budget:
+            chosen.add(item.nodeid)
+            spent += cost(item)
+
+    selected = [item for item in items if item.nodeid in chosen]
+    deselected = [item for item in items if item.nodeid not in chosen]
+    logger.info(f"Time budget {budget:.0f}s: selected {len(selected)} tests "
+                f"expected to take {spent:.0f}s, deselected {len(deselected)}")
+    return selected, deselected
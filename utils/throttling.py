@@ -0,0 +1,151 @@
+"""
+Module for emulating slow networks and CPUs in the browser. Named profiles
+are applied over CDP to each page before it is used, and the active profile is
+exposed so timing, benchmark and performance results can be tagged with
+the conditions they were measured under.
+"""
+
+import logging
+from typing import Dict, Optional
+from playwright.sync_api import Page, Error as PlaywrightError
+
+logger = logging.getLogger(__name__)
+
+class ThrottleProfile:
+    """
+    Network and CPU conditions of one throttling profile
+    """
+
+    def __init__(self, name: str, latency_ms: float = 0.0, download_kbps: float = 0.0,
+                 upload_kbps: float = 0.0, cpu_rate: float = 1.0):
+        """
+        :param name: Profile name
+        :param latency_ms: Added round trip time in milliseconds
+        :param download_kbps: Download throughput in kilobits per second, 0 for unlimited
+        :param upload_kbps: Upload throughput in kilobits per second, 0 for unlimited
+        :param cpu_rate: CPU slowdown factor, 1 for none
+        """
+        self.name = name
+        self.latency_ms = latency_ms
+        self.download_kbps = download_kbps
+        self.upload_kbps = upload_kbps
+        self.cpu_rate = cpu_rate
+
+    @property
+    def throttles_network(self) -> bool:
+        return bool(self.latency_ms or self.download_kbps or self.upload_kbps)
+
+    @property
+    def throttles_cpu(self) -> bool:
+        return self.cpu_rate > 1
+
+    def network_conditions(self) -> Dict[str, float]:
+        """
+        Get the parameters of Network.emulateNetworkConditions, whose
+        throughputs are in bytes per second and -1 when unlimited
+        """
+        return {
+            'offline': False,
+            'latency': self.latency_ms,
+            'downloadThroughput': self.download_kbps * 1000 / 8 if self.download_kbps else -1,
+            'uploadThroughput': self.upload_kbps * 1000 / 8 if self.upload_kbps else -1
+        }
+
+    def combine(self, other: 'ThrottleProfile') -> 'ThrottleProfile':
+        """Combine with another profile, taking the stricter of each condition"""
+        def slowest(a: float, b: float) -> float:
+            return min(value for value in (a, b) if value) if a or b else 0.0
+
+        return ThrottleProfile(f"{self.name}+{other.name}",
+                               max(self.latency_ms, other.latency_ms),
+                               slowest(self.download_kbps, other.download_kbps),
+                               slowest(self.upload_kbps, other.upload_kbps),
+                               max(self.cpu_rate, other.cpu_rate))
+
+    def __str__(self) -> str:
+        return self.name
+
+NO_THROTTLE = ThrottleProfile('none')
+
+# Network presets follow Chrome DevTools and Lighthouse
+PROFILES: Dict[str, ThrottleProfile] = {profile.name: profile for profile in [
+    NO_THROTTLE,
+    ThrottleProfile('slow-3g', latency_ms=2000, download_kbps=400, upload_kbps=400),
+    ThrottleProfile('3g', latency_ms=562.5, download_kbps=1440, upload_kbps=675),
+    ThrottleProfile('slow-4g', latency_ms=150, download_kbps=1600, upload_kbps=750),
+    ThrottleProfile('4g', latency_ms=60, download_kbps=9000, upload_kbps=1500),
+    ThrottleProfile('cpu-2x', cpu_rate=2),
+    ThrottleProfile('cpu-4x', cpu_rate=4),
+    ThrottleProfile('cpu-6x', cpu_rate=6),
+]}
+
+def resolve_profile(spec: Optional[str]) -> ThrottleProfile:
+    """
+    Resolve a profile name, or several joined with '+', e.g. 'slow-4g+cpu-4x'
+
+    :param spec: Profile name(s), empty for no throttling
+    :returns: The resolved profile
+    """
+    names = [name.strip().lower() for name in (spec or '').split('+') if name.strip()]
+    unknown = [name for name in names if name not in PROFILES]
+    if unknown:
+        raise ValueError(f"Unknown throttle profile: {', '.join(unknown)}, "
+                         f"expected one of {', '.join(PROFILES)}")
+    if not names:
+        return NO_THROTTLE
+
+    profile = PROFILES[names[0]]
+    for name in names[1:]:
+        profile = profile.combine(PROFILES[name])
+    return profile
+
+# Profile of the running test, read when tagging results
+_active: ThrottleProfile = NO_THROTTLE
+
+def active_profile() -> ThrottleProfile:
+    """Get the throttling profile of the running test"""
+    return _active
+
+def set_active_profile(profile: ThrottleProfile) -> None:
+    """Set the throttling profile of the running test"""
+    global _active
+    _active = profile
+
+class Throttler:
+    """
+    Applies a throttling profile to pages. CDP sessions are per page, so
+    each page is throttled on its own, and popups as they open.
+    Chromium only; elsewhere pages are left unthrottled with a warning
+    """
+
+    def __init__(self, profile: ThrottleProfile):
+        self.profile = profile
+        self.unsupported = False
+
+    def apply(self, page: Page) -> bool:
+        """
+        Apply the profile to a page before it is used, and to its popups
+
+        :param page: Page to throttle
+        :returns: False if the profile could not be applied for lack of CDP
+        """
+        if self.profile is NO_THROTTLE:
+            return True
+        if self.unsupported:
+            return False
+        try:
+            cdp = page.context.new_cdp_session(page)
+        except PlaywrightError:
+            logger.warning(f"Throttling needs CDP, running '{self.profile}' tests unthrottled")
+            self.unsupported = True
+            return False
+
+        if self.profile.throttles_network:
+            cdp.send('Network.enable')
+            cdp.send('Network.emulateNetworkConditions', self.profile.network_conditions())
+        if self.profile.throttles_cpu:
+            cdp.send('Emulation.setCPUThrottlingRate', {'rate': self.profile.cpu_rate})
+        # Popups open from an event handler, so they may load a little unthrottled
+        page.on("popup", self.apply)
+        logger.debug(f"Applied throttle profile '{self.profile}' to {page.url}")
+        return True
@@ -0,0 +1,193 @@
+"""
+Module for timing page object actions.
+Records wall time per action tagged with test id, page class, method and
+selector, and aggregates the samples into per-action percentiles written
+to a JSON report. When ACTION_TIMING is off the decorator returns the
+original function, so disabled timing costs nothing.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import math
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable
+from configs.settings import config
+from utils.workers import worker_id
+from utils.throttling import active_profile
+
+logger = logging.getLogger(__name__)
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of values
+
+    :param values: Values to take the percentile of
+    :param pct: Percentile between 0 and 100
+    :returns: The percentile, or 0.0 for an empty list
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """
+    Summarize a list of durations in seconds
+
+    :param values: Durations in seconds
+    :returns: Dict with count, p50, p95, max and total in milliseconds
+    """
+    return {
+        'count': len(values),
+        'p50_ms': round(percentile(values, 50) * 1000, 3),
+        'p95_ms': round(percentile(values, 95) * 1000, 3),
+        'max_ms': round(max(values, default=0.0) * 1000, 3),
+        'total_ms': round(sum(values) * 1000, 3)
+    }
+
+class ActionTimer:
+    """
+    Collects timing samples for page object actions
+    """
+
+    def __init__(self):
+        self.current_test: Optional[str] = None
+        self.samples: List[Dict[str, Any]] = []
+        self.wait_savings: Dict[str, List[float]] = defaultdict(list)
+
+    def record(self, page: str, method: str, selector: Optional[str],
+              elapsed: float, ok: bool = True) -> None:
+        """
+        Record a single action sample
+
+        :param page: Page object class name
+        :param method: Page object method name
+        :param selector: Selector or url the action targeted, if any
+        :param elapsed: Wall time in seconds
+        :param ok: Whether the action completed without raising
+        """
+        self.samples.append({
+            'test': self.current_test,
+            'page': page,
+            'method': method,
+            'selector': selector,
+            'elapsed': elapsed,
+            'ok': ok,
+            'throttle': active_profile().name
+        })
+
+    def record_wait_saving(self, strategy: str, saved: float) -> None:
+        """
+        Record how much longer networkidle would have waited than a strategy
+
+        :param strategy: Page class and strategy name
+        :param saved: Extra seconds a networkidle wait would have needed
+        """
+        self.wait_savings[strategy].append(saved)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Aggregate the recorded samples. Actions timed under a throttling
+        profile are aggregated apart, e.g. 'LoginPage.login [slow-4g]'
+
+        :returns: Dict with per-action and per-selector histograms
+        """
+        by_action = defaultdict(list)
+        by_selector = defaultdict(list)
+        errors = defaultdict(int)
+        for sample in self.samples:
+            action = f"{sample['page']}.{sample['method']}"
+            if sample['throttle'] != 'none':
+                action += f" [{sample['throttle']}]"
+            by_action[action].append(sample['elapsed'])
+            if sample['selector']:
+                by_selector[f"{action} {sample['selector']}"].append(sample['elapsed'])
+            if not sample['ok']:
+                errors[action] += 1
+
+        return {
+            'worker': worker_id(),
+            'sample_count': len(self.samples),
+            'actions': {
+                action: {**summarize(values), 'errors': errors[action]}
+                for action, values in sorted(by_action.items())
+            },
+            'selectors': {key: summarize(values) for key, values in sorted(by_selector.items())},
+            'wait_savings': {key: summarize(values) for key, values in sorted(self.wait_savings.items())},
+            'samples': [
+                {key: value for key, value in sample.items() if key != 'elapsed'}
+                | {'elapsed_ms': round(sample['elapsed'] * 1000, 3)}
+                for sample in self.samples
+            ]
+        }
+
+    def write_report(self, path: Optional[Path] = None) -> Path:
+        """
+        Write the aggregated report as JSON
+
+        :param path: Output file, defaults to reports/timings/actions_<worker>.json
+        :returns: Path of the written report
+        """
+        path = Path(path or config.reports_dir / 'timings' / f"actions_{worker_id()}.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2))
+        logger.info(f"Wrote action timing report to {path}")
+        return path
+
+timer = ActionTimer()
+
+def timed_action(func: Callable) -> Callable:
+    """
+    Decorator that records the wall time of a page object method.
+    A selector or url argument is recorded as the action's selector
+
+    :param func: Page object method to time
+    :returns: The wrapped method, or func unchanged when timing is disabled
+    """
+    if not config.action_timing_enabled:
+        return func
+
+    # Position of the selector/url argument, not counting self
+    params = list(inspect.signature(func).parameters)[1:]
+    target = next((name for name in ('selector', 'url') if name in params), None)
+    position = params.index(target) if target else None
+
+    def selector_of(args, kwargs) -> Optional[str]:
+        if not target:
+            return None
+        value = args[position] if len(args) > position else kwargs.get(target)
+        return None if value is None else str(value)
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            ok = False
+            try:
+                result = await func(self, *args, **kwargs)
+                ok = True
+                return result
+            finally:
+                timer.record(type(self).__name__, func.__name__, selector_of(args, kwargs),
+                            time.perf_counter() - start, ok)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = func(self, *args, **kwargs)
+            ok = True
+            return result
+        finally:
+            timer.record(type(self).__name__, func.__name__, selector_of(args, kwargs),
+                        time.perf_counter() - start, ok)
+
+    return wrapper
@@ -0,0 +1,72 @@
+"""
+Module with helpers for running the suite across parallel pytest-xdist
+workers. Gives every worker its own user namespace and, optionally, its
+own MongoDB database so concurrent workers never touch each other's data.
+"""
+
+import os
+from typing import Optional
+from urllib.parse import urlparse, urlunparse
+
+DEFAULT_WORKER = 'master'
+
+def worker_id() -> str:
+    """
+    Get the id of the current xdist worker
+
+    :returns: Worker id such as 'gw0', or 'master' when not running in parallel
+    """
+    return os.getenv('PYTEST_XDIST_WORKER', DEFAULT_WORKER)
+
+def is_parallel() -> bool:
+    """Check whether the current process is an xdist worker"""
+    return worker_id() != DEFAULT_WORKER
+
+def worker_index() -> int:
+    """
+    Get the numeric index of the current worker
+
+    :returns: 0 for gw0 (and for serial runs), 1 for gw1, and so on
+    """
+    worker = worker_id()
+    return int(worker[2:]) if worker.startswith('gw') and worker[2:].isdigit() else 0
+
+def worker_count() -> int:
+    """Get the number of workers in the current run"""
+    return int(os.getenv('PYTEST_XDIST_WORKER_COUNT', '1'))
+
+def namespace_prefix(worker: Optional[str] = None) -> str:
+    """
+    Get the email prefix reserved for a worker
+
+    :param worker: Worker id, defaults to the current worker
+    :returns: Prefix such as 'gw0.', or an empty string for serial runs
+    """
+    worker = worker or worker_id()
+    return '' if worker == DEFAULT_WORKER else f"{worker}."
+
+def namespace_email(email: str, worker: Optional[str] = None) -> str:
+    """
+    Move an email into a worker's namespace
+
+    :param email: Email address to namespace
+    :param worker: Worker id, defaults to the current worker
+    :returns: Email with the worker prefix added to its local part
+    """
+    return namespace_prefix(worker) + email
+
+def worker_database_url(url: str, worker: Optional[str] = None) -> str:
+    """
+    Derive a per-worker MongoDB url by suffixing the database name
+
+    :param url: MongoDB connection string
+    :param worker: Worker id, defaults to the current worker
+    :returns: Connection string pointing at e.g. mydrive_test_gw0
+    """
+    worker = worker or worker_id()
+    if worker == DEFAULT_WORKER:
+        return url
+
+    parsed = urlparse(url)
+    db_name = parsed.path.lstrip('/') or 'mydrive_test'
+    return urlunparse(parsed._replace(path=f"/{db_name}_{worker}"))